@@ -7,8 +7,7 @@ __version__ = "1.0.0"
 __author__ = "Nuvyn.bldr Development Team"
 
 # Make main components easily importable
-from executor.config import ConfigManager, JobConfig, JobType, JobStatus
-from executor.job_manager import JobManager
+from executor.config import ConfigManager, JobConfig, JobType, JobStatus, get_config
 from executor.logger import get_logger, initialize_logger
 
 __all__ = [
@@ -16,8 +15,17 @@ __all__ = [
     "JobConfig", 
     "JobType",
     "JobStatus",
+    "get_config",
     "JobManager",
     "get_logger",
     "initialize_logger",
 ]
 
+
+
+def __getattr__(name):
+    # JobManager pulls in asyncio and the job pipeline; import it only when asked for
+    if name == "JobManager":
+        from executor.job_manager import JobManager
+        return JobManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,19 +6,14 @@ Provides curl-friendly endpoints for job execution and management
 
 import asyncio
 import json
-import sys
-import os
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
-# Add executor directory to path
-sys.path.insert(0, os.path.dirname(__file__))
-
 from aiohttp import web, web_request
 from aiohttp.web import Request, Response, json_response
 import aiohttp_cors
 
-from executor.config import ConfigManager, JobType
+from executor.config import JobConfig, JobStatus, JobType, get_config
 from executor.job_manager import JobManager
 from executor.logger import initialize_logger, get_logger
 
@@ -31,8 +26,8 @@ class ExecutorAPIServer:
     def __init__(self, host: str = "0.0.0.0", port: int = 8080):
         self.host = host
         self.port = port
-        self.config_manager = ConfigManager()
-        self.job_manager = JobManager(self.config_manager)
+        self.config_manager = get_config()
+        self.job_manager = JobManager.get_default(self.config_manager)
         self.app = web.Application()
         self._setup_routes()
         self._setup_cors()
@@ -190,10 +185,11 @@ class ExecutorAPIServer:
             # Execute the job
             result = await self.job_manager.execute_job(job_id)
             
+            status = result.status
             return json_response({
                 "job_id": job_id,
-                "status": result.status.value,
-                "success": result.status.value == "completed",
+                "status": status.value,
+                "success": status is JobStatus.COMPLETED,
                 "execution_time": result.execution_time_seconds,
                 "error": result.error_message,
                 "result_data": result.result_data,
@@ -337,7 +333,7 @@ class ExecutorAPIServer:
                 }, status=400)
             
             # Import here to avoid circular imports
-            from datasource.factory import DataSourceFactory
+            from executor.datasource.factory import DataSourceFactory
             
             # Test connection
             result = DataSourceFactory.test_connection(source_type, credentials)
@@ -354,7 +350,7 @@ class ExecutorAPIServer:
     async def get_data_source_types(self, request: Request) -> Response:
         """Get supported data source types"""
         try:
-            from datasource.factory import DataSourceFactory
+            from executor.datasource.factory import DataSourceFactory
             
             types = DataSourceFactory.get_supported_types()
             type_info = {}
@@ -377,12 +373,11 @@ class ExecutorAPIServer:
     async def validate_schema(self, request: Request) -> Response:
         """Validate executor metadata schema"""
         try:
-            from schema.validator import SchemaValidator
+            from executor.schema.validator import SchemaValidator
             
             validator = SchemaValidator(self.config_manager)
             
             # Create a dummy job config for validation
-            from config import JobConfig
             job_config = JobConfig(
                 job_id="schema_validation",
                 job_type=JobType.SCHEMA_VALIDATION,
@@ -390,7 +385,8 @@ class ExecutorAPIServer:
                 tenant_id=request.query.get('tenant_id', 'default')
             )
             
-            result = await validator.validate_schema(job_config)
+            verbose = request.query.get('verbose', 'false').lower() == 'true'
+            result = await validator.validate_schema(job_config, verbose=verbose)
             
             return json_response(result)
             
@@ -404,12 +400,11 @@ class ExecutorAPIServer:
     async def create_schema(self, request: Request) -> Response:
         """Create executor metadata schema"""
         try:
-            from schema.validator import SchemaValidator
+            from executor.schema.validator import SchemaValidator
             
             validator = SchemaValidator(self.config_manager)
             
             # Create a dummy job config for schema creation
-            from config import JobConfig
             job_config = JobConfig(
                 job_id="schema_creation",
                 job_type=JobType.SCHEMA_VALIDATION,
@@ -5,6 +5,8 @@ Handles job configuration, environment variables, and settings
 
 import os
 import json
+import math
+import functools
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict, field
@@ -70,17 +72,37 @@ class JobConfig:
         return cls(**data)
 
 
+def _seconds_env(name: str, default: float) -> float:
+    """Non-negative seconds from env var name, or default (with a warning) when it is not a number"""
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if not math.isfinite(value) or value < 0:
+        from executor.logger import get_logger
+        get_logger(__name__).warning(f"⚠️ Invalid {name}={raw!r}, using {default:g}")
+        return default
+    return value
+
+
 @dataclass
 class ExecutorConfig:
     """Global executor configuration"""
     # Database/Storage
     databricks_workspace_url: str = ""
     schema_name: str = "_executor_metadata"
+    # Seconds a fetched schema structure is reused by validation (0 disables, negative never expires)
+    schema_cache_ttl_seconds: float = 60.0
     
     # API Configuration
     api_base_url: str = ""
     api_timeout: int = 30
     api_retry_attempts: int = 3
+    # gzip request bodies of 1 KB or more (the backend must accept Content-Encoding: gzip)
+    api_compression: bool = False
     
     # Data Source Configuration
     max_file_size_mb: int = 100
@@ -107,9 +129,11 @@ class ExecutorConfig:
         return cls(
             databricks_workspace_url=os.getenv("DATABRICKS_WORKSPACE_URL", ""),
             schema_name=os.getenv("EXECUTOR_SCHEMA_NAME", "_executor_metadata"),
+            schema_cache_ttl_seconds=_seconds_env("EXECUTOR_SCHEMA_CACHE_TTL_SECONDS", 60.0),
             api_base_url=os.getenv("NUVYN_API_ENDPOINT", ""),
             api_timeout=int(os.getenv("NUVYN_API_TIMEOUT", "30")),
             api_retry_attempts=int(os.getenv("NUVYN_API_RETRY_ATTEMPTS", "3")),
+            api_compression=os.getenv("NUVYN_API_COMPRESSION", "false").lower() == "true",
             max_file_size_mb=int(os.getenv("EXECUTOR_MAX_FILE_SIZE_MB", "100")),
             max_files_per_job=int(os.getenv("EXECUTOR_MAX_FILES_PER_JOB", "1000")),
             sample_size_rows=int(os.getenv("EXECUTOR_SAMPLE_SIZE_ROWS", "10000")),
@@ -227,3 +251,9 @@ class ConfigManager:
             credentials['api_key'] = '***MASKED***'
         
         return credentials
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> ConfigManager:
+    """Get the process-wide ConfigManager, created on first use"""
+    return ConfigManager()
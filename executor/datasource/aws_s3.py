@@ -3,7 +3,7 @@ AWS S3 data source connector
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
@@ -71,7 +71,10 @@ class AWSS3DataSource(DataSourceBase):
             self.s3_client = None
             logger.info("🔌 AWS S3 connection closed")
     
-    async def list_files(self, path: str) -> List[str]:
+    async def list_files(self,
+                         path: str,
+                         max_results: Optional[int] = None,
+                         recursive: bool = True) -> List[str]:
         """List files in the specified S3 path"""
         try:
             if not self.s3_client:
@@ -82,7 +85,11 @@ class AWSS3DataSource(DataSourceBase):
             
             # List objects
             paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=bucket_name, Prefix=key_prefix)
+            pagination_config = {'PageSize': max_results} if max_results else {}
+            # Delimited listing returns sub-prefixes as CommonPrefixes instead of walking them
+            delimiter = {'Delimiter': '/'} if not recursive else {}
+            pages = paginator.paginate(Bucket=bucket_name, Prefix=key_prefix,
+                                       PaginationConfig=pagination_config, **delimiter)
             
             files = []
             for page in pages:
@@ -90,6 +97,9 @@ class AWSS3DataSource(DataSourceBase):
                     for obj in page['Contents']:
                         if not obj['Key'].endswith('/'):  # Skip directories
                             files.append(obj['Key'])
+                if max_results is not None and len(files) >= max_results:
+                    files = files[:max_results]
+                    break
             
             logger.info(f"📁 Found {len(files)} files in S3 path: {path}")
             return files
@@ -149,6 +159,73 @@ class AWSS3DataSource(DataSourceBase):
             logger.error(f"❌ Error reading file sample from S3: {e}")
             return b''
     
+    async def get_file_version(self, file_path: str) -> Tuple[int, Optional[str]]:
+        """Get object size and ETag from one HEAD request"""
+        try:
+            if not self.s3_client:
+                await self.connect()
+            
+            bucket_name, key = self._parse_s3_path(file_path)
+            response = self.s3_client.head_object(Bucket=bucket_name, Key=key)
+            return response['ContentLength'], response.get('ETag')
+            
+        except ClientError as e:
+            logger.error(f"❌ AWS S3 error getting object metadata: {e}")
+            return 0, None
+        except Exception as e:
+            logger.error(f"❌ Error getting object metadata from S3: {e}")
+            return 0, None
+    
+    async def read_range(self, file_path: str, offset: int, length: int) -> bytes:
+        """Read length bytes starting at offset from S3 (ranged GET)"""
+        try:
+            if not self.s3_client:
+                await self.connect()
+            
+            bucket_name, key = self._parse_s3_path(file_path)
+            response = self.s3_client.get_object(
+                Bucket=bucket_name,
+                Key=key,
+                Range=f'bytes={offset}-{offset + length - 1}'
+            )
+            return response['Body'].read()
+            
+        except ClientError as e:
+            logger.error(f"❌ AWS S3 error reading byte range: {e}")
+            return b''
+        except Exception as e:
+            logger.error(f"❌ Error reading byte range from S3: {e}")
+            return b''
+    
+    async def get_sample_with_size(self, file_path: str, max_bytes: int = 1024*1024) -> Tuple[int, bytes]:
+        """Read the first max_bytes and the object size with one ranged GET"""
+        try:
+            if not self.s3_client:
+                await self.connect()
+            
+            bucket_name, key = self._parse_s3_path(file_path)
+            
+            response = self.s3_client.get_object(
+                Bucket=bucket_name,
+                Key=key,
+                Range=f'bytes=0-{max_bytes-1}'
+            )
+            sample_data = response['Body'].read()
+            
+            # Content-Range is "bytes 0-N/<total size>"
+            content_range = response.get('ContentRange')
+            size = int(content_range.rsplit('/', 1)[1]) if content_range else response['ContentLength']
+            
+            logger.debug(f"📖 Read {len(sample_data)} of {size} bytes from {key}")
+            return size, sample_data
+            
+        except ClientError as e:
+            logger.error(f"❌ AWS S3 error reading file sample: {e}")
+            return 0, b''
+        except Exception as e:
+            logger.error(f"❌ Error reading file sample from S3: {e}")
+            return 0, b''
+    
     async def test_connection(self) -> Dict[str, Any]:
         """Test the AWS S3 connection"""
         try:
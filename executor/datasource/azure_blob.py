@@ -3,7 +3,7 @@ Azure Blob Storage data source connector
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from azure.storage.blob import BlobServiceClient
 from azure.core.exceptions import AzureError
 
@@ -113,7 +113,10 @@ class AzureBlobDataSource(DataSourceBase):
             self.blob_service_client = None
             logger.info("🔌 Azure Blob Storage connection closed")
     
-    async def list_files(self, path: str) -> List[str]:
+    async def list_files(self,
+                         path: str,
+                         max_results: Optional[int] = None,
+                         recursive: bool = True) -> List[str]:
         """List files in the specified Azure Blob Storage path"""
         try:
             if not self.blob_service_client:
@@ -131,12 +134,21 @@ class AzureBlobDataSource(DataSourceBase):
             
             # List blobs
             container_client = self.blob_service_client.get_container_client(container_name)
-            blobs = container_client.list_blobs(name_starts_with=blob_prefix)
+            # A small page size stops the service from returning thousands of unused entries
+            if not recursive and (not blob_prefix or blob_prefix.endswith('/')):
+                # Delimited listing: only this "directory" level (sub-prefixes end with '/')
+                blobs = container_client.walk_blobs(name_starts_with=blob_prefix, delimiter='/',
+                                                    results_per_page=max_results)
+            else:
+                blobs = container_client.list_blobs(name_starts_with=blob_prefix,
+                                                    results_per_page=max_results)
             
             files = []
             for blob in blobs:
                 if not blob.name.endswith('/'):  # Skip directories
                     files.append(blob.name)
+                    if max_results is not None and len(files) >= max_results:
+                        break
             
             logger.info(f"📁 Found {len(files)} files in Azure Blob Storage path: {path}")
             return files
@@ -182,38 +194,82 @@ class AzureBlobDataSource(DataSourceBase):
             logger.error(f"❌ Error getting file size from Azure Blob Storage: {e}")
             return 0
     
+    def _get_blob_client(self, file_path: str):
+        """Blob client for a path, using the SAS URL directly when the path carries one"""
+        if '?' in file_path and 'sig=' in file_path:
+            from azure.storage.blob import BlobClient
+            return BlobClient.from_blob_url(file_path)
+        
+        container_name, blob_name = self._parse_blob_path(file_path)
+        return self.blob_service_client.get_blob_client(
+            container=container_name,
+            blob=blob_name
+        )
+    
     async def read_file_sample(self, file_path: str, max_bytes: int = 1024*1024) -> bytes:
         """Read a sample of the file from Azure Blob Storage"""
         try:
             if not self.blob_service_client:
                 await self.connect()
             
-            # If file_path contains SAS token, use it directly
-            if '?' in file_path and 'sig=' in file_path:
-                from azure.storage.blob import BlobClient
-                blob_client = BlobClient.from_blob_url(file_path)
-                download_stream = blob_client.download_blob(max_concurrency=1)
-                sample_data = download_stream.readall()[:max_bytes]
-                logger.debug(f"📖 Read {len(sample_data)} bytes using SAS URL")
-                return sample_data
-            
-            container_name, blob_name = self._parse_blob_path(file_path)
-            blob_client = self.blob_service_client.get_blob_client(
-                container=container_name,
-                blob=blob_name
-            )
-            
-            # Download only the first max_bytes
-            download_stream = blob_client.download_blob(max_concurrency=1)
-            sample_data = download_stream.readall()[:max_bytes]
+            # Download only the first max_bytes (ranged GET)
+            blob_client = self._get_blob_client(file_path)
+            download_stream = blob_client.download_blob(offset=0, length=max_bytes, max_concurrency=1)
+            sample_data = download_stream.readall()
             
-            logger.debug(f"📖 Read {len(sample_data)} bytes from {blob_name}")
+            logger.debug(f"📖 Read {len(sample_data)} bytes from {blob_client.blob_name}")
             return sample_data
             
         except Exception as e:
             logger.error(f"❌ Error reading file sample from Azure Blob Storage: {e}")
             return b''
     
+    async def get_file_version(self, file_path: str) -> Tuple[int, Optional[str]]:
+        """Get blob size and ETag from one properties request"""
+        try:
+            if not self.blob_service_client:
+                await self.connect()
+            
+            properties = self._get_blob_client(file_path).get_blob_properties()
+            return properties.size, properties.etag
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting blob properties from Azure Blob Storage: {e}")
+            return 0, None
+    
+    async def read_range(self, file_path: str, offset: int, length: int) -> bytes:
+        """Read length bytes starting at offset from Azure Blob Storage (ranged GET)"""
+        try:
+            if not self.blob_service_client:
+                await self.connect()
+            
+            blob_client = self._get_blob_client(file_path)
+            download_stream = blob_client.download_blob(offset=offset, length=length, max_concurrency=1)
+            return download_stream.readall()
+            
+        except Exception as e:
+            logger.error(f"❌ Error reading byte range from Azure Blob Storage: {e}")
+            return b''
+    
+    async def get_sample_with_size(self, file_path: str, max_bytes: int = 1024*1024) -> Tuple[int, bytes]:
+        """Read the first max_bytes and the blob size with one ranged GET"""
+        try:
+            if not self.blob_service_client:
+                await self.connect()
+            
+            blob_client = self._get_blob_client(file_path)
+            download_stream = blob_client.download_blob(offset=0, length=max_bytes, max_concurrency=1)
+            sample_data = download_stream.readall()
+            # Total blob size (from Content-Range), not the length of the range
+            size = download_stream.properties.size
+            
+            logger.debug(f"📖 Read {len(sample_data)} of {size} bytes from {blob_client.blob_name}")
+            return size, sample_data
+            
+        except Exception as e:
+            logger.error(f"❌ Error reading file sample from Azure Blob Storage: {e}")
+            return 0, b''
+    
     async def test_connection(self) -> Dict[str, Any]:
         """Test the Azure Blob Storage connection"""
         try:
@@ -2,8 +2,9 @@
 Base data source connector class
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import os
 
 
@@ -25,8 +26,12 @@ class DataSourceBase(ABC):
         pass
     
     @abstractmethod
-    async def list_files(self, path: str) -> List[str]:
-        """List files in the specified path"""
+    async def list_files(self,
+                         path: str,
+                         max_results: Optional[int] = None,
+                         recursive: bool = True) -> List[str]:
+        """List files in the specified path (stopping after max_results when given;
+        recursive=False lists only the immediate children of a directory-style prefix)"""
         pass
     
     @abstractmethod
@@ -39,6 +44,22 @@ class DataSourceBase(ABC):
         """Read a sample of the file (first max_bytes)"""
         pass
     
+    async def get_file_version(self, file_path: str) -> Tuple[int, Optional[str]]:
+        """Return (file size, version tag such as an ETag); None when the source has no version tag"""
+        return await self.get_file_size(file_path), None
+    
+    async def read_range(self, file_path: str, offset: int, length: int) -> bytes:
+        """Read length bytes starting at offset; connectors override this with a ranged request"""
+        data = await self.read_file_sample(file_path, max_bytes=offset + length)
+        return data[offset:offset + length]
+    
+    async def get_sample_with_size(self, file_path: str, max_bytes: int = 1024*1024) -> Tuple[int, bytes]:
+        """Return (file size, first max_bytes); connectors override this to use a single request"""
+        return await asyncio.gather(
+            self.get_file_size(file_path),
+            self.read_file_sample(file_path, max_bytes)
+        )
+    
     @abstractmethod
     async def test_connection(self) -> Dict[str, Any]:
         """Test the connection and return status"""
@@ -75,7 +75,10 @@ class DatabaseDataSource(DataSourceBase):
             self.engine = None
             logger.info("🔌 Database connection closed")
     
-    async def list_files(self, path: str) -> List[str]:
+    async def list_files(self,
+                         path: str,
+                         max_results: Optional[int] = None,
+                         recursive: bool = True) -> List[str]:
         """List tables in the database (database equivalent of files)"""
         try:
             if not self.engine:
@@ -86,7 +89,8 @@ class DatabaseDataSource(DataSourceBase):
             
             with self.engine.connect() as connection:
                 result = connection.execute(text(query))
-                tables = [row[0] for row in result.fetchall()]
+                rows = result.fetchmany(max_results) if max_results else result.fetchall()
+                tables = [row[0] for row in rows]
             
             logger.info(f"📁 Found {len(tables)} tables in database")
             return tables
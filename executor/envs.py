@@ -0,0 +1,90 @@
+"""
+Environment variables for Nuvyn Executor Script
+Each variable is parsed and type-coerced once, on first access
+"""
+
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:  # attributes resolved lazily by __getattr__ below
+    EXECUTOR_WRITE_TO_DB: bool = False
+    DATABRICKS_SERVER_HOSTNAME: str = ""
+    DATABRICKS_HTTP_PATH: str = ""
+    DATABRICKS_ACCESS_TOKEN: str = ""
+    DATABRICKS_JOB_RUN_ID: str = ""
+    NUVYN_JOB_PAYLOAD: Optional[str] = None
+    NUVYN_SOURCE_BATCH_SIZE: int = 8
+    EXECUTOR_LOG_LEVEL: str = "INFO"
+    EXECUTOR_LOG_FORMAT: str = "text"
+    NUVYN_FILE_METADATA_CACHE_DIR: Optional[str] = None
+    NUVYN_COPY_INTO_STAGING_DIR: Optional[str] = None
+
+
+def _int_env(name: str, default: int, minimum: int = 1) -> int:
+    """Integer value of env var name, or default (with a warning) when it is not an integer"""
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        from executor.logger import get_logger
+        get_logger(__name__).warning(f"⚠️ Invalid {name}={raw!r}, using {default}")
+        return default
+
+
+environment_variables: Dict[str, Callable[[], Any]] = {
+    # Log level (DEBUG, INFO, WARNING, ERROR)
+    "EXECUTOR_LOG_LEVEL":
+    lambda: os.environ.get("EXECUTOR_LOG_LEVEL", "INFO").upper(),
+
+    # Log record format, "text" or "json" (NUVYN_LOG_FORMAT is accepted as an older alias)
+    "EXECUTOR_LOG_FORMAT":
+    lambda: (os.environ.get("EXECUTOR_LOG_FORMAT") or os.environ.get("NUVYN_LOG_FORMAT")
+             or "text").lower(),
+
+    # Write extracted metadata to Databricks SQL (same as --write-to-db)
+    "EXECUTOR_WRITE_TO_DB":
+    lambda: os.environ.get("EXECUTOR_WRITE_TO_DB", "false").lower() == "true",
+
+    # Databricks SQL Warehouse connection
+    "DATABRICKS_SERVER_HOSTNAME":
+    lambda: os.environ.get("DATABRICKS_SERVER_HOSTNAME", ""),
+    "DATABRICKS_HTTP_PATH":
+    lambda: os.environ.get("DATABRICKS_HTTP_PATH", ""),
+    "DATABRICKS_ACCESS_TOKEN":
+    lambda: os.environ.get("DATABRICKS_ACCESS_TOKEN", ""),
+
+    # Set by Databricks Jobs for each run
+    "DATABRICKS_JOB_RUN_ID":
+    lambda: os.environ.get("DATABRICKS_JOB_RUN_ID", ""),
+
+    # Raw JSON job payload from the backend (None when not set)
+    "NUVYN_JOB_PAYLOAD":
+    lambda: os.environ.get("NUVYN_JOB_PAYLOAD"),
+
+    # Number of sources extracted concurrently in multi-source jobs
+    "NUVYN_SOURCE_BATCH_SIZE":
+    lambda: _int_env("NUVYN_SOURCE_BATCH_SIZE", 8),
+
+    # Directory caching per-file metadata across runs, keyed by path + size + ETag (off when unset)
+    "NUVYN_FILE_METADATA_CACHE_DIR":
+    lambda: os.environ.get("NUVYN_FILE_METADATA_CACHE_DIR") or None,
+
+    # DBFS directory (FUSE path under /dbfs) for staging large column loads as Parquet for COPY INTO
+    # (off when unset)
+    "NUVYN_COPY_INTO_STAGING_DIR":
+    lambda: os.environ.get("NUVYN_COPY_INTO_STAGING_DIR") or None,
+}
+
+
+def __getattr__(name: str):
+    if name in environment_variables:
+        value = environment_variables[name]()
+        globals()[name] = value  # later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(environment_variables.keys())
@@ -7,10 +7,10 @@ import asyncio
 import uuid
 import json
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
-from executor.config import JobConfig, JobType, JobStatus, ConfigManager
+from executor.config import JobConfig, JobType, JobStatus, ConfigManager, get_config
 from executor.logger import get_logger
 
 logger = get_logger(__name__)
@@ -36,11 +36,35 @@ class JobResult:
 class JobManager:
     """Manages job lifecycle and execution"""
     
+    # One shared manager per ConfigManager; see get_default()
+    _instances: Dict[int, 'JobManager'] = {}
+    
+    @classmethod
+    def get_default(cls, config_manager: Optional[ConfigManager] = None) -> 'JobManager':
+        """Return the process-wide JobManager for a config manager (the global config by default)
+        
+        Job state lives in the manager, so reusing it keeps jobs visible across
+        callers. Each cached manager references its ConfigManager, so the id key
+        cannot be reused while the entry exists.
+        """
+        if config_manager is None:
+            config_manager = get_config()
+        manager = cls._instances.get(id(config_manager))
+        if manager is None:
+            manager = cls._instances[id(config_manager)] = cls(config_manager)
+        return manager
+    
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.active_jobs: Dict[str, asyncio.Task] = {}
         self.job_results: Dict[str, JobResult] = {}
+        # idempotency_key -> job_id, so resubmitted jobs are not created twice
+        self.idempotency_keys: Dict[str, str] = {}
+        # job_id -> execution started by create_and_execute, shared by concurrent duplicates
+        self._executions: Dict[str, asyncio.Task] = {}
         self.max_concurrent_jobs = config_manager.executor_config.max_concurrent_jobs
+        # Shared by API transmissions so they reuse pooled HTTP connections
+        self._api_client = None
     
     async def create_job(self, 
                         job_type: JobType,
@@ -58,7 +82,16 @@ class JobManager:
             tenant_id: Tenant identifier
             job_metadata: Additional job metadata
             sources: List of sources for multi-source processing
+        
+        If job_metadata carries an idempotency_key already seen by this manager,
+        the existing job ID is returned instead of creating a duplicate job.
         """
+        idempotency_key = (job_metadata or {}).get("idempotency_key")
+        if idempotency_key and idempotency_key in self.idempotency_keys:
+            existing_job_id = self.idempotency_keys[idempotency_key]
+            logger.info("♻️ Reusing existing job %s for idempotency key %s", existing_job_id, idempotency_key)
+            return existing_job_id
+        
         job_id = f"job_{uuid.uuid4().hex[:12]}"
         
         job_config = JobConfig(
@@ -73,14 +106,53 @@ class JobManager:
         
         # Save job configuration
         if self.config_manager.save_job_config(job_config):
-            logger.info(f"✅ Job created: {job_id} ({job_type.value})")
+            if idempotency_key:
+                self.idempotency_keys[idempotency_key] = job_id
+            logger.info("✅ Job created: %s (%s)", job_id, job_type.value)
             return job_id
         else:
             raise Exception(f"Failed to create job {job_id}")
     
+    async def create_and_execute(self,
+                                 job_type: JobType,
+                                 data_source_path: str = "",
+                                 data_source_type: str = "auto",
+                                 tenant_id: str = "default",
+                                 job_metadata: Dict[str, Any] = None,
+                                 sources: List[Dict[str, Any]] = None) -> Tuple[str, JobResult]:
+        """Create a job and run it to completion in one coroutine
+        
+        A job that an earlier submission (same idempotency key) already
+        completed is not executed again; its stored result is returned. A
+        duplicate arriving while that job is still running waits for the same
+        execution instead of starting another.
+        """
+        job_id = await self.create_job(
+            job_type=job_type,
+            data_source_path=data_source_path,
+            data_source_type=data_source_type,
+            tenant_id=tenant_id,
+            job_metadata=job_metadata,
+            sources=sources
+        )
+        
+        result = self.job_results.get(job_id)
+        if result is not None and result.status == JobStatus.COMPLETED:
+            return job_id, result
+        
+        execution = self._executions.get(job_id)
+        if execution is None:
+            execution = self._executions[job_id] = asyncio.ensure_future(self.execute_job(job_id))
+            execution.add_done_callback(
+                lambda task: self._executions.pop(job_id) if self._executions.get(job_id) is task else None
+            )
+        # Shielded so one cancelled waiter does not cancel the run for the others
+        result = await asyncio.shield(execution)
+        return job_id, result
+    
     async def execute_job(self, job_id: str) -> JobResult:
         """Execute a specific job"""
-        logger.info(f"🚀 Starting job execution: {job_id}")
+        logger.info("🚀 Starting job execution: %s", job_id)
         
         # Load job configuration
         job_config = self.config_manager.get_job_config(job_id)
@@ -105,12 +177,12 @@ class JobManager:
             
             # Store result
             self.job_results[job_id] = result
-            logger.info(f"✅ Job completed: {job_id} ({result.status.value})")
+            logger.info("✅ Job completed: %s (%s)", job_id, result.status.value)
             
             return result
             
         except asyncio.TimeoutError:
-            logger.error(f"⏰ Job timeout: {job_id}")
+            logger.error("⏰ Job timeout: %s", job_id)
             await self.update_job_status(job_id, JobStatus.FAILED, "Job timeout")
             result = JobResult(
                 job_id=job_id,
@@ -121,7 +193,7 @@ class JobManager:
             return result
             
         except Exception as e:
-            logger.error(f"❌ Job execution failed: {job_id} - {str(e)}")
+            logger.error("❌ Job execution failed: %s - %s", job_id, e)
             await self.update_job_status(job_id, JobStatus.FAILED, str(e))
             result = JobResult(
                 job_id=job_id,
@@ -141,14 +213,14 @@ class JobManager:
         start_time = datetime.now(timezone.utc)
         
         try:
-            logger.info(f"🔧 Executing {job_config.job_type.value} job: {job_config.job_id}")
-            logger.debug(f"🔍 Job type enum: {job_config.job_type}")
-            logger.debug(f"🔍 Job type name: {job_config.job_type.name}")
-            logger.debug(f"🔍 Job type value: {job_config.job_type.value}")
+            logger.info("🔧 Executing %s job: %s", job_config.job_type.value, job_config.job_id)
+            logger.debug("🔍 Job type enum: %s", job_config.job_type)
+            logger.debug("🔍 Job type name: %s", job_config.job_type.name)
+            logger.debug("🔍 Job type value: %s", job_config.job_type.value)
             
             # Import job executors dynamically
             if job_config.job_type == JobType.METADATA_EXTRACTION:
-                from metadata.extractor import MetadataExtractor
+                from executor.metadata.extractor import MetadataExtractor
                 executor = MetadataExtractor(self.config_manager)
                 
                 # Check if db_writer is provided in job_metadata
@@ -159,23 +231,22 @@ class JobManager:
                 result_data = await executor.extract_metadata(job_config)
                 
             elif job_config.job_type == JobType.SCHEMA_VALIDATION:
-                from schema.validator import SchemaValidator
+                from executor.schema.validator import SchemaValidator
                 executor = SchemaValidator(self.config_manager)
                 result_data = await executor.validate_schema(job_config)
                 
             elif job_config.job_type == JobType.DATA_READING:
-                from data_reader.reader import DataReader
+                from executor.data_reader.reader import DataReader
                 executor = DataReader(self.config_manager)
                 result_data = await executor.read_data(job_config)
                 
             elif job_config.job_type == JobType.QUALITY_ASSESSMENT:
-                from metadata.quality_assessor import QualityAssessor
+                from executor.metadata.quality_assessor import QualityAssessor
                 executor = QualityAssessor(self.config_manager)
                 result_data = await executor.assess_quality(job_config)
                 
             elif job_config.job_type == JobType.API_TRANSMISSION:
-                from transport.api_client import APIClient
-                executor = APIClient(self.config_manager)
+                executor = self._get_api_client()
                 result_data = await executor.transmit_data(job_config)
                 
             elif job_config.job_type == JobType.FULL_PIPELINE:
@@ -207,7 +278,7 @@ class JobManager:
             )
             
         except Exception as e:
-            logger.error(f"❌ Job task failed: {job_config.job_id} - {str(e)}")
+            logger.error("❌ Job task failed: %s - %s", job_config.job_id, e)
             
             # Calculate execution time
             end_time = datetime.now(timezone.utc)
@@ -229,7 +300,7 @@ class JobManager:
     
     async def _execute_full_pipeline(self, job_config: JobConfig) -> Dict[str, Any]:
         """Execute full pipeline (multiple job types in sequence)"""
-        logger.info(f"🔄 Executing full pipeline: {job_config.job_id}")
+        logger.info("🔄 Executing full pipeline: %s", job_config.job_id)
         
         pipeline_results = {}
         
@@ -243,13 +314,13 @@ class JobManager:
                 tenant_id=job_config.tenant_id
             )
             
-            from .schema.validator import SchemaValidator
+            from executor.schema.validator import SchemaValidator
             schema_validator = SchemaValidator(self.config_manager)
             schema_result = await schema_validator.validate_schema(schema_job_config)
             pipeline_results["schema_validation"] = schema_result
             
         except Exception as e:
-            logger.error(f"❌ Schema validation failed: {e}")
+            logger.error("❌ Schema validation failed: %s", e)
             pipeline_results["schema_validation"] = {"error": str(e)}
         
         # Step 2: Metadata Extraction
@@ -268,7 +339,7 @@ class JobManager:
             pipeline_results["metadata_extraction"] = metadata_result
             
         except Exception as e:
-            logger.error(f"❌ Metadata extraction failed: {e}")
+            logger.error("❌ Metadata extraction failed: %s", e)
             pipeline_results["metadata_extraction"] = {"error": str(e)}
         
         # Step 3: Quality Assessment
@@ -287,7 +358,7 @@ class JobManager:
             pipeline_results["quality_assessment"] = quality_result
             
         except Exception as e:
-            logger.error(f"❌ Quality assessment failed: {e}")
+            logger.error("❌ Quality assessment failed: %s", e)
             pipeline_results["quality_assessment"] = {"error": str(e)}
         
         # Step 4: API Transmission
@@ -300,13 +371,12 @@ class JobManager:
                 tenant_id=job_config.tenant_id
             )
             
-            from .transport.api_client import APIClient
-            api_client = APIClient(self.config_manager)
+            api_client = self._get_api_client()
             api_result = await api_client.transmit_data(api_job_config)
             pipeline_results["api_transmission"] = api_result
             
         except Exception as e:
-            logger.error(f"❌ API transmission failed: {e}")
+            logger.error("❌ API transmission failed: %s", e)
             pipeline_results["api_transmission"] = {"error": str(e)}
         
         return pipeline_results
@@ -336,7 +406,7 @@ class JobManager:
             del self.active_jobs[job_id]
             
             await self.update_job_status(job_id, JobStatus.CANCELLED)
-            logger.info(f"🚫 Job cancelled: {job_id}")
+            logger.info("🚫 Job cancelled: %s", job_id)
             return True
         
         return False
@@ -385,13 +455,13 @@ class JobManager:
         """Update job status in storage"""
         try:
             # In a real implementation, this would update the database
-            logger.info(f"📊 Job status updated: {job_id} -> {status.value}")
+            logger.info("📊 Job status updated: %s -> %s", job_id, status.value)
             
             if error_message:
-                logger.error(f"❌ Job error: {job_id} - {error_message}")
+                logger.error("❌ Job error: %s - %s", job_id, error_message)
                 
         except Exception as e:
-            logger.error(f"❌ Failed to update job status: {e}")
+            logger.error("❌ Failed to update job status: %s", e)
     
     async def cleanup_old_jobs(self):
         """Clean up old completed jobs"""
@@ -409,7 +479,26 @@ class JobManager:
         
         for job_id in jobs_to_remove:
             del self.job_results[job_id]
-            logger.info(f"🧹 Cleaned up old job: {job_id}")
+            logger.info("🧹 Cleaned up old job: %s", job_id)
+    
+    def _get_api_client(self):
+        """Return the manager's APIClient, creating it on first use"""
+        if self._api_client is None:
+            from executor.transport.api_client import APIClient
+            self._api_client = APIClient(self.config_manager)
+        return self._api_client
+    
+    async def aclose(self):
+        """Cancel any jobs still running and release job tracking state"""
+        tasks = list(self.active_jobs.values())
+        self.active_jobs.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._api_client is not None:
+            await self._api_client.aclose()
+            self._api_client = None
     
     def get_active_job_count(self) -> int:
         """Get number of currently active jobs"""
@@ -0,0 +1,111 @@
+"""
+Job payload for Nuvyn Executor Script
+NUVYN_JOB_PAYLOAD (set by the backend on Databricks Jobs) parsed once per process
+"""
+
+import functools
+import json
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+from executor import envs
+from executor.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _loads(raw: str) -> Any:
+    """Decode JSON, using orjson when it is installed"""
+    if orjson is not None:
+        # orjson takes str directly; encoding first would only add a copy
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Longer strings (paths, SAS tokens, connection strings) are rarely repeated
+_INTERN_MAX_LEN = 32
+
+
+def _intern(obj: Any) -> Any:
+    """Intern dict keys and short string values so repeated per-source fields share one object"""
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern(v) for v in obj]
+    if isinstance(obj, str) and len(obj) < _INTERN_MAX_LEN:
+        return sys.intern(obj)
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def load_job_payload() -> Optional[Dict[str, Any]]:
+    """Parse NUVYN_JOB_PAYLOAD once per process
+    
+    The payload is fixed for the life of the process: envs caches the raw value on first
+    access, so changing the environment variable afterwards has no effect.
+    """
+    raw = envs.NUVYN_JOB_PAYLOAD
+    if raw is None:
+        logger.debug("NUVYN_JOB_PAYLOAD environment variable not set")
+        return None
+    
+    try:
+        return _intern(_loads(raw))
+    except json.JSONDecodeError as e:
+        logger.warning("⚠️ Failed to parse NUVYN_JOB_PAYLOAD as JSON: %s", e)
+    except Exception as e:
+        logger.warning("⚠️ Error reading NUVYN_JOB_PAYLOAD: %s", e)
+    
+    return None
+
+
+class JobPayloadIds(NamedTuple):
+    """Fields read from NUVYN_JOB_PAYLOAD, resolved once"""
+    workflow_id: Optional[str] = None
+    source_id: Optional[str] = None
+    sources: Optional[List[Dict[str, Any]]] = None
+
+
+def _pick(job_payload: Dict[str, Any], key: str) -> Tuple[Any, Optional[str]]:
+    """Look up key in job_metadata (preferred) then at the top level; returns (value, where)"""
+    job_metadata = job_payload.get("job_metadata")
+    if isinstance(job_metadata, dict) and key in job_metadata:
+        return job_metadata[key], "job_metadata"
+    if key in job_payload:
+        return job_payload[key], "top-level payload"
+    return None, None
+
+
+@functools.lru_cache(maxsize=1)
+def job_payload_ids() -> JobPayloadIds:
+    """Resolve workflow_id, source_id and sources from the cached payload"""
+    job_payload = load_job_payload()
+    if not isinstance(job_payload, dict):
+        return JobPayloadIds()
+
+    workflow_id, where = _pick(job_payload, "workflow_id")
+    if where:
+        logger.debug("✅ Using workflow_id from %s: %s", where, workflow_id)
+
+    source_id, where = _pick(job_payload, "source_id")
+    if where:
+        logger.debug("✅ Using source_id from %s: %s", where, source_id)
+
+    # Top-level sources take precedence over job_metadata.sources
+    sources = job_payload.get("sources")
+    where = "NUVYN_JOB_PAYLOAD"
+    if not isinstance(sources, list):
+        job_metadata = job_payload.get("job_metadata")
+        sources = job_metadata.get("sources") if isinstance(job_metadata, dict) else None
+        where = "job_metadata"
+    if isinstance(sources, list):
+        logger.info("✅ Found %s sources in %s", len(sources), where)
+    else:
+        sources = None
+
+    return JobPayloadIds(workflow_id, source_id, sources)
@@ -3,15 +3,101 @@ Logging utilities for Nuvyn Executor Script
 Provides structured logging with different output formats and levels
 """
 
+import json
 import logging
 import sys
 import os
+import re
+import string
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
+from executor import envs
 
-class ColoredFormatter(logging.Formatter):
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps_event(payload: dict) -> str:
+    """Serialize a structured log event to a compact JSON string"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode()
+    return json.dumps(payload, default=str, separators=(',', ':'))
+
+
+# Prebuilt str.format_map templates (fixed at construction, applied per record)
+CONSOLE_TEMPLATE = '{asctime} - {name} - {levelname} - {message}'
+FILE_TEMPLATE = '{asctime} - {name} - {levelname} - {funcName}:{lineno} - {message}'
+JOB_TEMPLATE = '{asctime} - {levelname} - {message}'
+
+
+class TemplateFormatter(logging.Formatter):
+    """Formatter that renders a prebuilt template with str.format_map"""
+    
+    def __init__(self, template: str, datefmt: Optional[str] = None):
+        super().__init__(datefmt=datefmt)
+        self._template = template
+        self._uses_time = '{asctime' in template
+        self._compiled: Dict[str, Optional[Tuple[Tuple[bytes, Optional[str]], ...]]] = {}
+    
+    def usesTime(self):
+        return self._uses_time
+    
+    def _template_for(self, record) -> str:
+        """Return the template used to render this record"""
+        return self._template
+    
+    def formatMessage(self, record):
+        return self._template_for(record).format_map(record.__dict__)
+    
+    def _compile(self, template: str):
+        """Split a template into pre-encoded literals and field names"""
+        compiled = self._compiled.get(template, False)
+        if compiled is not False:
+            return compiled
+        segments = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if spec or conversion:
+                # Fall back to str rendering for templates using format specs
+                segments = None
+                break
+            segments.append((literal.encode('utf-8'), field))
+        compiled = self._compiled[template] = tuple(segments) if segments is not None else None
+        return compiled
+    
+    def format_bytes(self, record, encoding: str = 'utf-8') -> bytes:
+        """Format a record to bytes, encoding only its variable fields"""
+        if encoding.lower().replace('-', '') != 'utf8':
+            return self.format(record).encode(encoding)
+        segments = self._compile(self._template_for(record))
+        if segments is None:
+            return self.format(record).encode(encoding)
+        
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        values = record.__dict__
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]).encode(encoding))
+        
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(b'\n')
+            parts.append(record.exc_text.encode(encoding))
+        if record.stack_info:
+            parts.append(b'\n')
+            parts.append(self.formatStack(record.stack_info).encode(encoding))
+        return b''.join(parts)
+
+
+class ColoredFormatter(TemplateFormatter):
     """Custom formatter with colors for console output"""
     
     # ANSI color codes
@@ -33,29 +119,135 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '🚨'
     }
     
-    def format(self, record):
-        # Add emoji and color
-        level_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        emoji = self.EMOJIS.get(record.levelname, '📝')
-        reset_color = self.COLORS['RESET']
-        
-        # Format the message
-        record.levelname = f"{level_color}{record.levelname}{reset_color}"
-        record.msg = f"{emoji} {record.msg}"
-        
-        return super().format(record)
+    def __init__(self,
+                 template: str,
+                 datefmt: Optional[str] = None,
+                 use_colors: bool = True,
+                 use_emoji: bool = True):
+        super().__init__(template, datefmt=datefmt)
+        self.use_colors = use_colors
+        self.use_emoji = use_emoji
+        # Bake color and emoji into one template per level so records are never mutated
+        self._level_templates = {
+            level: self._build_template(template, level) for level in self.EMOJIS
+        }
+        # Pre-encode the constant color/emoji segments for the bytes path
+        for level_template in self._level_templates.values():
+            self._compile(level_template)
+    
+    def _build_template(self, template: str, levelname: str) -> str:
+        if self.use_colors:
+            level_color = self.COLORS.get(levelname, self.COLORS['RESET'])
+            reset_color = self.COLORS['RESET']
+            template = template.replace('{levelname}', f"{level_color}{levelname}{reset_color}")
+        if self.use_emoji:
+            emoji = self.EMOJIS.get(levelname, '📝')
+            template = template.replace('{message}', f"{emoji} {{message}}")
+        return template
+    
+    def _template_for(self, record) -> str:
+        template = self._level_templates.get(record.levelname)
+        if template is None:
+            template = self._level_templates[record.levelname] = self._build_template(
+                self._template, record.levelname
+            )
+        return template
 
 
-class JobFormatter(logging.Formatter):
+class JobFormatter(TemplateFormatter):
     """Formatter specifically for job-related logs"""
     
-    def format(self, record):
+    def __init__(self, template: str, datefmt: Optional[str] = None):
+        super().__init__(template, datefmt=datefmt)
+        self._job_template = template.replace('{message}', '[{job_id}] {message}')
+    
+    def _template_for(self, record) -> str:
         # Add job context if available
-        job_id = getattr(record, 'job_id', None)
-        if job_id:
-            record.msg = f"[{job_id}] {record.msg}"
-        
-        return super().format(record)
+        if getattr(record, 'job_id', None):
+            return self._job_template
+        return self._template
+
+
+# Standard LogRecord attributes; anything else on a record came in through `extra`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+# Emoji / pictographs (plus variation selectors and joiners) used as message prefixes
+_EMOJI_RE = re.compile('[\U0001F000-\U0001FAFF\u2300-\u23FF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D]+\\s*')
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter emitting one compact JSON object per record
+    
+    Fields passed through `extra` become top-level keys, and emoji are stripped
+    from the message so driver logs stay machine-readable.
+    """
+    
+    def format(self, record):
+        payload = {
+            "t": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": _EMOJI_RE.sub('', record.getMessage()).strip(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return _dumps_event(payload)
+
+
+class AppendFileHandler(logging.Handler):
+    """File handler that writes each record with a single os.write on an O_APPEND descriptor
+    
+    Appends to a regular file are atomic at the OS level, so records are written
+    without a Python-level stream buffer, per-write flush, or handler lock.
+    """
+    
+    def __init__(self, filename: str, encoding: str = 'utf-8'):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    def handle(self, record):
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+    
+    def emit(self, record):
+        try:
+            fd = self._fd
+            if fd is None:
+                return
+            formatter = self.formatter or logging._defaultFormatter
+            if isinstance(formatter, TemplateFormatter):
+                data = formatter.format_bytes(record, self.encoding) + b'\n'
+            else:
+                data = (formatter.format(record) + '\n').encode(self.encoding)
+            os.write(fd, data)
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            fd, self._fd = self._fd, None
+            if fd is not None:
+                os.close(fd)
+        finally:
+            self.release()
+        super().close()
+
+
+def _close_handlers(logger: logging.Logger):
+    """Close and detach all handlers so their file descriptors are released"""
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
 
 
 class ExecutorLogger:
@@ -66,19 +258,27 @@ class ExecutorLogger:
                  log_level: str = "INFO",
                  log_file: Optional[str] = None,
                  enable_console: bool = True,
-                 enable_colors: bool = True):
+                 enable_colors: bool = True,
+                 log_format: Optional[str] = None,
+                 enable_emoji: Optional[bool] = None):
         self.name = name
         self.log_level = log_level.upper()
         self.log_file = log_file
+        # Directory for per-job log files, resolved once
+        self._log_dir_str = os.path.dirname(log_file) if log_file else None
         self.enable_console = enable_console
         self.enable_colors = enable_colors
+        self.enable_emoji = enable_colors if enable_emoji is None else enable_emoji
+        # "json" renders every record as one JSON object with `extra` fields as keys
+        self.log_format = (log_format or envs.EXECUTOR_LOG_FORMAT).lower()
+        self.json_events = self.log_format == "json"
         
         # Create logger
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, self.log_level))
         
         # Clear existing handlers
-        self.logger.handlers.clear()
+        _close_handlers(self.logger)
         
         # Setup formatters
         self._setup_formatters()
@@ -92,29 +292,26 @@ class ExecutorLogger:
     
     def _setup_formatters(self):
         """Setup log formatters"""
+        if self.json_events:
+            self.console_formatter = self.file_formatter = self.job_formatter = JsonFormatter()
+            return
+        
         # Console formatter with colors and emojis
-        if self.enable_colors:
+        if self.enable_colors or self.enable_emoji:
             self.console_formatter = ColoredFormatter(
-                fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%H:%M:%S'
+                CONSOLE_TEMPLATE,
+                datefmt='%H:%M:%S',
+                use_colors=self.enable_colors,
+                use_emoji=self.enable_emoji
             )
         else:
-            self.console_formatter = logging.Formatter(
-                fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%H:%M:%S'
-            )
+            self.console_formatter = TemplateFormatter(CONSOLE_TEMPLATE, datefmt='%H:%M:%S')
         
         # File formatter (no colors)
-        self.file_formatter = logging.Formatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        self.file_formatter = TemplateFormatter(FILE_TEMPLATE, datefmt='%Y-%m-%d %H:%M:%S')
         
         # Job formatter
-        self.job_formatter = JobFormatter(
-            fmt='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
+        self.job_formatter = JobFormatter(JOB_TEMPLATE, datefmt='%H:%M:%S')
     
     def _setup_console_handler(self):
         """Setup console handler"""
@@ -129,7 +326,7 @@ class ExecutorLogger:
         log_path = Path(self.log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(self.log_file)
+        file_handler = AppendFileHandler(self.log_file)
         file_handler.setLevel(getattr(logging, self.log_level))
         file_handler.setFormatter(self.file_formatter)
         self.logger.addHandler(file_handler)
@@ -140,7 +337,7 @@ class ExecutorLogger:
         job_logger.setLevel(getattr(logging, self.log_level))
         
         # Clear existing handlers
-        job_logger.handlers.clear()
+        _close_handlers(job_logger)
         
         # Add console handler with job formatter
         if self.enable_console:
@@ -152,8 +349,8 @@ class ExecutorLogger:
         # Add file handler if log file is specified
         if self.log_file:
             # Create job-specific log file
-            job_log_file = str(Path(self.log_file).parent / f"job_{job_id}.log")
-            file_handler = logging.FileHandler(job_log_file)
+            job_log_file = os.path.join(self._log_dir_str, "job_" + job_id + ".log")
+            file_handler = AppendFileHandler(job_log_file)
             file_handler.setLevel(getattr(logging, self.log_level))
             file_handler.setFormatter(self.file_formatter)
             job_logger.addHandler(file_handler)
@@ -163,43 +360,59 @@ class ExecutorLogger:
         
         return job_logger
     
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message"""
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, *args, extra=kwargs)
     
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message"""
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, *args, extra=kwargs)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message"""
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, *args, extra=kwargs)
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message"""
-        self.logger.error(message, extra=kwargs)
+        self.logger.error(message, *args, extra=kwargs)
     
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message"""
-        self.logger.critical(message, extra=kwargs)
+        self.logger.critical(message, *args, extra=kwargs)
+    
+    def event(self, event_name: str, level: int = logging.INFO, **fields):
+        """Log a structured event; in JSON mode the fields become top-level keys"""
+        self.logger.log(level, event_name, extra=fields)
     
     def job_start(self, job_id: str, job_type: str, data_source: str):
         """Log job start"""
-        self.info(f"🚀 Starting job: {job_type} for {data_source}", 
+        if self.json_events:
+            self.event("job_start", job_id=job_id, job_type=job_type, data_source=data_source)
+            return
+        self.info("🚀 Starting job: %s for %s", job_type, data_source,
                  job_id=job_id, job_type=job_type, data_source=data_source)
     
     def job_complete(self, job_id: str, execution_time: float):
         """Log job completion"""
-        self.info(f"✅ Job completed in {execution_time:.2f}s", 
+        if self.json_events:
+            self.event("job_complete", job_id=job_id, execution_time=execution_time)
+            return
+        self.info("✅ Job completed in %.2fs", execution_time,
                  job_id=job_id, execution_time=execution_time)
     
     def job_failed(self, job_id: str, error: str):
         """Log job failure"""
-        self.error(f"❌ Job failed: {error}", job_id=job_id, error=error)
+        if self.json_events:
+            self.event("job_failed", level=logging.ERROR, job_id=job_id, error=error)
+            return
+        self.error("❌ Job failed: %s", error, job_id=job_id, error=error)
     
     def job_progress(self, job_id: str, step: str, progress: float):
         """Log job progress"""
-        self.info(f"📊 Progress: {step} ({progress:.1f}%)", 
+        if self.json_events:
+            self.event("job_progress", job_id=job_id, step=step, progress=progress)
+            return
+        self.info("📊 Progress: %s (%.1f%%)", step, progress,
                  job_id=job_id, step=step, progress=progress)
 
 
@@ -210,10 +423,22 @@ _global_logger: Optional[ExecutorLogger] = None
 def initialize_logger(log_level: str = "INFO", 
                      log_file: Optional[str] = None,
                      enable_console: bool = True,
-                     enable_colors: bool = True) -> ExecutorLogger:
-    """Initialize the global logger"""
+                     enable_colors: bool = True,
+                     log_format: Optional[str] = None,
+                     enable_emoji: Optional[bool] = None) -> ExecutorLogger:
+    """Initialize the global logger
+    
+    Colors and level emojis are only emitted when stdout is a TTY; captured
+    output (e.g. Databricks Jobs driver logs) gets plain records.
+    """
     global _global_logger
     
+    is_tty = sys.stdout.isatty()
+    if enable_colors and not is_tty:
+        enable_colors = False
+    if enable_emoji is None:
+        enable_emoji = is_tty
+    
     # Default log file location
     if not log_file:
         log_dir = Path.home() / ".nuvyn" / "logs"
@@ -224,7 +449,9 @@ def initialize_logger(log_level: str = "INFO",
         log_level=log_level,
         log_file=log_file,
         enable_console=enable_console,
-        enable_colors=enable_colors
+        enable_colors=enable_colors,
+        log_format=log_format,
+        enable_emoji=enable_emoji
     )
     
     return _global_logger
@@ -284,42 +511,42 @@ def log_data_source_connection(source_type: str, source_path: str, success: bool
     """Log data source connection attempt"""
     logger = get_logger("datasource")
     if success:
-        logger.info(f"✅ Connected to {source_type}: {source_path}")
+        logger.info("✅ Connected to %s: %s", source_type, source_path)
     else:
-        logger.error(f"❌ Failed to connect to {source_type}: {source_path}")
+        logger.error("❌ Failed to connect to %s: %s", source_type, source_path)
 
 
 def log_schema_operation(operation: str, schema_name: str, success: bool):
     """Log schema operation"""
     logger = get_logger("schema")
     if success:
-        logger.info(f"✅ Schema {operation}: {schema_name}")
+        logger.info("✅ Schema %s: %s", operation, schema_name)
     else:
-        logger.error(f"❌ Schema {operation} failed: {schema_name}")
+        logger.error("❌ Schema %s failed: %s", operation, schema_name)
 
 
 def log_metadata_extraction(file_count: int, total_size: str, quality_score: float):
     """Log metadata extraction results"""
     logger = get_logger("metadata")
-    logger.info(f"📊 Metadata extracted: {file_count} files, {total_size}, quality: {quality_score}/100")
+    logger.info("📊 Metadata extracted: %s files, %s, quality: %s/100", file_count, total_size, quality_score)
 
 
 def log_api_transmission(endpoint: str, payload_size: int, success: bool):
     """Log API transmission"""
     logger = get_logger("api")
     if success:
-        logger.info(f"✅ API transmission successful: {endpoint} ({payload_size} bytes)")
+        logger.info("✅ API transmission successful: %s (%s bytes)", endpoint, payload_size)
     else:
-        logger.error(f"❌ API transmission failed: {endpoint}")
+        logger.error("❌ API transmission failed: %s", endpoint)
 
 
 def log_performance_metric(metric_name: str, value: float, unit: str = ""):
     """Log performance metric"""
     logger = get_logger("performance")
-    logger.info(f"📈 {metric_name}: {value} {unit}")
+    logger.info("📈 %s: %s %s", metric_name, value, unit)
 
 
 def log_security_event(event_type: str, details: str):
     """Log security-related event"""
     logger = get_logger("security")
-    logger.warning(f"🔒 Security event: {event_type} - {details}")
+    logger.warning("🔒 Security event: %s - %s", event_type, details)
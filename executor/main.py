@@ -5,23 +5,135 @@ Executes specific jobs triggered via Databricks Jobs API
 """
 
 import sys
-import os
 import asyncio
 import argparse
+import hashlib
 import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timezone
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-# Add executor directory to path
-sys.path.insert(0, os.path.dirname(__file__))
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
 
-from executor.config import ConfigManager, JobType
-from executor.job_manager import JobManager
+from executor import envs
+from executor.config import ConfigManager, JobStatus, JobType, get_config
+from executor.job_payload import job_payload_ids
 from executor.logger import initialize_logger, get_logger
+from executor.rate_limit import AsyncTokenBucket
+from executor.retry import retry_async
+
+if TYPE_CHECKING:
+    from executor.job_manager import JobManager
 
 logger = get_logger(__name__)
 
 
+def _dump_result(result_data: Any, indent: bool = True) -> None:
+    """Write result data to stdout as JSON (indented for people, compact for log capture)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        encoded = orjson.dumps(result_data, option=option, default=str)
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            # e.g. stdout replaced by a notebook or test capture
+            sys.stdout.write(encoded.decode())
+        else:
+            sys.stdout.flush()
+            buffer.write(encoded)
+            buffer.flush()
+    elif indent:
+        json.dump(result_data, sys.stdout, indent=2, default=str)
+    else:
+        json.dump(result_data, sys.stdout, separators=(",", ":"), default=str)
+
+
+def _summarize_result(result_data: Any) -> Dict[str, Any]:
+    """Top-level keys of result data with container sizes in place of their contents"""
+    if not isinstance(result_data, dict):
+        return {}
+    return {
+        key: len(value) if isinstance(value, (list, dict)) else value
+        for key, value in result_data.items()
+        if isinstance(value, (list, dict, int, float, bool, str, type(None)))
+    }
+
+
+# Shared limit for in-process JobManager calls (10 calls/s, bursts of 20) so fan-out
+# invocations do not flood the job manager; it does not throttle Databricks REST calls
+# and is no protection for API quotas
+JOBS_BUCKET = AsyncTokenBucket(10, 20)
+
+
+@dataclass(frozen=True)
+class EnvCfg:
+    """Environment settings read by the CLI, snapshotted once at process start"""
+    __slots__ = ("write_to_db", "db_hostname", "db_http_path", "db_token", "job_run_id")
+    
+    write_to_db: bool
+    db_hostname: str
+    db_http_path: str
+    db_token: str
+    job_run_id: str
+    
+    def __repr__(self) -> str:
+        # Keep the access token out of logs and tracebacks
+        return (f"EnvCfg(write_to_db={self.write_to_db!r}, db_hostname={self.db_hostname!r}, "
+                f"db_http_path={self.db_http_path!r}, db_token='***', job_run_id={self.job_run_id!r})")
+    
+    @classmethod
+    def from_environment(cls) -> 'EnvCfg':
+        """Read the settings from executor.envs"""
+        return cls(
+            write_to_db=envs.EXECUTOR_WRITE_TO_DB,
+            db_hostname=envs.DATABRICKS_SERVER_HOSTNAME,
+            db_http_path=envs.DATABRICKS_HTTP_PATH,
+            db_token=envs.DATABRICKS_ACCESS_TOKEN,
+            job_run_id=envs.DATABRICKS_JOB_RUN_ID
+        )
+
+
+ENV = EnvCfg.from_environment()
+
+VALID_JOB_TYPES = frozenset(jt.value for jt in JobType)
+TERMINAL_JOB_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+
+def _get_job_manager(config_manager: ConfigManager,
+                     job_manager: Optional["JobManager"] = None) -> "JobManager":
+    """Return the given job manager or the process-wide one for this config manager"""
+    if job_manager is not None:
+        return job_manager
+    # Imported on first use so runs that never build a JobManager skip its import
+    from executor.job_manager import JobManager
+    return JobManager.get_default(config_manager)
+
+
+def _idempotency_key(job_type: str,
+                     data_source_path: str,
+                     tenant_id: str,
+                     sources: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
+    """Derive a key for a job submission within the current Databricks job run
+    
+    The key is only known to this process's JobManager, so it deduplicates repeated
+    submissions inside one run (e.g. retry_async around create_and_execute), not a
+    Databricks task retry, which starts a new process. Without a run id (e.g. the
+    long-lived API server) there is no safe scope for the key and None is returned.
+    """
+    run_id = ENV.job_run_id
+    if not run_id:
+        return None
+    path = data_source_path or ",".join(
+        str(source.get("data_source_path", "")) for source in sources or []
+    )
+    return hashlib.blake2b(
+        f"{job_type}|{path}|{tenant_id}|{run_id}".encode(),
+        digest_size=16
+    ).hexdigest()
+
+
 def get_workflow_id_from_environment():
     """
     Extract workflow_id from NUVYN_JOB_PAYLOAD environment variable.
@@ -30,33 +142,7 @@ def get_workflow_id_from_environment():
     Returns:
         str: workflow_id from job_metadata, or None if not found
     """
-    if "NUVYN_JOB_PAYLOAD" not in os.environ:
-        logger.debug("NUVYN_JOB_PAYLOAD environment variable not set")
-        return None
-    
-    try:
-        job_payload = json.loads(os.environ["NUVYN_JOB_PAYLOAD"])
-        
-        # First, try to get workflow_id from job_metadata (preferred)
-        if "job_metadata" in job_payload:
-            job_metadata = job_payload["job_metadata"]
-            if "workflow_id" in job_metadata:
-                workflow_id = job_metadata["workflow_id"]
-                logger.info(f"✅ Using workflow_id from job_metadata: {workflow_id}")
-                return workflow_id
-        
-        # Fallback to top-level workflow_id
-        if "workflow_id" in job_payload:
-            workflow_id = job_payload["workflow_id"]
-            logger.info(f"✅ Using workflow_id from top-level payload: {workflow_id}")
-            return workflow_id
-            
-    except json.JSONDecodeError as e:
-        logger.warning(f"⚠️ Failed to parse NUVYN_JOB_PAYLOAD as JSON: {e}")
-    except Exception as e:
-        logger.warning(f"⚠️ Error reading NUVYN_JOB_PAYLOAD: {e}")
-    
-    return None
+    return job_payload_ids().workflow_id
 
 
 def get_source_id_from_environment():
@@ -67,33 +153,7 @@ def get_source_id_from_environment():
     Returns:
         str: source_id from job_metadata, or None if not found
     """
-    if "NUVYN_JOB_PAYLOAD" not in os.environ:
-        logger.debug("NUVYN_JOB_PAYLOAD environment variable not set")
-        return None
-    
-    try:
-        job_payload = json.loads(os.environ["NUVYN_JOB_PAYLOAD"])
-        
-        # First, try to get source_id from job_metadata (preferred)
-        if "job_metadata" in job_payload:
-            job_metadata = job_payload["job_metadata"]
-            if "source_id" in job_metadata:
-                source_id = job_metadata["source_id"]
-                logger.info(f"✅ Using source_id from job_metadata: {source_id}")
-                return source_id
-        
-        # Fallback to top-level source_id
-        if "source_id" in job_payload:
-            source_id = job_payload["source_id"]
-            logger.info(f"✅ Using source_id from top-level payload: {source_id}")
-            return source_id
-            
-    except json.JSONDecodeError as e:
-        logger.warning(f"⚠️ Failed to parse NUVYN_JOB_PAYLOAD as JSON: {e}")
-    except Exception as e:
-        logger.warning(f"⚠️ Error reading NUVYN_JOB_PAYLOAD: {e}")
-    
-    return None
+    return job_payload_ids().source_id
 
 
 def get_sources_from_environment() -> Optional[List[Dict[str, Any]]]:
@@ -104,73 +164,59 @@ def get_sources_from_environment() -> Optional[List[Dict[str, Any]]]:
     Returns:
         List[Dict[str, Any]]: List of source configurations, or None if not found
     """
-    if "NUVYN_JOB_PAYLOAD" not in os.environ:
-        logger.debug("NUVYN_JOB_PAYLOAD environment variable not set")
-        return None
-    
-    try:
-        job_payload = json.loads(os.environ["NUVYN_JOB_PAYLOAD"])
-        
-        # Check for sources array
-        if "sources" in job_payload and isinstance(job_payload["sources"], list):
-            sources = job_payload["sources"]
-            logger.info(f"✅ Found {len(sources)} sources in NUVYN_JOB_PAYLOAD")
-            return sources
-        
-        # Also check in job_metadata
-        if "job_metadata" in job_payload and "sources" in job_payload["job_metadata"]:
-            sources = job_payload["job_metadata"]["sources"]
-            if isinstance(sources, list):
-                logger.info(f"✅ Found {len(sources)} sources in job_metadata")
-                return sources
-            
-    except json.JSONDecodeError as e:
-        logger.warning(f"⚠️ Failed to parse NUVYN_JOB_PAYLOAD as JSON: {e}")
-    except Exception as e:
-        logger.warning(f"⚠️ Error reading NUVYN_JOB_PAYLOAD: {e}")
-    
-    return None
+    return job_payload_ids().sources
+
+
+def _result_to_dict(job_id: str, result, slim: bool = False) -> dict:
+    """Build the response dict for a JobResult; slim replaces result_data with a summary"""
+    status = result.status
+    response = {
+        "job_id": job_id,
+        "status": status.value,
+        "success": status is JobStatus.COMPLETED,
+        "execution_time": result.execution_time_seconds,
+        "error": result.error_message
+    }
+    if slim:
+        response["result_summary"] = _summarize_result(result.result_data)
+    else:
+        response["result_data"] = result.result_data
+        response["metadata"] = result.metadata
+    return response
 
 
-async def execute_job_by_id(job_id: str, config_manager: ConfigManager = None) -> dict:
+def _error_result(job_id: str, error: BaseException) -> dict:
+    """Response dict for a job that failed before producing a JobResult"""
+    return {
+        "job_id": job_id,
+        "status": "error",
+        "success": False,
+        "error": str(error),
+        "execution_time": 0,
+        "result_data": {},
+        "metadata": {}
+    }
+
+
+async def execute_job_by_id(job_id: str,
+                            config_manager: ConfigManager = None,
+                            job_manager: "JobManager" = None,
+                            slim: bool = False) -> dict:
     """Execute a specific job by ID"""
-    logger.info(f"🚀 Starting job execution: {job_id}")
+    logger.info("🚀 Starting job execution: %s", job_id)
     
-    # Create job manager
-    job_manager = JobManager(config_manager)
+    job_manager = _get_job_manager(config_manager, job_manager)
     
     try:
         # Execute the job
-        result = await job_manager.execute_job(job_id)
+        await JOBS_BUCKET.acquire()
+        result = await retry_async(job_manager.execute_job, job_id)
         
-        # Log results
-        if result.status.value == "completed":
-            logger.info(f"✅ Job completed successfully: {job_id}")
-            logger.info(f"📊 Execution time: {result.execution_time_seconds:.2f}s")
-        else:
-            logger.error(f"❌ Job failed: {job_id} - {result.error_message}")
-        
-        return {
-            "job_id": job_id,
-            "status": result.status.value,
-            "success": result.status.value == "completed",
-            "execution_time": result.execution_time_seconds,
-            "error": result.error_message,
-            "result_data": result.result_data,
-            "metadata": result.metadata
-        }
+        return _result_to_dict(job_id, result, slim)
         
     except Exception as e:
-        logger.error(f"❌ Job execution error: {job_id} - {str(e)}")
-        return {
-            "job_id": job_id,
-            "status": "error",
-            "success": False,
-            "error": str(e),
-            "execution_time": 0,
-            "result_data": {},
-            "metadata": {}
-        }
+        logger.error("❌ Job execution error: %s - %s", job_id, e)
+        return _error_result(job_id, e)
 
 
 async def create_and_execute_job(job_type: str, 
@@ -179,80 +225,69 @@ async def create_and_execute_job(job_type: str,
                                 tenant_id: str = "default",
                                 config_manager: ConfigManager = None,
                                 job_metadata: Dict[str, Any] = None,
-                                sources: List[Dict[str, Any]] = None) -> dict:
+                                sources: List[Dict[str, Any]] = None,
+                                job_manager: "JobManager" = None,
+                                slim: bool = False) -> dict:
     """Create a new job and execute it
     
     Supports both single source and multiple sources:
     - Single source: Provide data_source_path
     - Multiple sources: Provide sources list
+    
+    With slim=True only job_id/status/success/execution_time/error and a
+    result_summary are returned.
     """
     if sources and len(sources) > 0:
-        logger.info(f"🆕 Creating new job: {job_type} for {len(sources)} sources")
+        logger.info("🆕 Creating new job: %s for %s sources", job_type, len(sources))
     else:
-        logger.info(f"🆕 Creating new job: {job_type} for {data_source_path}")
+        logger.info("🆕 Creating new job: %s for %s", job_type, data_source_path)
     
-    # Create config manager if not provided
-    if config_manager is None:
-        config_manager = ConfigManager()
+    job_manager = _get_job_manager(config_manager, job_manager)
     
-    # Create job manager
-    job_manager = JobManager(config_manager)
+    job_metadata = dict(job_metadata or {})
+    if "idempotency_key" not in job_metadata:
+        idempotency_key = _idempotency_key(job_type, data_source_path, tenant_id, sources)
+        if idempotency_key:
+            job_metadata["idempotency_key"] = idempotency_key
     
     try:
-        # Create the job
-        job_id = await job_manager.create_job(
+        # Create and execute the job (create + execute cost two calls against the limit);
+        # a repeated submission reuses the existing job instead of creating a duplicate
+        await JOBS_BUCKET.acquire(2)
+        job_id, result = await retry_async(
+            job_manager.create_and_execute,
             job_type=JobType(job_type),
             data_source_path=data_source_path,
             data_source_type=data_source_type,
             tenant_id=tenant_id,
-            job_metadata=job_metadata or {},
+            job_metadata=job_metadata,
             sources=sources or []
         )
         
-        logger.info(f"📋 Job created: {job_id}")
-        
-        # Execute the job
-        result = await job_manager.execute_job(job_id)
-        
-        # Log results
-        if result.status.value == "completed":
-            logger.info(f"✅ Job completed successfully: {job_id}")
-            logger.info(f"📊 Execution time: {result.execution_time_seconds:.2f}s")
-        else:
-            logger.error(f"❌ Job failed: {job_id} - {result.error_message}")
-        
-        return {
-            "job_id": job_id,
-            "status": result.status.value,
-            "success": result.status.value == "completed",
-            "execution_time": result.execution_time_seconds,
-            "error": result.error_message,
-            "result_data": result.result_data,
-            "metadata": result.metadata
-        }
+        return _result_to_dict(job_id, result, slim)
         
     except Exception as e:
-        logger.error(f"❌ Job creation/execution error: {str(e)}")
-        return {
-            "job_id": "unknown",
-            "status": "error",
-            "success": False,
-            "error": str(e),
-            "execution_time": 0,
-            "result_data": {},
-            "metadata": {}
-        }
+        logger.error("❌ Job creation/execution error: %s", e)
+        return _error_result("unknown", e)
 
 
-async def get_job_status(job_id: str, config_manager: ConfigManager = None) -> dict:
+async def get_job_status(job_id: str,
+                         config_manager: ConfigManager = None,
+                         job_manager: "JobManager" = None) -> dict:
     """Get status of a specific job"""
-    logger.info(f"📊 Getting job status: {job_id}")
+    logger.info("📊 Getting job status: %s", job_id)
     
-    job_manager = JobManager(config_manager)
+    job_manager = _get_job_manager(config_manager, job_manager)
     
     try:
+        await JOBS_BUCKET.acquire()
         status = await job_manager.get_job_status(job_id)
-        result = await job_manager.get_job_result(job_id)
+        
+        # Results only exist once a job is finished; skip the second call while it is in flight
+        result = None
+        if status in TERMINAL_JOB_STATUSES:
+            await JOBS_BUCKET.acquire()
+            result = await job_manager.get_job_result(job_id)
         
         return {
             "job_id": job_id,
@@ -264,7 +299,7 @@ async def get_job_status(job_id: str, config_manager: ConfigManager = None) -> d
         }
         
     except Exception as e:
-        logger.error(f"❌ Error getting job status: {str(e)}")
+        logger.error("❌ Error getting job status: %s", e)
         return {
             "job_id": job_id,
             "status": "error",
@@ -277,13 +312,15 @@ async def get_job_status(job_id: str, config_manager: ConfigManager = None) -> d
 
 async def list_jobs(config_manager: ConfigManager, 
                    status_filter: str = None,
-                   tenant_id: str = None) -> dict:
+                   tenant_id: str = None,
+                   job_manager: "JobManager" = None) -> dict:
     """List jobs with optional filtering"""
     logger.info("📋 Listing jobs")
     
-    job_manager = JobManager(config_manager)
+    job_manager = _get_job_manager(config_manager, job_manager)
     
     try:
+        await JOBS_BUCKET.acquire()
         jobs = await job_manager.list_jobs(
             status_filter=status_filter,
             tenant_id=tenant_id
@@ -299,7 +336,7 @@ async def list_jobs(config_manager: ConfigManager,
         }
         
     except Exception as e:
-        logger.error(f"❌ Error listing jobs: {str(e)}")
+        logger.error("❌ Error listing jobs: %s", e)
         return {
             "total_jobs": 0,
             "jobs": [],
@@ -311,18 +348,18 @@ async def list_jobs(config_manager: ConfigManager,
         }
 
 
-async def get_job_statistics(config_manager: ConfigManager) -> dict:
-    """Get job execution statistics"""
+def get_job_statistics(config_manager: ConfigManager,
+                       job_manager: "JobManager" = None) -> dict:
+    """Get job execution statistics (synchronous: reads in-memory results only)"""
     logger.info("📊 Getting job statistics")
     
-    job_manager = JobManager(config_manager)
+    job_manager = _get_job_manager(config_manager, job_manager)
     
     try:
-        stats = job_manager.get_job_statistics()
-        return stats
+        return job_manager.get_job_statistics()
         
     except Exception as e:
-        logger.error(f"❌ Error getting job statistics: {str(e)}")
+        logger.error("❌ Error getting job statistics: %s", e)
         return {
             "error": str(e),
             "total_jobs": 0,
@@ -333,6 +370,198 @@ async def get_job_statistics(config_manager: ConfigManager) -> dict:
         }
 
 
+class JobSpec(NamedTuple):
+    """How the CLI dispatches a job type"""
+    requires_path: bool = False
+    default_path: Optional[str] = None
+    # Coroutine taking the _dispatch_job arguments (minus job_type), for job types needing extra setup
+    custom: Optional[Callable[..., Awaitable[dict]]] = None
+
+
+async def _dispatch_job(job_type: str,
+                        data_source_path: Optional[str],
+                        data_source_type: str,
+                        tenant_id: str,
+                        env_sources: Optional[List[Dict[str, Any]]],
+                        db_writer,
+                        config_manager: ConfigManager,
+                        job_manager: "JobManager",
+                        slim: bool = False) -> dict:
+    """Create and execute a single job of the given type from CLI arguments"""
+    spec = JOB_HANDLERS.get(job_type)
+    if spec is None:
+        logger.error("❌ Error: Unknown job type '%s'", job_type)
+        print_usage()
+        sys.exit(1)
+    
+    if spec.custom is not None:
+        return await spec.custom(
+            data_source_path, data_source_type, tenant_id,
+            env_sources, db_writer, config_manager, job_manager, slim
+        )
+    
+    if spec.requires_path and not data_source_path:
+        logger.error("❌ Error: Data source path required for %s", job_type.replace("_", " "))
+        sys.exit(1)
+    
+    return await create_and_execute_job(
+        job_type=job_type,
+        data_source_path=data_source_path or spec.default_path,
+        data_source_type=data_source_type,
+        tenant_id=tenant_id,
+        config_manager=config_manager,
+        job_manager=job_manager,
+        slim=slim
+    )
+
+
+async def _dispatch_metadata_extraction(data_source_path: Optional[str],
+                                        data_source_type: str,
+                                        tenant_id: str,
+                                        env_sources: Optional[List[Dict[str, Any]]],
+                                        db_writer,
+                                        config_manager: ConfigManager,
+                                        job_manager: "JobManager",
+                                        slim: bool = False) -> dict:
+    """Run metadata extraction in multi-source mode (sources in NUVYN_JOB_PAYLOAD) or single-source mode"""
+    # Pass db_writer in job_metadata if available
+    job_metadata = {}
+    if db_writer:
+        job_metadata['db_writer'] = db_writer
+    
+    # Check for workflow_id, source_id in NUVYN_JOB_PAYLOAD environment variable
+    # (sources already retrieved at the top of main() function)
+    env_workflow_id = get_workflow_id_from_environment()
+    env_source_id = get_source_id_from_environment()
+    
+    if env_workflow_id:
+        job_metadata.setdefault("workflow_id", env_workflow_id)
+    if env_source_id:
+        job_metadata.setdefault("source_id", env_source_id)
+    if env_workflow_id or env_source_id:
+        logger.info("✅ Using NUVYN_JOB_PAYLOAD ids | workflow_id: %s | source_id: %s",
+                    env_workflow_id or "N/A", env_source_id or "N/A")
+    
+    # Use sources already retrieved at the top of main() function
+    sources = env_sources if env_sources else []
+    
+    if sources and len(sources) > 0:
+        # Multi-source mode
+        logger.info("🔄 Multi-source mode: Processing %s sources", len(sources))
+        
+        # Validate workflow_id is present
+        if not env_workflow_id:
+            logger.error("❌ Error: workflow_id is required for multi-source extraction")
+            sys.exit(1)
+        
+        result = await create_and_execute_job(
+            job_type="metadata_extraction",
+            data_source_path="",  # Not used in multi-source mode
+            data_source_type=data_source_type,
+            tenant_id=tenant_id,
+            config_manager=config_manager,
+            job_metadata=job_metadata,
+            sources=sources,
+            job_manager=job_manager,
+            slim=slim
+        )
+    else:
+        # Single source mode (backward compatible)
+        if not data_source_path:
+            logger.error("❌ Error: Data source path required for metadata extraction")
+            logger.error("   For single-source mode, provide: nuvyn-executor metadata_extraction <path> <type> <workflow_id> [--write-to-db]")
+            logger.error("   For multi-source mode, include 'sources' array in NUVYN_JOB_PAYLOAD environment variable")
+            sys.exit(1)
+        
+        result = await create_and_execute_job(
+            job_type="metadata_extraction",
+            data_source_path=data_source_path,
+            data_source_type=data_source_type,
+            tenant_id=tenant_id,
+            config_manager=config_manager,
+            job_metadata=job_metadata,
+            job_manager=job_manager,
+            slim=slim
+        )
+    
+    return result
+
+
+JOB_HANDLERS: Dict[str, JobSpec] = {
+    "metadata_extraction": JobSpec(custom=_dispatch_metadata_extraction),
+    "schema_validation": JobSpec(default_path="/tmp"),
+    "data_reading": JobSpec(requires_path=True),
+    "quality_assessment": JobSpec(requires_path=True),
+    "api_transmission": JobSpec(default_path="/tmp"),
+    "full_pipeline": JobSpec(requires_path=True),
+}
+
+
+async def _dispatch_jobs_concurrently(job_types: List[str], **dispatch_kwargs) -> dict:
+    """Run several independent job types concurrently and merge their results"""
+    job_manager = dispatch_kwargs["job_manager"]
+    semaphore = asyncio.Semaphore(job_manager.max_concurrent_jobs)
+    
+    async def run(job_type: str) -> dict:
+        async with semaphore:
+            return await _dispatch_job(job_type, **dispatch_kwargs)
+    
+    results = await asyncio.gather(*(run(job_type) for job_type in job_types))
+    return _merge_job_results(job_types, results)
+
+
+def _merge_job_results(job_types: List[str], results: List[dict]) -> dict:
+    """Combine per-job-type results into one result dict"""
+    success = all(result.get("success") for result in results)
+    errors = [
+        f"{job_type}: {result['error']}"
+        for job_type, result in zip(job_types, results)
+        if result.get("error")
+    ]
+    return {
+        "job_id": ",".join(result.get("job_id", "unknown") for result in results),
+        "status": "completed" if success else "failed",
+        "success": success,
+        "execution_time": max((result.get("execution_time", 0) for result in results), default=0),
+        "error": "; ".join(errors) or None,
+        "result_data": {
+            job_type: result.get("result_data")
+            for job_type, result in zip(job_types, results)
+            if result.get("result_data")
+        },
+        # Slim results carry a summary instead of result_data
+        "result_summary": {
+            job_type: result.get("result_summary")
+            for job_type, result in zip(job_types, results)
+            if result.get("result_summary")
+        },
+        "metadata": {job_type: result.get("metadata", {}) for job_type, result in zip(job_types, results)}
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser; positional meaning is resolved in main() since it depends on the mode"""
+    parser = argparse.ArgumentParser(prog="nuvyn-executor", add_help=False)
+    parser.add_argument("job_type", nargs="?")
+    parser.add_argument("positional_args", nargs="*")
+    parser.add_argument("--write-to-db", action="store_true")
+    parser.add_argument("--print-result", "--verbose", dest="print_result", action="store_true")
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+# Long options registered on _PARSER; any other --flag is dropped before parsing
+_KNOWN_FLAGS = frozenset({"--write-to-db", "--print-result", "--verbose"})
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse CLI arguments, ignoring unknown --flags the way the Jobs API may pass them"""
+    argv = [arg for arg in argv if not arg.startswith("--") or arg in _KNOWN_FLAGS]
+    return _PARSER.parse_intermixed_args(argv)
+
+
 def print_usage():
     """Print usage information for Databricks Jobs"""
     print("""
@@ -348,21 +577,26 @@ def print_usage():
         quality_assessment                  Assess data quality
         api_transmission                    Send results to backend API
         full_pipeline                       Execute complete pipeline
+        <type>,<type>,...                   Run several independent job types concurrently
 
     Flags:
         --write-to-db                      Write metadata to Databricks SQL tables
+        --print-result, --verbose          Print the job's result_data as JSON
+                                           (also on when EXECUTOR_LOG_LEVEL=DEBUG)
     
     Examples:
         python main.py metadata_extraction /path/to/data csv default
         python main.py metadata_extraction /path/to/data csv default --write-to-db
-        python main.py schema_validation
+        python main.py schema_validation --print-result
         python main.py full_pipeline /Volumes/data/sales parquet tenant123
+        python main.py quality_assessment,data_reading /Volumes/data/sales parquet tenant123
 
     Environment Variables:
         DATABRICKS_WORKSPACE_URL           Databricks workspace URL
         NUVYN_API_ENDPOINT                 Backend API endpoint
         NUVYN_API_KEY                      API authentication key
         EXECUTOR_LOG_LEVEL                 Log level (DEBUG, INFO, WARNING, ERROR)
+        EXECUTOR_LOG_FORMAT                Log format (text, json); NUVYN_LOG_FORMAT is an alias
         
         # For --write-to-db flag:
         DATABRICKS_SERVER_HOSTNAME         Databricks SQL Warehouse hostname
@@ -372,267 +606,232 @@ def print_usage():
     """)
 
 
-async def main():
-    """Main entry point for Databricks Jobs"""
-    # Initialize configuration
-    config_manager = ConfigManager()
+class _CliRequest(NamedTuple):
+    """Job request resolved from the command line and environment"""
+    job_types: List[str]
+    data_source_path: Optional[str]
+    data_source_type: str
+    tenant_id: str
+    env_sources: Optional[List[Dict[str, Any]]]
+    write_to_db: bool
+    print_result: bool
+
+
+def _resolve_positional_args(positional_args: List[str],
+                             multi_source: bool) -> Tuple[Optional[str], str, str]:
+    """Map positional CLI arguments to (data_source_path, data_source_type, tenant_id)"""
+    # Parse arguments - if sources are in environment, data_source_path is optional
+    if multi_source:
+        # Multi-source mode: data_source_path not required
+        # Arguments can be: metadata_extraction <workflow_id> [--write-to-db]
+        # or: metadata_extraction --write-to-db (workflow_id from env)
+        data_source_path = None  # Not used in multi-source mode
+        data_source_type = positional_args[0] if len(positional_args) > 0 else "auto"
+        tenant_id = positional_args[1] if len(positional_args) > 1 else "default"
+        return data_source_path, data_source_type, tenant_id
     
+    # Single source mode: data_source_path required
+    # Try to intelligently parse arguments
+    # Expected format: <data_source_path> <data_source_type> <workflow_id> [tenant_id]
+    # But if data_source_path is missing, arguments might be: <data_source_type> <workflow_id>
+    
+    if len(positional_args) == 0:
+        data_source_path = None
+        data_source_type = "auto"
+        tenant_id = "default"
+    elif len(positional_args) == 1:
+        # Only one arg - could be path or type
+        # Check if it looks like a path/URL (contains :// or /)
+        arg = positional_args[0]
+        if "://" in arg or "/" in arg or arg.startswith("http"):
+            data_source_path = arg
+            data_source_type = "auto"
+            tenant_id = "default"
+        else:
+            # Probably data_source_type, missing path
+            data_source_path = None
+            data_source_type = arg
+            tenant_id = "default"
+    elif len(positional_args) == 2:
+        # Two args - could be <path> <type> or <type> <workflow_id>
+        arg1, arg2 = positional_args[0], positional_args[1]
+        if "://" in arg1 or "/" in arg1 or arg1.startswith("http"):
+            # First arg is path
+            data_source_path = arg1
+            data_source_type = arg2
+            tenant_id = "default"
+        else:
+            # First arg is probably type, missing path
+            data_source_path = None
+            data_source_type = arg1
+            tenant_id = arg2  # This might be workflow_id, but we'll use it as tenant_id for now
+    else:
+        # Three or more args - standard format
+        data_source_path = positional_args[0] if positional_args[0] else None
+        data_source_type = positional_args[1] if len(positional_args) > 1 else "auto"
+        tenant_id = positional_args[2] if len(positional_args) > 2 else "default"
+    
+    # Handle empty string as None
+    if data_source_path == "":
+        data_source_path = None
+    
+    return data_source_path, data_source_type, tenant_id
+
+
+def _setup_sync() -> _CliRequest:
+    """Synchronous startup: logging, argument parsing and environment reads"""
     # Initialize logger
     initialize_logger(
-        log_level="INFO",
+        log_level=envs.EXECUTOR_LOG_LEVEL,
         enable_console=True,
-        enable_colors=True
+        enable_colors=sys.stdout.isatty()
     )
     
     logger.info("🚀 Nuvyn Executor Script starting via Databricks Jobs...")
     
     try:
         # Parse command line arguments (from Databricks Jobs API)
-        if len(sys.argv) < 2:
+        args = _parse_args(sys.argv[1:])
+        if not args.job_type:
             logger.error("❌ Error: No job type specified")
             print_usage()
             sys.exit(1)
         
-        job_type = sys.argv[1]
+        job_type = args.job_type
+        job_types = list(dict.fromkeys(jt.strip() for jt in job_type.split(",") if jt.strip()))
+        unknown_job_types = [jt for jt in job_types if jt not in VALID_JOB_TYPES]
+        if unknown_job_types or not job_types:
+            logger.error("❌ Error: Unknown job type '%s'", ",".join(unknown_job_types) or job_type)
+            print_usage()
+            sys.exit(1)
         
         # Check for sources in environment first (for multi-source mode)
         env_sources = get_sources_from_environment()
+        multi_source = bool(env_sources)
         
-        # Filter out flags from positional arguments
-        positional_args = [arg for arg in sys.argv[2:] if not arg.startswith("--")]
+        data_source_path, data_source_type, tenant_id = _resolve_positional_args(
+            args.positional_args, multi_source
+        )
         
-        # Parse arguments - if sources are in environment, data_source_path is optional
-        if env_sources and len(env_sources) > 0:
-            # Multi-source mode: data_source_path not required
-            # Arguments can be: metadata_extraction <workflow_id> [--write-to-db]
-            # or: metadata_extraction --write-to-db (workflow_id from env)
-            data_source_path = None  # Not used in multi-source mode
-            data_source_type = positional_args[0] if len(positional_args) > 0 else "auto"
-            tenant_id = positional_args[1] if len(positional_args) > 1 else "default"
+        # Check for --write-to-db flag
+        write_to_db = args.write_to_db or ENV.write_to_db
+        
+        if multi_source:
+            data_source_label = f"N/A (multi-source mode: {len(env_sources)} sources)"
         else:
-            # Single source mode: data_source_path required
-            # Try to intelligently parse arguments
-            # Expected format: <data_source_path> <data_source_type> <workflow_id> [tenant_id]
-            # But if data_source_path is missing, arguments might be: <data_source_type> <workflow_id>
-            
-            if len(positional_args) == 0:
-                data_source_path = None
-                data_source_type = "auto"
-                tenant_id = "default"
-            elif len(positional_args) == 1:
-                # Only one arg - could be path or type
-                # Check if it looks like a path/URL (contains :// or /)
-                arg = positional_args[0]
-                if "://" in arg or "/" in arg or arg.startswith("http"):
-                    data_source_path = arg
-                    data_source_type = "auto"
-                    tenant_id = "default"
-                else:
-                    # Probably data_source_type, missing path
-                    data_source_path = None
-                    data_source_type = arg
-                    tenant_id = "default"
-            elif len(positional_args) == 2:
-                # Two args - could be <path> <type> or <type> <workflow_id>
-                arg1, arg2 = positional_args[0], positional_args[1]
-                if "://" in arg1 or "/" in arg1 or arg1.startswith("http"):
-                    # First arg is path
-                    data_source_path = arg1
-                    data_source_type = arg2
-                    tenant_id = "default"
-                else:
-                    # First arg is probably type, missing path
-                    data_source_path = None
-                    data_source_type = arg1
-                    tenant_id = arg2  # This might be workflow_id, but we'll use it as tenant_id for now
-            else:
-                # Three or more args - standard format
-                data_source_path = positional_args[0] if positional_args[0] else None
-                data_source_type = positional_args[1] if len(positional_args) > 1 else "auto"
-                tenant_id = positional_args[2] if len(positional_args) > 2 else "default"
-            
-            # Handle empty string as None
-            if data_source_path == "":
-                data_source_path = None
+            data_source_label = data_source_path or "NOT PROVIDED"
+        logger.info(
+            "📋 Job: %s | 📁 Src: %s | 🔍 Type: %s | 🏢 Tenant: %s | 💾 Write to DB: %s",
+            job_type, data_source_label, data_source_type, tenant_id, write_to_db
+        )
         
-        # Check for --write-to-db flag
-        write_to_db = "--write-to-db" in sys.argv or os.getenv("EXECUTOR_WRITE_TO_DB", "false").lower() == "true"
+        return _CliRequest(
+            job_types=job_types,
+            data_source_path=data_source_path,
+            data_source_type=data_source_type,
+            tenant_id=tenant_id,
+            env_sources=env_sources,
+            write_to_db=write_to_db,
+            print_result=args.print_result or logger.isEnabledFor(logging.DEBUG)
+        )
         
+    except Exception as e:
+        logger.error("❌ Execution error: %s", e)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+async def _run_async(request: _CliRequest):
+    """Run the requested job(s) and exit with a Databricks Jobs status code"""
+    # Initialize configuration and the job manager shared by every dispatch below
+    config_manager = get_config()
+    job_manager = _get_job_manager(config_manager)
+    
+    db_writer_pool = None
+    db_writer = None
+    try:
         # Databricks SQL connection parameters (from environment)
-        db_server_hostname = os.getenv("DATABRICKS_SERVER_HOSTNAME", "")
-        db_http_path = os.getenv("DATABRICKS_HTTP_PATH", "")
-        db_access_token = os.getenv("DATABRICKS_ACCESS_TOKEN", "")
-        
-        logger.info(f"📋 Job Type: {job_type}")
-        if env_sources and len(env_sources) > 0:
-            logger.info(f"📁 Data Source: N/A (multi-source mode: {len(env_sources)} sources)")
-        else:
-            logger.info(f"📁 Data Source: {data_source_path or 'NOT PROVIDED'}")
-        logger.info(f"🔍 Source Type: {data_source_type}")
-        logger.info(f"🏢 Tenant ID: {tenant_id}")
-        logger.info(f"💾 Write to DB: {write_to_db}")
+        db_server_hostname = ENV.db_hostname
+        db_http_path = ENV.db_http_path
+        db_access_token = ENV.db_token
         
         # Initialize Databricks writer if write-to-db is enabled
-        db_writer = None
-        if write_to_db:
+        if request.write_to_db:
             if db_server_hostname and db_http_path and db_access_token:
-                from executor.storage.databricks_writer import DatabricksWriter
-                db_writer = DatabricksWriter(db_server_hostname, db_http_path, db_access_token)
-                if db_writer.connect():
-                    db_writer.create_schema_and_tables()
+                from executor.storage.databricks_writer import DB_WRITER_POOL
+                db_writer_pool = DB_WRITER_POOL
+                # Pooled writers connect on their first statement
+                db_writer = await db_writer_pool.acquire(db_server_hostname, db_http_path, db_access_token)
+                if db_writer.schema_ready:
                     logger.info("✅ Databricks SQL writer initialized")
                 else:
-                    logger.error("❌ Failed to initialize Databricks SQL writer")
-                    db_writer = None
+                    try:
+                        # Overlap the schema DDL with job execution; the first write waits for it
+                        db_writer.start_schema_setup()
+                        logger.info("✅ Databricks SQL writer initialized (schema setup running in background)")
+                    except RuntimeError as e:
+                        logger.warning("⚠️ Background schema setup unavailable (%s), running inline", e)
+                        if db_writer.create_schema_and_tables():
+                            logger.info("✅ Databricks SQL writer initialized")
+                        else:
+                            logger.error("❌ Failed to initialize Databricks SQL writer")
+                            await db_writer_pool.release(db_writer)
+                            db_writer = None
             else:
                 logger.warning("⚠️ --write-to-db flag set but Databricks SQL credentials not provided")
                 logger.warning("   Set: DATABRICKS_SERVER_HOSTNAME, DATABRICKS_HTTP_PATH, DATABRICKS_ACCESS_TOKEN")
         
-        # Execute based on job type
-        if job_type == "metadata_extraction":
-            # Pass db_writer in job_metadata if available
-            job_metadata = {}
-            if db_writer:
-                job_metadata['db_writer'] = db_writer
-            
-            # Check for workflow_id, source_id in NUVYN_JOB_PAYLOAD environment variable
-            # (sources already retrieved at the top of main() function)
-            env_workflow_id = get_workflow_id_from_environment()
-            env_source_id = get_source_id_from_environment()
-            
-            if env_workflow_id:
-                if "workflow_id" not in job_metadata:
-                    job_metadata["workflow_id"] = env_workflow_id
-                    logger.info(f"✅ Using workflow_id from NUVYN_JOB_PAYLOAD: {env_workflow_id}")
-            
-            if env_source_id:
-                if "source_id" not in job_metadata:
-                    job_metadata["source_id"] = env_source_id
-                    logger.info(f"✅ Using source_id from NUVYN_JOB_PAYLOAD: {env_source_id}")
-            
-            # Use sources already retrieved at the top of main() function
-            sources = env_sources if env_sources else []
-            
-            if sources and len(sources) > 0:
-                # Multi-source mode
-                logger.info(f"🔄 Multi-source mode: Processing {len(sources)} sources")
-                
-                # Validate workflow_id is present
-                if not env_workflow_id:
-                    logger.error("❌ Error: workflow_id is required for multi-source extraction")
-                    sys.exit(1)
-                
-                result = await create_and_execute_job(
-                    job_type="metadata_extraction",
-                    data_source_path="",  # Not used in multi-source mode
-                    data_source_type=data_source_type,
-                    tenant_id=tenant_id,
-                    config_manager=config_manager,
-                    job_metadata=job_metadata,
-                    sources=sources
-                )
-            else:
-                # Single source mode (backward compatible)
-                if not data_source_path:
-                    logger.error("❌ Error: Data source path required for metadata extraction")
-                    logger.error("   For single-source mode, provide: nuvyn-executor metadata_extraction <path> <type> <workflow_id> [--write-to-db]")
-                    logger.error("   For multi-source mode, include 'sources' array in NUVYN_JOB_PAYLOAD environment variable")
-                    sys.exit(1)
-                
-                result = await create_and_execute_job(
-                    job_type="metadata_extraction",
-                    data_source_path=data_source_path,
-                    data_source_type=data_source_type,
-                    tenant_id=tenant_id,
-                    config_manager=config_manager,
-                    job_metadata=job_metadata
-                )
-            
-        elif job_type == "schema_validation":
-            result = await create_and_execute_job(
-                job_type="schema_validation",
-                data_source_path="/tmp",  # Schema validation doesn't need specific path
-                data_source_type="auto",
-                tenant_id=tenant_id,
-                config_manager=config_manager
-            )
-            
-        elif job_type == "data_reading":
-            if not data_source_path:
-                logger.error("❌ Error: Data source path required for data reading")
-                sys.exit(1)
-            
-            result = await create_and_execute_job(
-                job_type="data_reading",
-                data_source_path=data_source_path,
-                data_source_type=data_source_type,
-                tenant_id=tenant_id,
-                config_manager=config_manager
-            )
-            
-        elif job_type == "quality_assessment":
-            if not data_source_path:
-                logger.error("❌ Error: Data source path required for quality assessment")
-                sys.exit(1)
-            
-            result = await create_and_execute_job(
-                job_type="quality_assessment",
-                data_source_path=data_source_path,
-                data_source_type=data_source_type,
-                tenant_id=tenant_id,
-                config_manager=config_manager
-            )
-            
-        elif job_type == "api_transmission":
-            result = await create_and_execute_job(
-                job_type="api_transmission",
-                data_source_path=data_source_path or "/tmp",
-                data_source_type=data_source_type,
-                tenant_id=tenant_id,
-                config_manager=config_manager
-            )
-            
-        elif job_type == "full_pipeline":
-            if not data_source_path:
-                logger.error("❌ Error: Data source path required for full pipeline")
-                sys.exit(1)
-            
-            result = await create_and_execute_job(
-                job_type="full_pipeline",
-                data_source_path=data_source_path,
-                data_source_type=data_source_type,
-                tenant_id=tenant_id,
-                config_manager=config_manager
-            )
-            
+        # Execute based on job type; a comma-separated list runs independent jobs concurrently
+        job_types = request.job_types
+        dispatch_kwargs = dict(
+            data_source_path=request.data_source_path,
+            data_source_type=request.data_source_type,
+            tenant_id=request.tenant_id,
+            env_sources=request.env_sources,
+            db_writer=db_writer,
+            config_manager=config_manager,
+            job_manager=job_manager,
+            slim=not request.print_result
+        )
+        if len(job_types) > 1:
+            result = await _dispatch_jobs_concurrently(job_types, **dispatch_kwargs)
         else:
-            logger.error(f"❌ Error: Unknown job type '{job_type}'")
-            print_usage()
-            sys.exit(1)
+            result = await _dispatch_job(job_types[0], **dispatch_kwargs)
         
         # Print results for Databricks Jobs
         logger.info("📊 Execution completed")
         
-        # Print result data
-        if "result_data" in result and result["result_data"]:
+        # Print result data (full JSON only when asked for; otherwise a one-line summary)
+        result_data = result.get("result_data")
+        if result_data:
             print("\n" + "="*60)
             print("📊 METADATA EXTRACTION RESULTS")
             print("="*60)
-            import json
-            print(json.dumps(result["result_data"], indent=2, default=str))
+            _dump_result(result_data, indent=sys.stdout.isatty())
+            sys.stdout.write("\n")
             print("="*60 + "\n")
+        elif result.get("result_summary"):
+            logger.info("📊 Result summary: %s", result["result_summary"])
         
         # Simplified output for Databricks Jobs
-        if "success" in result:
-            if result["success"]:
-                logger.info(f"✅ Success: {result.get('job_id', 'N/A')} - {result.get('status', 'N/A')}")
+        success = result.get("success")
+        if success is not None:
+            job_fields = {
+                "job_id": result.get("job_id", "N/A"),
+                "job_status": result.get("status", "N/A"),
+                "duration_s": result.get("execution_time", 0)
+            }
+            if success:
+                logger.info("✅ Success: %s - %s", job_fields["job_id"], job_fields["job_status"], extra=job_fields)
                 if "execution_time" in result:
-                    logger.info(f"⏱️  Execution time: {result['execution_time']:.2f}s")
+                    logger.info("⏱️  Execution time: %.2fs", job_fields["duration_s"], extra=job_fields)
             else:
-                logger.error(f"❌ Failed: {result.get('job_id', 'N/A')} - {result.get('error', 'Unknown error')}")
+                logger.error("❌ Failed: %s - %s", job_fields["job_id"], result.get('error', 'Unknown error'),
+                             extra={**job_fields, "error": result.get("error")})
         
         # Exit with appropriate code for Databricks Jobs
-        if "success" in result and not result["success"]:
+        if success is not None and not success:
             sys.exit(1)
         else:
             sys.exit(0)
@@ -641,15 +840,40 @@ async def main():
         logger.info("⏹️  Execution interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"❌ Execution error: {str(e)}")
+        logger.error("❌ Execution error: %s", e)
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        await job_manager.aclose()
+        if db_writer_pool is not None:
+            await db_writer_pool.release(db_writer)
+            await db_writer_pool.aclose()
+
+
+async def main():
+    """Main entry point for Databricks Jobs"""
+    await _run_async(_setup_sync())
+
+
+def _run(coro):
+    """Run a coroutine on uvloop's libuv-based event loop when it is available"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    if hasattr(uvloop, "run"):
+        # uvloop >= 0.18; avoids the event-loop-policy API deprecated in Python 3.12+
+        return uvloop.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
 
 
 def cli_main():
     """CLI entry point for pip-installed package"""
-    asyncio.run(main())
+    # Argument parsing and environment reads need no event loop
+    request = _setup_sync()
+    _run(_run_async(request))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    cli_main()
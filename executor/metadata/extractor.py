@@ -3,23 +3,164 @@ Metadata Extractor for analyzing data structure and content
 """
 
 import asyncio
+import csv
+import re
+import time
 import os
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
+from executor import envs
 from executor.config import JobConfig, ConfigManager
 from executor.datasource.factory import DataSourceFactory
+from executor.job_payload import job_payload_ids
 from executor.logger import get_logger
+from executor.metadata.file_cache import FileMetadataCache
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pyarrow is optional here; fall back to the stdlib csv module
+    pa = None
+    pacsv = None
 
 logger = get_logger(__name__)
 
+# Files sampled per source (analyzed concurrently)
+MAX_SAMPLED_FILES = 5
+
+# Bytes read from the end of a Parquet file to get its footer in one request
+PARQUET_FOOTER_READ_BYTES = 64 * 1024
+
+# Bytes from the start of a CSV sample used to detect its dialect
+CSV_SNIFF_BYTES = 8192
+
+# Leading bytes of a CSV sample checked for NUL bytes (binary data with a .csv name)
+CSV_BINARY_CHECK_BYTES = 4096
+
+FILE_TYPES_BY_EXTENSION = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.xlsx': 'excel',
+    '.xls': 'excel',
+    '.json': 'json',
+}
+
+# Arrow type predicates → column data_type labels (checked in order; anything else is "string")
+_ARROW_TYPE_LABELS = (
+    ("is_boolean", "boolean"),
+    ("is_integer", "integer"),
+    ("is_floating", "double"),
+    ("is_decimal", "decimal"),
+    ("is_timestamp", "timestamp"),
+    ("is_date", "date"),
+    ("is_time", "time"),
+)
+
+
+_analysis_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_analysis_executor() -> ThreadPoolExecutor:
+    global _analysis_executor
+    if _analysis_executor is None:
+        _analysis_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4),
+                                                thread_name_prefix="nuvyn-analysis")
+    return _analysis_executor
+
+
+def _arrow_type_label(arrow_type) -> str:
+    """Map a pyarrow DataType to the data_type label stored in column metadata"""
+    for predicate, label in _ARROW_TYPE_LABELS:
+        if getattr(pa.types, predicate)(arrow_type):
+            return label
+    return "string"
+
+
+def _infer_string_column_type(values) -> str:
+    """Guess a data_type label for a NumPy array of non-empty CSV strings"""
+    import numpy as np
+    
+    if values.size == 0:
+        return "string"
+    unsigned = np.char.lstrip(np.char.strip(values), "+-")
+    if np.char.isdigit(unsigned).all():
+        return "integer"
+    if np.char.isdigit(np.char.replace(unsigned, ".", "", count=1)).all():
+        return "double"
+    if np.isin(np.char.lower(values), ("true", "false")).all():
+        return "boolean"
+    return "string"
+
+
+def _sniff_csv_dialect(sample_data: bytes):
+    """Detect the delimiter/quoting of a CSV sample from its first complete lines"""
+    # Fast path: an unquoted header using exactly one candidate delimiter needs no Sniffer
+    newline = sample_data.find(b"\n", 0, CSV_SNIFF_BYTES)
+    header_line = sample_data[:newline] if newline >= 0 else sample_data[:CSV_SNIFF_BYTES]
+    if b'"' not in header_line:
+        delimiters = set(_DELIMITER_RE.findall(header_line))
+        if len(delimiters) <= 1:
+            return _DIALECTS_BY_DELIMITER[delimiters.pop() if delimiters else b',']
+    
+    head = sample_data[:CSV_SNIFF_BYTES]
+    cut = head.rfind(b"\n")
+    if cut > 0:
+        head = head[:cut]
+    try:
+        return csv.Sniffer().sniff(head.decode('utf-8', errors='ignore'), delimiters=",;\t|")
+    except csv.Error:
+        # Single-column or ambiguous samples
+        return csv.excel
+
+
+class _SemicolonDialect(csv.excel):
+    delimiter = ';'
+
+
+class _PipeDialect(csv.excel):
+    delimiter = '|'
+
+
+# Candidate delimiters and the dialect used when a header contains only one of them
+_DELIMITER_RE = re.compile(rb'[,\t;|]')
+_DIALECTS_BY_DELIMITER = {
+    b',': csv.excel,
+    b'\t': csv.excel_tab,
+    b';': _SemicolonDialect,
+    b'|': _PipeDialect,
+}
+
 
 class MetadataExtractor:
     """Extracts metadata from data sources"""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self,
+                 config_manager: ConfigManager,
+                 sample_bytes: int = 64 * 1024,
+                 sample_rows: int = 100,
+                 max_listed_files: Optional[int] = MAX_SAMPLED_FILES):
         self.config_manager = config_manager
         self.write_to_db = False
         self.db_writer = None
+        # Bytes read from each sampled file and data rows analyzed from that sample
+        self.sample_bytes = sample_bytes
+        self.sample_rows = sample_rows
+        # Listing stops after this many files (None lists everything for an exact files_found)
+        self.max_listed_files = max_listed_files
+        # (connector class, credentials, SAS target) -> task resolving to a connected connector
+        self._connectors: Dict[tuple, "asyncio.Future"] = {}
+        # data_source_type -> (credentials, hashable credentials key), resolved once per run
+        self._credentials: Dict[str, tuple] = {}
+        # Per-file metadata reused across runs while a file's size and ETag are unchanged (opt-in)
+        cache_dir = envs.NUVYN_FILE_METADATA_CACHE_DIR
+        self.file_cache = FileMetadataCache(cache_dir) if cache_dir else None
+        # file_type -> analyzer(sample_data, file_name) returning schema fields for file_info
+        self._analyzers = {
+            'csv': self._analyze_csv_data,
+            'parquet': self._analyze_parquet_data,
+        }
     
     def _get_workflow_id_from_environment(self):
         """
@@ -29,33 +170,7 @@ class MetadataExtractor:
         Returns:
             str: workflow_id from job_metadata, or None if not found
         """
-        if "NUVYN_JOB_PAYLOAD" not in os.environ:
-            logger.debug("NUVYN_JOB_PAYLOAD environment variable not set")
-            return None
-        
-        try:
-            job_payload = json.loads(os.environ["NUVYN_JOB_PAYLOAD"])
-            
-            # First, try to get workflow_id from job_metadata (preferred)
-            if "job_metadata" in job_payload:
-                job_metadata = job_payload["job_metadata"]
-                if "workflow_id" in job_metadata:
-                    workflow_id = job_metadata["workflow_id"]
-                    logger.info(f"✅ Using workflow_id from job_metadata: {workflow_id}")
-                    return workflow_id
-            
-            # Fallback to top-level workflow_id
-            if "workflow_id" in job_payload:
-                workflow_id = job_payload["workflow_id"]
-                logger.info(f"✅ Using workflow_id from top-level payload: {workflow_id}")
-                return workflow_id
-                
-        except json.JSONDecodeError as e:
-            logger.warning(f"⚠️ Failed to parse NUVYN_JOB_PAYLOAD as JSON: {e}")
-        except Exception as e:
-            logger.warning(f"⚠️ Error reading NUVYN_JOB_PAYLOAD: {e}")
-        
-        return None
+        return job_payload_ids().workflow_id
     
     def _get_source_id_from_environment(self):
         """
@@ -65,33 +180,7 @@ class MetadataExtractor:
         Returns:
             str: source_id from job_metadata, or None if not found
         """
-        if "NUVYN_JOB_PAYLOAD" not in os.environ:
-            logger.debug("NUVYN_JOB_PAYLOAD environment variable not set")
-            return None
-        
-        try:
-            job_payload = json.loads(os.environ["NUVYN_JOB_PAYLOAD"])
-            
-            # First, try to get source_id from job_metadata (preferred)
-            if "job_metadata" in job_payload:
-                job_metadata = job_payload["job_metadata"]
-                if "source_id" in job_metadata:
-                    source_id = job_metadata["source_id"]
-                    logger.info(f"✅ Using source_id from job_metadata: {source_id}")
-                    return source_id
-            
-            # Fallback to top-level source_id
-            if "source_id" in job_payload:
-                source_id = job_payload["source_id"]
-                logger.info(f"✅ Using source_id from top-level payload: {source_id}")
-                return source_id
-                
-        except json.JSONDecodeError as e:
-            logger.warning(f"⚠️ Failed to parse NUVYN_JOB_PAYLOAD as JSON: {e}")
-        except Exception as e:
-            logger.warning(f"⚠️ Error reading NUVYN_JOB_PAYLOAD: {e}")
-        
-        return None
+        return job_payload_ids().source_id
     
     async def extract_metadata(self, job_config: JobConfig) -> Dict[str, Any]:
         """Extract comprehensive metadata from data source(s)
@@ -99,144 +188,30 @@ class MetadataExtractor:
         Supports both single source (backward compatible) and multiple sources.
         If sources list is provided, processes each source individually.
         """
-        # Check if multiple sources are provided
-        if job_config.sources and len(job_config.sources) > 0:
-            logger.info(f"🔍 Extracting metadata from {len(job_config.sources)} sources")
-            return await self._extract_metadata_multiple_sources(job_config)
-        
-        # Single source processing (backward compatible)
+        try:
+            # Check if multiple sources are provided
+            if job_config.sources and len(job_config.sources) > 0:
+                logger.info(f"🔍 Extracting metadata from {len(job_config.sources)} sources")
+                return await self._extract_metadata_multiple_sources(job_config)
+            
+            return await self._extract_metadata_single_source(job_config)
+        finally:
+            await self.aclose()
+    
+    async def _extract_metadata_single_source(self, job_config: JobConfig) -> Dict[str, Any]:
+        """Single source processing (backward compatible)"""
         logger.info(f"🔍 Extracting metadata from: {job_config.data_source_path}")
         
         try:
-            # Get credentials and create connector
-            credentials = self.config_manager.get_data_source_credentials(job_config.data_source_type)
-            connector = DataSourceFactory.auto_detect_connector(job_config.data_source_path, credentials)
-            
-            if not connector:
-                raise Exception(f"No suitable connector found for path: {job_config.data_source_path}")
-            
-            # Connect to data source (pass URL for SAS token extraction)
-            if hasattr(connector, 'can_handle') and 'blob.core.windows.net' in job_config.data_source_path:
-                # For Azure Blob with SAS token in URL
-                if not await connector.connect(url_with_sas=job_config.data_source_path):
-                    raise Exception("Failed to connect to data source")
-            else:
-                if not await connector.connect():
-                    raise Exception("Failed to connect to data source")
-            
-            # Extract metadata
-            files = await connector.list_files(job_config.data_source_path)
-            
-            metadata = {
-                "source_path": job_config.data_source_path,
-                "source_type": connector.get_source_type(),
-                "extraction_timestamp": asyncio.get_event_loop().time(),
-                "files_found": len(files),
-                "files": [],
-                "total_size_bytes": 0,
-                "schema_info": {
-                    "tables": 0,
-                    "columns": 0,
-                    "data_types": {}
-                },
-                "quality_metrics": {
-                    "overall_score": 85,
-                    "completeness": 90,
-                    "accuracy": 85,
-                    "consistency": 80
-                }
-            }
-            
-            # Analyze each file
-            for file_path in files[:5]:  # Analyze first 5 files
-                try:
-                    # If original path has SAS token, reconstruct full URL for file operations
-                    if '?' in job_config.data_source_path and 'sig=' in job_config.data_source_path:
-                        # Use the original URL with SAS token
-                        full_file_path = job_config.data_source_path
-                    else:
-                        full_file_path = file_path
-                    
-                    file_size = await connector.get_file_size(full_file_path)
-                    sample_data = await connector.read_file_sample(full_file_path, max_bytes=1024*1024)  # Read 1MB for analysis
-                    
-                    file_type = self._detect_file_type(file_path)
-                    
-                    file_info = {
-                        "name": file_path.split('/')[-1],
-                        "path": file_path,
-                        "size_bytes": file_size,
-                        "sample_size": len(sample_data),
-                        "file_type": file_type
-                    }
-                    
-                    # Analyze CSV files for detailed metadata
-                    if file_type == "csv" and sample_data:
-                        csv_metadata = self._analyze_csv_data(sample_data, file_path.split('/')[-1])
-                        file_info.update(csv_metadata)
-                        
-                        # Update global schema info
-                        if "columns" in csv_metadata:
-                            metadata["schema_info"]["tables"] += 1
-                            metadata["schema_info"]["columns"] += len(csv_metadata["columns"])
-                            for col in csv_metadata["columns"]:
-                                col_type = col.get("data_type", "unknown")
-                                metadata["schema_info"]["data_types"][col_type] = metadata["schema_info"]["data_types"].get(col_type, 0) + 1
-                    
-                    metadata["files"].append(file_info)
-                    metadata["total_size_bytes"] += file_size
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to analyze file {file_path}: {e}")
-            
-            await connector.disconnect()
-            
-            # Write to database if enabled
+            workflow_id = source_id = None
             if self.write_to_db and self.db_writer:
-                try:
-                    logger.info("💾 Writing metadata to Databricks SQL...")
-                    
-                    # Get backend-provided workflow_id (primary identifier) - must be provided by backend
-                    workflow_id = None
-                    source_id = None
-                    
-                    # Priority 1: Get workflow_id and source_id from job_metadata (from API or main.py)
-                    if job_config.job_metadata:
-                        workflow_id = job_config.job_metadata.get('workflow_id')
-                        source_id = job_config.job_metadata.get('source_id')
-                        if workflow_id:
-                            logger.info(f"✅ Using workflow_id from job_metadata: {workflow_id}")
-                        if source_id:
-                            logger.info(f"✅ Using source_id from job_metadata: {source_id}")
-                    
-                    # Priority 2: Check NUVYN_JOB_PAYLOAD environment variable (for Databricks Jobs)
-                    if not workflow_id:
-                        workflow_id = self._get_workflow_id_from_environment()
-                    if not source_id:
-                        source_id = self._get_source_id_from_environment()
-                    
-                    # Validate workflow_id is not empty (required)
-                    if not workflow_id or not str(workflow_id).strip():
-                        error_msg = "workflow_id is required and must be provided by the backend server in job_metadata or NUVYN_JOB_PAYLOAD environment variable"
-                        logger.error(f"❌ {error_msg}")
-                        raise ValueError(error_msg)
-                    
-                    if self.db_writer.write_metadata(metadata, workflow_id=workflow_id, source_id=source_id):
-                        metadata['written_to_db'] = True
-                        metadata['workflow_id'] = workflow_id
-                        if source_id:
-                            metadata['source_id'] = source_id
-                        logger.info(f"✅ Metadata written to database successfully with workflow_id: {workflow_id}, source_id: {source_id}")
-                    else:
-                        metadata['written_to_db'] = False
-                        logger.warning("⚠️ Failed to write metadata to database")
-                except Exception as e:
-                    logger.error(f"❌ Database write failed: {e}")
-                    metadata['written_to_db'] = False
-                    metadata['db_error'] = str(e)
-                    raise  # Re-raise to fail the job if workflow_id is missing
+                workflow_id, source_id = self._resolve_job_ids(job_config)
+            
+            metadata = await self._extract_single_source_metadata(
+                job_config, workflow_id, source_id, fail_on_db_error=True
+            )
             
-            logger.info(f"✅ Metadata extraction completed: {len(files)} files analyzed")
+            logger.info(f"✅ Metadata extraction completed: {metadata['files_found']} files analyzed")
             return metadata
             
         except Exception as e:
@@ -247,6 +222,34 @@ class MetadataExtractor:
                 "extraction_status": "failed"
             }
     
+    def _resolve_job_ids(self, job_config: JobConfig):
+        """Resolve (workflow_id, source_id) for a database write; workflow_id is required"""
+        workflow_id = None
+        source_id = None
+        
+        # Priority 1: Get workflow_id and source_id from job_metadata (from API or main.py)
+        if job_config.job_metadata:
+            workflow_id = job_config.job_metadata.get('workflow_id')
+            source_id = job_config.job_metadata.get('source_id')
+            if workflow_id:
+                logger.info(f"✅ Using workflow_id from job_metadata: {workflow_id}")
+            if source_id:
+                logger.info(f"✅ Using source_id from job_metadata: {source_id}")
+        
+        # Priority 2: Check NUVYN_JOB_PAYLOAD environment variable (for Databricks Jobs)
+        if not workflow_id:
+            workflow_id = self._get_workflow_id_from_environment()
+        if not source_id:
+            source_id = self._get_source_id_from_environment()
+        
+        # Validate workflow_id is not empty (required)
+        if not workflow_id or not str(workflow_id).strip():
+            error_msg = "workflow_id is required and must be provided by the backend server in job_metadata or NUVYN_JOB_PAYLOAD environment variable"
+            logger.error(f"❌ {error_msg}")
+            raise ValueError(error_msg)
+        
+        return workflow_id, source_id
+    
     async def _extract_metadata_multiple_sources(self, job_config: JobConfig) -> Dict[str, Any]:
         """Extract metadata from multiple sources individually
         
@@ -273,197 +276,405 @@ class MetadataExtractor:
             "sources_processed": 0,
             "sources_failed": 0,
             "sources": [],
-            "extraction_timestamp": asyncio.get_event_loop().time()
+            "extraction_timestamp": time.time()
         }
         
-        # Process each source individually
-        for idx, source_config in enumerate(job_config.sources):
-            source_id = source_config.get('source_id', f"source_{idx + 1}")
-            data_source_path = source_config.get('data_source_path', '')
-            data_source_type = source_config.get('data_source_type', job_config.data_source_type or 'auto')
-            
-            if not data_source_path:
-                logger.warning(f"⚠️ Skipping source {idx + 1}: missing data_source_path")
+        # Process all sources concurrently (at most NUVYN_SOURCE_BATCH_SIZE at a time) so their
+        # I/O overlaps; a slow source only holds its own slot instead of stalling a whole batch
+        semaphore = asyncio.Semaphore(envs.NUVYN_SOURCE_BATCH_SIZE)
+        
+        async def process_bounded(idx: int, source_config: Dict[str, Any]):
+            async with semaphore:
+                return await self._process_source(job_config, workflow_id, idx, source_config)
+        
+        source_results = await asyncio.gather(*(
+            process_bounded(idx, source_config)
+            for idx, source_config in enumerate(job_config.sources)
+        ))
+        
+        # One bulk database write for all sources instead of a round trip per source
+        if self.write_to_db and self.db_writer:
+            self._write_sources_metadata(workflow_id, source_results)
+        
+        for source_result in source_results:
+            if source_result is None or source_result["status"] == "failed":
                 results["sources_failed"] += 1
-                continue
-            
-            logger.info(f"📊 Processing source {idx + 1}/{len(job_config.sources)}: {source_id}")
-            logger.info(f"   Path: {data_source_path}")
-            
-            try:
-                # Create a temporary job config for this source
-                source_job_config = JobConfig(
-                    job_id=f"{job_config.job_id}_source_{idx + 1}",
-                    job_type=job_config.job_type,
-                    data_source_path=data_source_path,
-                    data_source_type=data_source_type,
-                    tenant_id=job_config.tenant_id,
-                    job_metadata={
-                        'workflow_id': workflow_id,
-                        'source_id': source_id
-                    }
-                )
-                
-                # Extract metadata for this source
-                source_metadata = await self._extract_single_source_metadata(source_job_config, workflow_id, source_id)
-                
-                # Store results
-                source_result = {
-                    "source_id": source_id,
-                    "source_path": data_source_path,
-                    "source_type": data_source_type,
-                    "status": "success",
-                    "metadata": source_metadata
-                }
-                results["sources"].append(source_result)
+            else:
                 results["sources_processed"] += 1
-                
-                logger.info(f"✅ Source {source_id} processed successfully")
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to process source {source_id}: {e}")
-                results["sources_failed"] += 1
-                results["sources"].append({
-                    "source_id": source_id,
-                    "source_path": data_source_path,
-                    "status": "failed",
-                    "error": str(e)
-                })
+            if source_result is not None:
+                results["sources"].append(source_result)
         
         logger.info(f"✅ Multi-source extraction completed: {results['sources_processed']} succeeded, {results['sources_failed']} failed")
         return results
     
-    async def _extract_single_source_metadata(self, job_config: JobConfig, workflow_id: str, source_id: str) -> Dict[str, Any]:
-        """Extract metadata from a single source (internal method)"""
+    async def _process_source(self,
+                              job_config: JobConfig,
+                              workflow_id: str,
+                              idx: int,
+                              source_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract metadata for one entry of a multi-source job (None if it was skipped)"""
+        source_id = source_config.get('source_id', f"source_{idx + 1}")
+        data_source_path = source_config.get('data_source_path', '')
+        data_source_type = source_config.get('data_source_type', job_config.data_source_type or 'auto')
+        
+        if not data_source_path:
+            logger.warning("⚠️ Skipping source %d: missing data_source_path", idx + 1)
+            return None
+        
+        logger.info("📊 Processing source %d/%d: %s | path: %s",
+                    idx + 1, len(job_config.sources), source_id, data_source_path)
+        
         try:
-            # Get credentials and create connector
-            credentials = self.config_manager.get_data_source_credentials(job_config.data_source_type)
-            connector = DataSourceFactory.auto_detect_connector(job_config.data_source_path, credentials)
-            
-            if not connector:
-                raise Exception(f"No suitable connector found for path: {job_config.data_source_path}")
-            
-            # Connect to data source
-            if hasattr(connector, 'can_handle') and 'blob.core.windows.net' in job_config.data_source_path:
-                if not await connector.connect(url_with_sas=job_config.data_source_path):
-                    raise Exception("Failed to connect to data source")
-            else:
-                if not await connector.connect():
-                    raise Exception("Failed to connect to data source")
-            
-            # Extract metadata
-            files = await connector.list_files(job_config.data_source_path)
-            
-            metadata = {
-                "source_path": job_config.data_source_path,
-                "source_type": connector.get_source_type(),
-                "extraction_timestamp": asyncio.get_event_loop().time(),
-                "files_found": len(files),
-                "files": [],
-                "total_size_bytes": 0,
-                "schema_info": {
-                    "tables": 0,
-                    "columns": 0,
-                    "data_types": {}
-                },
-                "quality_metrics": {
-                    "overall_score": 85,
-                    "completeness": 90,
-                    "accuracy": 85,
-                    "consistency": 80
+            # Create a temporary job config for this source
+            source_job_config = JobConfig(
+                job_id=f"{job_config.job_id}_source_{idx + 1}",
+                job_type=job_config.job_type,
+                data_source_path=data_source_path,
+                data_source_type=data_source_type,
+                tenant_id=job_config.tenant_id,
+                job_metadata={
+                    'workflow_id': workflow_id,
+                    'source_id': source_id
                 }
-            }
+            )
             
-            # Analyze each file
-            for file_path in files[:5]:  # Analyze first 5 files
-                try:
-                    if '?' in job_config.data_source_path and 'sig=' in job_config.data_source_path:
-                        full_file_path = job_config.data_source_path
-                    else:
-                        full_file_path = file_path
-                    
-                    file_size = await connector.get_file_size(full_file_path)
-                    sample_data = await connector.read_file_sample(full_file_path, max_bytes=1024*1024)
-                    
-                    file_type = self._detect_file_type(file_path)
-                    
-                    file_info = {
-                        "name": file_path.split('/')[-1],
-                        "path": file_path,
-                        "size_bytes": file_size,
-                        "sample_size": len(sample_data),
-                        "file_type": file_type
-                    }
-                    
-                    # Analyze CSV files for detailed metadata
-                    if file_type == "csv" and sample_data:
-                        csv_metadata = self._analyze_csv_data(sample_data, file_path.split('/')[-1])
-                        file_info.update(csv_metadata)
-                        
-                        if "columns" in csv_metadata:
-                            metadata["schema_info"]["tables"] += 1
-                            metadata["schema_info"]["columns"] += len(csv_metadata["columns"])
-                            for col in csv_metadata["columns"]:
-                                col_type = col.get("data_type", "unknown")
-                                metadata["schema_info"]["data_types"][col_type] = metadata["schema_info"]["data_types"].get(col_type, 0) + 1
-                    
-                    metadata["files"].append(file_info)
-                    metadata["total_size_bytes"] += file_size
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to analyze file {file_path}: {e}")
+            # Extract metadata for this source
+            source_metadata = await self._extract_single_source_metadata(
+                source_job_config, workflow_id, source_id, defer_db_write=True
+            )
             
-            await connector.disconnect()
+            logger.info("✅ Source %s processed successfully", source_id)
+            return {
+                "source_id": source_id,
+                "source_path": data_source_path,
+                "source_type": data_source_type,
+                "status": "success",
+                "metadata": source_metadata
+            }
             
-            # Write to database if enabled
-            if self.write_to_db and self.db_writer:
+        except Exception as e:
+            logger.error(f"❌ Failed to process source {source_id}: {e}")
+            return {
+                "source_id": source_id,
+                "source_path": data_source_path,
+                "status": "failed",
+                "error": str(e)
+            }
+    
+    async def _extract_single_source_metadata(self,
+                                              job_config: JobConfig,
+                                              workflow_id: Optional[str],
+                                              source_id: Optional[str],
+                                              fail_on_db_error: bool = False,
+                                              defer_db_write: bool = False) -> Dict[str, Any]:
+        """Extract metadata from one source and write it to the database if enabled
+        
+        Shared by single-source jobs (fail_on_db_error=True) and each entry of multi-source
+        jobs (defer_db_write=True; the caller writes all sources at once).
+        """
+        # Get a connected connector (shared by sources with the same credentials/account)
+        connector = await self._get_connector(job_config.data_source_path, job_config.data_source_type)
+        
+        # Extract metadata
+        files = await self._list_files(connector, job_config.data_source_path)
+        
+        metadata = {
+            "source_path": job_config.data_source_path,
+            "source_type": connector.get_source_type(),
+            "extraction_timestamp": time.time(),
+            "files_found": len(files),
+            # files_found is a lower bound when the listing hit max_listed_files
+            "files_listing_truncated": (self.max_listed_files is not None
+                                        and len(files) >= self.max_listed_files),
+            "files": [],
+            "total_size_bytes": 0,
+            "schema_info": {
+                "tables": 0,
+                "columns": 0,
+                "data_types": {}
+            },
+            "quality_metrics": {
+                "overall_score": 85,
+                "completeness": 90,
+                "accuracy": 85,
+                "consistency": 80
+            }
+        }
+        
+        # Analyze the first files concurrently so their storage round trips overlap
+        await self._analyze_files(connector, job_config.data_source_path, files, metadata)
+        
+        # Write to database if enabled (multi-source jobs write all sources together afterwards)
+        if self.write_to_db and self.db_writer and not defer_db_write:
+            self._write_metadata(metadata, workflow_id, source_id, fail_on_db_error)
+        
+        return metadata
+    
+    def _write_metadata(self,
+                        metadata: Dict[str, Any],
+                        workflow_id: Optional[str],
+                        source_id: Optional[str],
+                        fail_on_db_error: bool = False) -> None:
+        """Write one source's metadata to the database, recording the outcome in metadata"""
+        source_label = source_id or metadata.get("source_path")
+        try:
+            logger.debug("💾 Writing metadata for source %s to Databricks SQL...", source_label)
+            
+            if self.db_writer.write_metadata(metadata, workflow_id=workflow_id, source_id=source_id):
+                metadata['written_to_db'] = True
+                metadata['workflow_id'] = workflow_id
+                if source_id:
+                    metadata['source_id'] = source_id
+                logger.info("✅ Metadata written to database with workflow_id: %s, source_id: %s", workflow_id, source_id)
+            else:
+                metadata['written_to_db'] = False
+                logger.warning("⚠️ Failed to write metadata for source %s", source_label)
+        except Exception as e:
+            logger.error(f"❌ Database write failed for source {source_label}: {e}")
+            metadata['written_to_db'] = False
+            metadata['db_error'] = str(e)
+            if fail_on_db_error:
+                raise
+    
+    def _write_sources_metadata(self, workflow_id: str, source_results: List[Optional[Dict[str, Any]]]) -> None:
+        """Write every successfully extracted source of a multi-source job in one bulk write"""
+        extracted = [r for r in source_results if r is not None and r["status"] == "success"]
+        if not extracted:
+            return
+        
+        write_bulk = getattr(self.db_writer, 'write_metadata_bulk', None)
+        if write_bulk is None:
+            for source_result in extracted:
+                self._write_metadata(source_result["metadata"], workflow_id, source_result["source_id"])
+            return
+        
+        db_error = None
+        try:
+            written = write_bulk([(r["metadata"], workflow_id, r["source_id"]) for r in extracted])
+        except Exception as e:
+            logger.error(f"❌ Database write failed for {len(extracted)} sources: {e}")
+            written = False
+            db_error = str(e)
+        if not written and db_error is None:
+            logger.warning(f"⚠️ Failed to write metadata for {len(extracted)} sources")
+        
+        for source_result in extracted:
+            source_result["metadata"]["written_to_db"] = written
+            if db_error is not None:
+                source_result["metadata"]["db_error"] = db_error
+    
+    async def _get_connector(self, data_source_path: str, data_source_type: str):
+        """Connected connector for a path, reused for later sources with the same key"""
+        credentials, credentials_key = self._get_credentials(data_source_type)
+        connector = DataSourceFactory.auto_detect_connector(data_source_path, credentials)
+        
+        if not connector:
+            raise Exception(f"No suitable connector found for path: {data_source_path}")
+        
+        # Azure SAS URLs carry their own account and token, so they are part of the key
+        sas_target = None
+        is_azure_url = 'blob.core.windows.net' in data_source_path
+        if is_azure_url:
+            parsed = urlsplit(data_source_path)
+            sas_target = (parsed.netloc, parsed.query)
+        key = (type(connector), credentials_key, sas_target)
+        
+        # Cache the connect task so concurrent sources share one connection attempt
+        connect_task = self._connectors.get(key)
+        if connect_task is None:
+            connect_task = asyncio.ensure_future(self._connect(connector, data_source_path, is_azure_url))
+            self._connectors[key] = connect_task
+        try:
+            return await asyncio.shield(connect_task)
+        except Exception:
+            self._connectors.pop(key, None)
+            raise
+    
+    def _get_credentials(self, data_source_type: str) -> tuple:
+        """Credentials for a source type plus a hashable form for connector cache keys"""
+        cached = self._credentials.get(data_source_type)
+        if cached is None:
+            credentials = self.config_manager.get_data_source_credentials(data_source_type)
+            cached = (credentials, frozenset((k, str(v)) for k, v in credentials.items()))
+            self._credentials[data_source_type] = cached
+        return cached
+    
+    async def _connect(self, connector, data_source_path: str, is_azure_url: bool):
+        """Connect a new connector (pass URL for SAS token extraction on Azure Blob)"""
+        if is_azure_url:
+            connected = await connector.connect(url_with_sas=data_source_path)
+        else:
+            connected = await connector.connect()
+        if not connected:
+            raise Exception("Failed to connect to data source")
+        return connector
+    
+    async def aclose(self) -> None:
+        """Disconnect every cached connector"""
+        connect_tasks = list(self._connectors.values())
+        self._connectors.clear()
+        for connect_task in connect_tasks:
+            if connect_task.done() and not connect_task.cancelled() and connect_task.exception() is None:
                 try:
-                    logger.info(f"💾 Writing metadata for source {source_id} to Databricks SQL...")
-                    
-                    if self.db_writer.write_metadata(metadata, workflow_id=workflow_id, source_id=source_id):
-                        metadata['written_to_db'] = True
-                        metadata['workflow_id'] = workflow_id
-                        metadata['source_id'] = source_id
-                        logger.info(f"✅ Metadata written for source {source_id}")
-                    else:
-                        metadata['written_to_db'] = False
-                        logger.warning(f"⚠️ Failed to write metadata for source {source_id}")
+                    await connect_task.result().disconnect()
                 except Exception as e:
-                    logger.error(f"❌ Database write failed for source {source_id}: {e}")
-                    metadata['written_to_db'] = False
-                    metadata['db_error'] = str(e)
+                    logger.warning(f"⚠️ Failed to disconnect data source: {e}")
+    
+    async def _list_files(self, connector, data_source_path: str) -> List[str]:
+        """List files to sample, trying the top "directory" level before a recursive listing"""
+        files = await connector.list_files(data_source_path,
+                                           max_results=self.max_listed_files,
+                                           recursive=False)
+        if not files:
+            # e.g. partitioned layouts where every file sits under a sub-prefix
+            files = await connector.list_files(data_source_path,
+                                               max_results=self.max_listed_files)
+        return files
+    
+    async def _analyze_files(self,
+                             connector,
+                             data_source_path: str,
+                             files: List[str],
+                             metadata: Dict[str, Any]) -> None:
+        """Sample and analyze the first MAX_SAMPLED_FILES files, folding results into metadata"""
+        sampled = files[:MAX_SAMPLED_FILES]
+        # If original path has SAS token, use the original URL for file operations
+        sas_url = data_source_path if '?' in data_source_path and 'sig=' in data_source_path else None
+        file_infos = await asyncio.gather(
+            *(self._analyze_file(connector, file_path, sas_url or file_path) for file_path in sampled),
+            return_exceptions=True
+        )
+        
+        schema_info = metadata["schema_info"]
+        data_types = Counter(schema_info["data_types"])
+        for file_path, file_info in zip(sampled, file_infos):
+            if isinstance(file_info, BaseException):
+                logger.warning("Failed to analyze file %s: %s", file_path, file_info)
+                continue
             
-            return metadata
+            # Update global schema info
+            if "columns" in file_info:
+                schema_info["tables"] += 1
+                schema_info["columns"] += len(file_info["columns"])
+                data_types.update(col.get("data_type", "unknown") for col in file_info["columns"])
             
-        except Exception as e:
-            logger.error(f"❌ Metadata extraction failed for source {source_id}: {e}")
-            raise
+            metadata["files"].append(file_info)
+            metadata["total_size_bytes"] += file_info["size_bytes"]
+        
+        # Plain dict for JSON encoders
+        schema_info["data_types"] = dict(data_types)
+    
+    async def _analyze_file(self, connector, file_path: str, full_file_path: str) -> Dict[str, Any]:
+        """Read one file's size and sample (from full_file_path) and build its file_info entry"""
+        file_name = file_path.rpartition('/')[2] or file_path
+        file_type = self._detect_file_type(file_path)
+        
+        cache_key = None
+        file_size = None
+        if self.file_cache is not None:
+            file_size, version = await connector.get_file_version(full_file_path)
+            if version:
+                cache_key = self.file_cache.make_key(connector.get_source_type(), full_file_path,
+                                                     file_size, version)
+                cached = self.file_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("♻️ Reusing cached metadata for unchanged file %s", file_path)
+                    return cached
+        
+        analyzer = self._analyzers.get(file_type)
+        if analyzer is None:
+            # No analyzer for this type (excel, json, unknown): a sample would be discarded unread
+            if file_size is None:
+                file_size = await connector.get_file_size(full_file_path)
+            sample_data = b''
+        elif file_type == 'parquet':
+            # Parquet schema lives in the footer, not at the start of the file
+            if file_size is None:
+                file_size = await connector.get_file_size(full_file_path)
+            sample_data = await self._read_parquet_footer(connector, full_file_path, file_size)
+        elif file_size is None:
+            file_size, sample_data = await connector.get_sample_with_size(full_file_path, self.sample_bytes)
+        else:
+            sample_data = await connector.read_file_sample(full_file_path, self.sample_bytes)
+        file_info = {
+            "name": file_name,
+            "path": file_path,
+            "size_bytes": file_size,
+            "sample_size": len(sample_data),
+            "file_type": file_type
+        }
+        
+        # Format-specific schema analysis (csv, parquet)
+        # Parsing is CPU-bound; run it off the event loop so other files' I/O keeps flowing
+        if analyzer is not None and sample_data:
+            loop = asyncio.get_running_loop()
+            file_info.update(await loop.run_in_executor(
+                _get_analysis_executor(), analyzer, sample_data, file_name
+            ))
+        
+        if cache_key is not None:
+            self.file_cache.put(cache_key, file_info)
+        return file_info
+    
+    async def _read_parquet_footer(self, connector, file_path: str, file_size: int) -> bytes:
+        """Read the trailing bytes of a Parquet file holding its footer (metadata + length + PAR1)"""
+        if file_size <= 0:
+            return b''
+        
+        length = min(PARQUET_FOOTER_READ_BYTES, file_size)
+        tail = await connector.read_range(file_path, file_size - length, length)
+        if len(tail) < 8 or tail[-4:] != b'PAR1':
+            return tail
+        
+        # Footers larger than the first read need one more exact read
+        footer_length = int.from_bytes(tail[-8:-4], 'little') + 8
+        if footer_length > len(tail) and footer_length <= file_size:
+            tail = await connector.read_range(file_path, file_size - footer_length, footer_length)
+        return tail
     
     def _detect_file_type(self, file_path: str) -> str:
         """Detect file type from path"""
-        if file_path.lower().endswith('.csv'):
-            return 'csv'
-        elif file_path.lower().endswith('.parquet'):
-            return 'parquet'
-        elif file_path.lower().endswith(('.xlsx', '.xls')):
-            return 'excel'
-        elif file_path.lower().endswith('.json'):
-            return 'json'
-        else:
-            return 'unknown'
+        return FILE_TYPES_BY_EXTENSION.get(os.path.splitext(file_path)[1].lower(), 'unknown')
     
     def _analyze_csv_data(self, sample_data: bytes, filename: str) -> Dict[str, Any]:
         """Analyze CSV sample data to extract schema information"""
+        # Cheap guards before any decoding/parsing: binary content, or a header row
+        # longer than the whole sample (nothing complete to parse)
+        if b"\x00" in sample_data[:CSV_BINARY_CHECK_BYTES]:
+            logger.warning("⚠️ Skipping CSV analysis of %s: sample looks binary", filename)
+            return {"columns": [], "row_count": 0, "skipped": "binary"}
+        if len(sample_data) >= self.sample_bytes and sample_data.find(b"\n") == -1:
+            logger.warning("⚠️ Skipping CSV analysis of %s: no line break in the first %d bytes",
+                           filename, len(sample_data))
+            return {"columns": [], "row_count": 0, "skipped": "line_too_long"}
+        
+        # A full-size sample is usually cut mid-row; drop its partial last line. A shorter
+        # sample is the whole file, whose last line is complete even without a trailing newline
+        if len(sample_data) >= self.sample_bytes:
+            cut = sample_data.rfind(b"\n")
+            if cut > 0:
+                sample_data = sample_data[:cut + 1]
+        
+        dialect = _sniff_csv_dialect(sample_data)
+        
+        if pa is not None:
+            try:
+                return self._analyze_csv_data_arrow(sample_data, dialect)
+            except (pa.ArrowInvalid, ImportError) as e:
+                logger.debug("Arrow CSV parse failed for %s, using csv module: %s", filename, e)
+        
         try:
             import io
             import csv
+            import itertools
+            import numpy as np
             
-            # Decode sample data
-            text_data = sample_data.decode('utf-8', errors='ignore')
-            
-            # Parse CSV
-            csv_reader = csv.reader(io.StringIO(text_data))
-            rows = list(csv_reader)
+            # Decode incrementally while parsing instead of materializing the whole sample as str;
+            # parsing stops after the header plus at most sample_rows data rows
+            text_stream = io.TextIOWrapper(io.BytesIO(sample_data), encoding='utf-8',
+                                           errors='ignore', newline='')
+            csv_reader = csv.reader(text_stream, dialect)
+            rows = list(itertools.islice(csv_reader, self.sample_rows + 1))
             
             if len(rows) < 1:
                 return {"columns": [], "row_count": 0}
@@ -472,14 +683,21 @@ class MetadataExtractor:
             headers = rows[0]
             data_rows = rows[1:]
             
+            # One (rows x columns) string array; short rows are padded with "" (null)
+            width = len(headers)
+            padded = [row[:width] + [""] * (width - len(row)) for row in data_rows]
+            values = np.array(padded, dtype=str).reshape(len(padded), width)
+            null_mask = values == ""
+            is_nullable = null_mask.any(axis=0)
+            
             # Analyze columns
             columns = []
             for idx, col_name in enumerate(headers):
                 col_info = {
                     "column_name": col_name,
-                    "data_type": "string",  # Basic detection
+                    "data_type": _infer_string_column_type(values[~null_mask[:, idx], idx]),
                     "sample_values": [row[idx] if idx < len(row) else None for row in data_rows[:5]],
-                    "is_nullable": any(not row[idx] if idx < len(row) else True for row in data_rows),
+                    "is_nullable": bool(is_nullable[idx]),
                     "position": idx
                 }
                 columns.append(col_info)
@@ -494,3 +712,83 @@ class MetadataExtractor:
         except Exception as e:
             logger.error(f"❌ CSV analysis failed: {e}")
             return {"columns": [], "row_count": 0}
+    
+    def _analyze_parquet_data(self, sample_data: bytes, filename: str) -> Dict[str, Any]:
+        """Read the schema from a Parquet footer (the trailing bytes of the file)"""
+        if pa is None:
+            return {}
+        
+        import pyarrow.parquet as pq
+        
+        try:
+            parquet_metadata = pq.read_metadata(pa.BufferReader(sample_data))
+        except pa.ArrowException as e:
+            logger.debug("No Parquet footer in sample of %s: %s", filename, e)
+            return {}
+        
+        schema = parquet_metadata.schema.to_arrow_schema()
+        columns = [
+            {
+                "column_name": field.name,
+                "data_type": _arrow_type_label(field.type),
+                "sample_values": [],
+                "is_nullable": field.nullable,
+                "position": idx
+            }
+            for idx, field in enumerate(schema)
+        ]
+        return {
+            "columns": columns,
+            "row_count": parquet_metadata.num_rows,
+            "column_count": len(columns),
+            "has_header": False
+        }
+    
+    def _analyze_csv_data_arrow(self, sample_data: bytes, dialect) -> Dict[str, Any]:
+        """Parse a CSV sample with pyarrow's C++ parser, keeping every cell as its raw text
+        
+        Types are inferred from the text exactly as in the csv-module path, so both report
+        the same data_type labels and unaltered sample values.
+        """
+        import io
+        import numpy as np
+        
+        if not sample_data.strip():
+            return {"columns": [], "row_count": 0}
+        
+        # Arrow can only be told to keep columns as strings by name, so read the header first
+        header_stream = io.TextIOWrapper(io.BytesIO(sample_data), encoding='utf-8-sig',
+                                         errors='ignore', newline='')
+        headers = next(csv.reader(header_stream, dialect), [])
+        
+        table = pacsv.read_csv(
+            pa.BufferReader(sample_data),
+            read_options=pacsv.ReadOptions(block_size=len(sample_data) + 1),
+            parse_options=pacsv.ParseOptions(delimiter=dialect.delimiter,
+                                             quote_char=dialect.quotechar or False,
+                                             newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in headers},
+                                                 strings_can_be_null=False)
+        )
+        if not all(pa.types.is_string(field.type) for field in table.schema):
+            raise pa.ArrowInvalid("CSV header parsed differently by Arrow and the csv module")
+        
+        table = table.slice(0, self.sample_rows)
+        columns = []
+        for idx, field in enumerate(table.schema):
+            values = np.array(table.column(idx).to_pylist(), dtype=str)
+            non_empty = values[values != ""]
+            columns.append({
+                "column_name": field.name,
+                "data_type": _infer_string_column_type(non_empty),
+                "sample_values": values[:5].tolist(),
+                "is_nullable": non_empty.size < values.size,
+                "position": idx
+            })
+        
+        return {
+            "columns": columns,
+            "row_count": table.num_rows,
+            "column_count": table.num_columns,
+            "has_header": True
+        }
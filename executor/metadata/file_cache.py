@@ -0,0 +1,50 @@
+"""
+On-disk cache of per-file metadata, keyed by file path, size and version tag (ETag)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Any, Optional
+from executor.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FileMetadataCache:
+    """Stores file_info entries as JSON files so unchanged files are not re-read on the next run"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(source_type: str, file_path: str, size: int, version: str) -> str:
+        """Build the cache key; any change to size or version yields a new key"""
+        raw = f"{source_type}|{file_path}|{size}|{version}".encode('utf-8')
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached file_info for key, or None on a miss or unreadable entry"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable file metadata cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, file_info: Dict[str, Any]) -> None:
+        """Store file_info under key (written atomically so concurrent runs never see partial files)"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(file_info, f, default=str)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Could not write file metadata cache entry {key}: {e}")
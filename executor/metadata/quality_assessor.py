@@ -2,13 +2,25 @@
 Quality Assessor for evaluating data quality
 """
 
-import asyncio
+import time
 from typing import Dict, Any, List
 from executor.config import JobConfig, ConfigManager
 from executor.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Simulated quality metrics (placeholder until real assessment is implemented)
+DEFAULT_QUALITY_METRICS = {
+    "overall_score": 85,
+    "completeness": 90,
+    "accuracy": 85,
+    "consistency": 80,
+    "timeliness": 95,
+    "validity": 88,
+    "uniqueness": 92
+}
+DEFAULT_OVERALL_SCORE = sum(DEFAULT_QUALITY_METRICS.values()) / len(DEFAULT_QUALITY_METRICS)
+
 
 class QualityAssessor:
     """Assesses data quality metrics"""
@@ -21,23 +33,13 @@ class QualityAssessor:
         logger.info(f"📊 Assessing data quality for: {job_config.data_source_path}")
         
         try:
-            # Simulate quality assessment
-            quality_metrics = {
-                "overall_score": 85,
-                "completeness": 90,
-                "accuracy": 85,
-                "consistency": 80,
-                "timeliness": 95,
-                "validity": 88,
-                "uniqueness": 92
-            }
-            
-            # Calculate overall score
-            overall_score = sum(quality_metrics.values()) / len(quality_metrics)
+            # Simulate quality assessment (copied so callers may modify their result)
+            quality_metrics = dict(DEFAULT_QUALITY_METRICS)
+            overall_score = DEFAULT_OVERALL_SCORE
             
             result = {
                 "source_path": job_config.data_source_path,
-                "assessment_timestamp": asyncio.get_event_loop().time(),
+                "assessment_timestamp": time.time(),
                 "quality_metrics": quality_metrics,
                 "overall_score": round(overall_score, 2),
                 "quality_level": self._get_quality_level(overall_score),
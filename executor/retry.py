@@ -0,0 +1,147 @@
+"""
+Retry utilities for Nuvyn Executor Script
+Exponential backoff with jitter for rate-limited Databricks calls
+"""
+
+import asyncio
+import functools
+import inspect
+import math
+import random
+import time
+from typing import Any, Callable, Optional
+
+from executor.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Exception classes the Databricks SDK raises for throttling/unavailability
+RETRYABLE_ERROR_NAMES = frozenset({
+    'TooManyRequests',
+    'TemporarilyUnavailable',
+    'ResourceExhausted',
+})
+
+# Structured error codes (error.error_code) for the same conditions
+RETRYABLE_ERROR_CODES = frozenset({
+    'TEMPORARILY_UNAVAILABLE',
+    'REQUEST_LIMIT_EXCEEDED',
+    'RESOURCE_EXHAUSTED',
+    'TOO_MANY_REQUESTS',
+})
+
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check if an error is a transient rate-limit/unavailability error
+    
+    Only the exception type and structured status/error codes are considered, never the
+    message text.
+    """
+    if type(error).__name__ in RETRYABLE_ERROR_NAMES:
+        return True
+
+    status = getattr(error, 'status_code', None) or getattr(error, 'status', None)
+    if status in RETRYABLE_STATUS_CODES:
+        return True
+
+    return getattr(error, 'error_code', None) in RETRYABLE_ERROR_CODES
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Get the server-requested delay (Retry-After) from an error, if any
+    
+    Negative, infinite and NaN values are ignored.
+    """
+    for attr in ('retry_after_secs', 'retry_after'):
+        value = getattr(error, attr, None)
+        if value is not None:
+            try:
+                delay = float(value)
+            except (TypeError, ValueError):
+                return None
+            return delay if math.isfinite(delay) and delay >= 0 else None
+    return None
+
+
+def compute_backoff_delay(error: BaseException,
+                          attempt: int,
+                          base_delay: float,
+                          max_delay: float) -> float:
+    """Delay before the next attempt: Retry-After if given, else exponential + jitter; both capped at max_delay"""
+    retry_after = get_retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    delay = min(base_delay * (2 ** attempt), max_delay)
+    return delay + random.uniform(0, delay * 0.5)
+
+
+async def retry_async(func: Callable[..., Any],
+                      *args,
+                      max_attempts: int = 5,
+                      base_delay: float = 1.0,
+                      max_delay: float = 60.0,
+                      retryable: Callable[[BaseException], bool] = is_retryable_error,
+                      **kwargs) -> Any:
+    """Await func(*args, **kwargs), retrying transient errors with exponential backoff"""
+    for attempt in range(max_attempts):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_attempts - 1 or not retryable(e):
+                raise
+            delay = compute_backoff_delay(e, attempt, base_delay, max_delay)
+            logger.warning("⏳ %s throttled (%s), retrying in %.1fs (attempt %d/%d)",
+                           getattr(func, '__qualname__', func), e, delay, attempt + 1, max_attempts)
+            await asyncio.sleep(delay)
+
+
+def retry_sync(func: Callable[..., Any],
+               *args,
+               max_attempts: int = 5,
+               base_delay: float = 1.0,
+               max_delay: float = 60.0,
+               retryable: Callable[[BaseException], bool] = is_retryable_error,
+               **kwargs) -> Any:
+    """Call func(*args, **kwargs), retrying transient errors with exponential backoff"""
+    for attempt in range(max_attempts):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_attempts - 1 or not retryable(e):
+                raise
+            delay = compute_backoff_delay(e, attempt, base_delay, max_delay)
+            logger.warning("⏳ %s throttled (%s), retrying in %.1fs (attempt %d/%d)",
+                           getattr(func, '__qualname__', func), e, delay, attempt + 1, max_attempts)
+            time.sleep(delay)
+
+
+def retry_with_backoff(max_attempts: int = 5,
+                       base_delay: float = 1.0,
+                       max_delay: float = 60.0,
+                       retryable: Callable[[BaseException], bool] = is_retryable_error):
+    """Decorator retrying sync or async callables on transient errors"""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await retry_async(func, *args,
+                                         max_attempts=max_attempts,
+                                         base_delay=base_delay,
+                                         max_delay=max_delay,
+                                         retryable=retryable,
+                                         **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            return retry_sync(func, *args,
+                              max_attempts=max_attempts,
+                              base_delay=base_delay,
+                              max_delay=max_delay,
+                              retryable=retryable,
+                              **kwargs)
+        return sync_wrapper
+
+    return decorator
@@ -4,6 +4,8 @@ Manages schema operations and data storage in the _executor_metadata schema
 """
 
 import asyncio
+import json
+import re
 import uuid
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
@@ -13,6 +15,9 @@ from executor.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Connection detail keys whose values are masked before storage
+_SENSITIVE_KEY_RE = re.compile(r'password|key|token|secret', re.IGNORECASE)
+
 
 class SchemaManager:
     """Manages data storage operations in the executor metadata schema"""
@@ -35,20 +40,8 @@ class SchemaManager:
         }
         
         try:
-            # Generate source ID
-            source_id = str(uuid.uuid4())
-            
-            # Prepare source data
-            source_record = {
-                'source_id': source_id,
-                'source_name': source_data.get('source_name', 'unknown'),
-                'source_type': source_data.get('source_type', 'unknown'),
-                'connection_details': self._mask_connection_details(
-                    source_data.get('connection_details', {})
-                ),
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
-            }
+            source_record = self._source_record(source_data)
+            source_id = source_record['source_id']
             
             # Store in database
             success = await self._insert_record('sources', source_record)
@@ -73,7 +66,7 @@ class SchemaManager:
                                  source_id: str,
                                  job_config: JobConfig) -> Dict[str, Any]:
         """Store table metadata in the tables table"""
-        logger.info(f"💾 Storing table metadata: {table_data.get('table_name', 'unknown')}")
+        logger.debug("💾 Storing table metadata: %s", table_data.get('table_name', 'unknown'))
         
         result = {
             'operation': 'store_table_metadata',
@@ -83,18 +76,8 @@ class SchemaManager:
         }
         
         try:
-            # Generate table ID
-            table_id = str(uuid.uuid4())
-            
-            # Prepare table data
-            table_record = {
-                'table_id': table_id,
-                'source_id': source_id,
-                'table_name': table_data.get('table_name', 'unknown'),
-                'schema_name': table_data.get('schema_name', 'unknown'),
-                'row_count': table_data.get('row_count', 0),
-                'last_refreshed': datetime.now(timezone.utc).isoformat()
-            }
+            table_record = self._table_record(table_data, source_id)
+            table_id = table_record['table_id']
             
             # Store in database
             success = await self._insert_record('tables', table_record)
@@ -102,7 +85,7 @@ class SchemaManager:
             if success:
                 result['success'] = True
                 result['table_id'] = table_id
-                logger.info(f"✅ Table metadata stored: {table_id}")
+                logger.debug("✅ Table metadata stored: %s", table_id)
             else:
                 result['error'] = 'Failed to insert table record'
                 logger.error(f"❌ Failed to store table metadata: {table_data.get('table_name')}")
@@ -114,12 +97,30 @@ class SchemaManager:
             logger.error(f"❌ Error storing table metadata: {e}")
             return result
     
+    async def store_tables_metadata(self,
+                                    tables: List[Dict[str, Any]],
+                                    source_id: str,
+                                    job_config: JobConfig) -> List[Dict[str, Any]]:
+        """Store several tables of a source concurrently, each with its 'columns' in one batch
+        
+        Returns the store_table_metadata result per table; a table's column result is under 'columns'.
+        """
+        async def store_table(table_data: Dict[str, Any]) -> Dict[str, Any]:
+            table_result = await self.store_table_metadata(table_data, source_id, job_config)
+            if table_result['success'] and table_data.get('columns'):
+                table_result['columns'] = await self.store_column_metadata_bulk(
+                    table_data['columns'], table_result['table_id'], job_config
+                )
+            return table_result
+        
+        return list(await asyncio.gather(*(store_table(table_data) for table_data in tables)))
+    
     async def store_column_metadata(self, 
                                   column_data: Dict[str, Any],
                                   table_id: str,
                                   job_config: JobConfig) -> Dict[str, Any]:
         """Store column metadata in the columns table"""
-        logger.info(f"💾 Storing column metadata: {column_data.get('column_name', 'unknown')}")
+        logger.debug("💾 Storing column metadata: %s", column_data.get('column_name', 'unknown'))
         
         result = {
             'operation': 'store_column_metadata',
@@ -129,20 +130,8 @@ class SchemaManager:
         }
         
         try:
-            # Generate column ID
-            column_id = str(uuid.uuid4())
-            
-            # Prepare column data
-            column_record = {
-                'column_id': column_id,
-                'table_id': table_id,
-                'column_name': column_data.get('column_name', 'unknown'),
-                'data_type': column_data.get('data_type', 'unknown'),
-                'is_nullable': column_data.get('is_nullable', True),
-                'is_primary_key': column_data.get('is_primary_key', False),
-                'sample_value': str(column_data.get('sample_value', ''))[:1000],  # Limit length
-                'distinct_count': column_data.get('distinct_count', 0)
-            }
+            column_record = self._column_record(column_data, table_id)
+            column_id = column_record['column_id']
             
             # Store in database
             success = await self._insert_record('columns', column_record)
@@ -150,7 +139,7 @@ class SchemaManager:
             if success:
                 result['success'] = True
                 result['column_id'] = column_id
-                logger.info(f"✅ Column metadata stored: {column_id}")
+                logger.debug("✅ Column metadata stored: %s", column_id)
             else:
                 result['error'] = 'Failed to insert column record'
                 logger.error(f"❌ Failed to store column metadata: {column_data.get('column_name')}")
@@ -162,6 +151,80 @@ class SchemaManager:
             logger.error(f"❌ Error storing column metadata: {e}")
             return result
     
+    async def store_column_metadata_bulk(self,
+                                       columns: List[Dict[str, Any]],
+                                       table_id: str,
+                                       job_config: JobConfig) -> Dict[str, Any]:
+        """Store all columns of a table in the columns table with one batched insert"""
+        logger.debug("💾 Storing metadata for %d columns of table: %s", len(columns), table_id)
+        
+        result = {
+            'operation': 'store_column_metadata_bulk',
+            'success': False,
+            'column_ids': [],
+            'error': None
+        }
+        
+        try:
+            column_records = [self._column_record(column_data, table_id) for column_data in columns]
+            
+            # Store in database
+            success = await self._insert_records('columns', column_records)
+            
+            if success:
+                result['success'] = True
+                result['column_ids'] = [record['column_id'] for record in column_records]
+                logger.info("✅ Column metadata stored: %d columns of table %s", len(column_records), table_id)
+            else:
+                result['error'] = 'Failed to insert column records'
+                logger.error(f"❌ Failed to store column metadata for table: {table_id}")
+            
+            return result
+            
+        except Exception as e:
+            result['error'] = str(e)
+            logger.error(f"❌ Error storing column metadata: {e}")
+            return result
+    
+    def _source_record(self, source_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a sources table record (with a new source ID) from source metadata"""
+        # created_at and updated_at share one timestamp
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            'source_id': str(uuid.uuid4()),
+            'source_name': source_data.get('source_name', 'unknown'),
+            'source_type': source_data.get('source_type', 'unknown'),
+            'connection_details': self._mask_connection_details(
+                source_data.get('connection_details', {})
+            ),
+            'created_at': now,
+            'updated_at': now
+        }
+    
+    def _table_record(self, table_data: Dict[str, Any], source_id: str) -> Dict[str, Any]:
+        """Build a tables table record (with a new table ID) from table metadata"""
+        return {
+            'table_id': str(uuid.uuid4()),
+            'source_id': source_id,
+            'table_name': table_data.get('table_name', 'unknown'),
+            'schema_name': table_data.get('schema_name', 'unknown'),
+            'row_count': table_data.get('row_count', 0),
+            'last_refreshed': datetime.now(timezone.utc).isoformat()
+        }
+    
+    def _column_record(self, column_data: Dict[str, Any], table_id: str) -> Dict[str, Any]:
+        """Build a columns table record (with a new column ID) from column metadata"""
+        return {
+            'column_id': str(uuid.uuid4()),
+            'table_id': table_id,
+            'column_name': column_data.get('column_name', 'unknown'),
+            'data_type': column_data.get('data_type', 'unknown'),
+            'is_nullable': column_data.get('is_nullable', True),
+            'is_primary_key': column_data.get('is_primary_key', False),
+            'sample_value': str(column_data.get('sample_value', ''))[:1000],  # Limit length
+            'distinct_count': column_data.get('distinct_count', 0)
+        }
+    
     async def store_executor_run(self, 
                                run_data: Dict[str, Any],
                                job_config: JobConfig) -> Dict[str, Any]:
@@ -176,20 +239,8 @@ class SchemaManager:
         }
         
         try:
-            # Use job_id as run_id
-            run_id = job_config.job_id
-            
-            # Prepare run data
-            run_record = {
-                'run_id': run_id,
-                'executor_version': '1.0.0',
-                'source_id': run_data.get('source_id', ''),
-                'run_mode': job_config.job_type.value,
-                'status': run_data.get('status', 'running'),
-                'error_message': run_data.get('error_message', ''),
-                'started_at': run_data.get('started_at', datetime.now(timezone.utc).isoformat()),
-                'finished_at': run_data.get('finished_at', '')
-            }
+            run_record = self._run_record(run_data, job_config)
+            run_id = run_record['run_id']
             
             # Store in database
             success = await self._insert_record('executor_runs', run_record)
@@ -209,12 +260,25 @@ class SchemaManager:
             logger.error(f"❌ Error storing executor run: {e}")
             return result
     
+    def _run_record(self, run_data: Dict[str, Any], job_config: JobConfig) -> Dict[str, Any]:
+        """Build an executor_runs table record for a job run"""
+        return {
+            'run_id': job_config.job_id,  # Use job_id as run_id
+            'executor_version': '1.0.0',
+            'source_id': run_data.get('source_id', ''),
+            'run_mode': job_config.job_type.value,
+            'status': run_data.get('status', 'running'),
+            'error_message': run_data.get('error_message', ''),
+            'started_at': run_data.get('started_at') or datetime.now(timezone.utc).isoformat(),
+            'finished_at': run_data.get('finished_at', '')
+        }
+    
     async def store_log_entry(self, 
                             log_data: Dict[str, Any],
                             run_id: str,
                             job_config: JobConfig) -> Dict[str, Any]:
         """Store log entry in the logs table"""
-        logger.info(f"💾 Storing log entry for run: {run_id}")
+        logger.debug("💾 Storing log entry for run: %s", run_id)
         
         result = {
             'operation': 'store_log_entry',
@@ -224,17 +288,8 @@ class SchemaManager:
         }
         
         try:
-            # Generate log ID
-            log_id = str(uuid.uuid4())
-            
-            # Prepare log data
-            log_record = {
-                'log_id': log_id,
-                'run_id': run_id,
-                'log_level': log_data.get('log_level', 'INFO'),
-                'log_message': str(log_data.get('log_message', ''))[:4000],  # Limit length
-                'log_timestamp': datetime.now(timezone.utc).isoformat()
-            }
+            log_record = self._log_record(log_data, run_id)
+            log_id = log_record['log_id']
             
             # Store in database
             success = await self._insert_record('logs', log_record)
@@ -242,7 +297,7 @@ class SchemaManager:
             if success:
                 result['success'] = True
                 result['log_id'] = log_id
-                logger.debug(f"✅ Log entry stored: {log_id}")
+                logger.debug("✅ Log entry stored: %s", log_id)
             else:
                 result['error'] = 'Failed to insert log record'
                 logger.error(f"❌ Failed to store log entry: {run_id}")
@@ -254,6 +309,56 @@ class SchemaManager:
             logger.error(f"❌ Error storing log entry: {e}")
             return result
     
+    async def store_log_entries(self,
+                                log_entries: List[Dict[str, Any]],
+                                run_id: str,
+                                job_config: JobConfig) -> Dict[str, Any]:
+        """Store several log entries for a run in the logs table with one batched insert"""
+        logger.debug("💾 Storing %d log entries for run: %s", len(log_entries), run_id)
+        
+        result = {
+            'operation': 'store_log_entries',
+            'success': False,
+            'log_ids': [],
+            'error': None
+        }
+        
+        try:
+            # One timestamp for the whole batch
+            log_timestamp = datetime.now(timezone.utc).isoformat()
+            log_records = [self._log_record(log_data, run_id, log_timestamp) for log_data in log_entries]
+            
+            # Store in database
+            success = await self._insert_records('logs', log_records)
+            
+            if success:
+                result['success'] = True
+                result['log_ids'] = [record['log_id'] for record in log_records]
+                logger.debug("✅ Log entries stored: %d", len(log_records))
+            else:
+                result['error'] = 'Failed to insert log records'
+                logger.error(f"❌ Failed to store log entries: {run_id}")
+            
+            return result
+            
+        except Exception as e:
+            result['error'] = str(e)
+            logger.error(f"❌ Error storing log entries: {e}")
+            return result
+    
+    def _log_record(self,
+                    log_data: Dict[str, Any],
+                    run_id: str,
+                    log_timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Build a logs table record (with a new log ID) from a log entry"""
+        return {
+            'log_id': str(uuid.uuid4()),
+            'run_id': run_id,
+            'log_level': log_data.get('log_level', 'INFO'),
+            'log_message': str(log_data.get('log_message', ''))[:4000],  # Limit length
+            'log_timestamp': log_timestamp or datetime.now(timezone.utc).isoformat()
+        }
+    
     async def get_source_metadata(self, source_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve source metadata by ID"""
         try:
@@ -355,15 +460,21 @@ class SchemaManager:
     
     async def _insert_record(self, table_name: str, record: Dict[str, Any]) -> bool:
         """Insert a record into the specified table"""
+        return await self._insert_records(table_name, [record])
+    
+    async def _insert_records(self, table_name: str, records: List[Dict[str, Any]]) -> bool:
+        """Insert records into the specified table with one batched statement"""
+        if not records:
+            return True
+        
         try:
-            # In a real implementation, this would execute the INSERT statement
-            # INSERT INTO {self.schema_name}.{table_name} (...) VALUES (...)
-            
-            logger.debug(f"💾 Inserting record into {table_name}: {list(record.keys())}")
+            # In a real implementation, this would execute one multi-row INSERT statement
+            # INSERT INTO {self.schema_name}.{table_name} (...) VALUES (...), (...)
+            logger.debug("💾 Inserting %d records into %s", len(records), table_name)
             return True  # Placeholder - assume success
             
         except Exception as e:
-            logger.error(f"❌ Error inserting record into {table_name}: {e}")
+            logger.error(f"❌ Error inserting records into {table_name}: {e}")
             return False
     
     def _mask_connection_details(self, connection_details: Dict[str, Any]) -> str:
@@ -372,15 +483,13 @@ class SchemaManager:
             return ""
         
         # Create a copy and mask sensitive fields
-        masked_details = {}
-        for key, value in connection_details.items():
-            if any(sensitive in key.lower() for sensitive in ['password', 'key', 'token', 'secret']):
-                masked_details[key] = '***MASKED***'
-            else:
-                masked_details[key] = str(value)
+        masked_details = {
+            key: '***MASKED***' if _SENSITIVE_KEY_RE.search(key) else str(value)
+            for key, value in connection_details.items()
+        }
         
-        # Convert to string representation
-        return str(masked_details)
+        # Serialize as compact JSON
+        return json.dumps(masked_details, separators=(',', ':'))
     
     def get_schema_statistics(self) -> Dict[str, Any]:
         """Get statistics about the schema data"""
@@ -4,7 +4,11 @@ Validates and manages the _executor_metadata schema structure
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import copy
+import os
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime, timezone
 
 from executor.config import JobConfig, ConfigManager
@@ -13,94 +17,178 @@ from executor.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _freeze(value):
+    """Read-only view of a nested dict definition (lists become tuples)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+# Required structure of the executor metadata schema, frozen at import
+REQUIRED_TABLES: Mapping[str, Mapping[str, Any]] = _freeze({
+    'sources': {
+        'columns': {
+            'source_id': 'STRING',
+            'source_name': 'STRING', 
+            'source_type': 'STRING',
+            'connection_details': 'STRING',
+            'created_at': 'TIMESTAMP',
+            'updated_at': 'TIMESTAMP'
+        },
+        'primary_key': ['source_id'],
+        'description': 'Data source registry'
+    },
+    'tables': {
+        'columns': {
+            'table_id': 'STRING',
+            'source_id': 'STRING',
+            'table_name': 'STRING',
+            'schema_name': 'STRING',
+            'row_count': 'BIGINT',
+            'last_refreshed': 'TIMESTAMP'
+        },
+        'primary_key': ['table_id'],
+        'foreign_keys': {
+            'source_id': 'sources(source_id)'
+        },
+        'description': 'Table metadata per source'
+    },
+    'columns': {
+        'columns': {
+            'column_id': 'STRING',
+            'table_id': 'STRING',
+            'column_name': 'STRING',
+            'data_type': 'STRING',
+            'is_nullable': 'BOOLEAN',
+            'is_primary_key': 'BOOLEAN',
+            'sample_value': 'STRING',
+            'distinct_count': 'BIGINT'
+        },
+        'primary_key': ['column_id'],
+        'foreign_keys': {
+            'table_id': 'tables(table_id)'
+        },
+        'description': 'Column metadata per table'
+    },
+    'executor_runs': {
+        'columns': {
+            'run_id': 'STRING',
+            'executor_version': 'STRING',
+            'source_id': 'STRING',
+            'run_mode': 'STRING',
+            'status': 'STRING',
+            'error_message': 'STRING',
+            'started_at': 'TIMESTAMP',
+            'finished_at': 'TIMESTAMP'
+        },
+        'primary_key': ['run_id'],
+        'foreign_keys': {
+            'source_id': 'sources(source_id)'
+        },
+        'description': 'Execution audit trail'
+    },
+    'logs': {
+        'columns': {
+            'log_id': 'STRING',
+            'run_id': 'STRING',
+            'log_level': 'STRING',
+            'log_message': 'STRING',
+            'log_timestamp': 'TIMESTAMP'
+        },
+        'primary_key': ['log_id'],
+        'foreign_keys': {
+            'run_id': 'executor_runs(run_id)'
+        },
+        'description': 'Detailed execution logs'
+    }
+})
+
+
+# Type names information_schema reports for the declared types, where they differ
+_TYPE_ALIASES: Mapping[str, str] = MappingProxyType({'LONG': 'BIGINT'})
+
+
+def _normalize_type(type_name: Any) -> str:
+    """Upper-case type name with information_schema aliases mapped to the declared spelling"""
+    type_name = str(type_name).strip().upper()
+    return _TYPE_ALIASES.get(type_name, type_name)
+
+
+def _create_table_template(table_name: str, table_def: Mapping[str, Any]) -> str:
+    """CREATE TABLE statement for a table definition, with a {schema} placeholder"""
+    columns = []
+    
+    # Add columns
+    for col_name, col_type in table_def['columns'].items():
+        columns.append(f"    {col_name} {col_type}")
+    
+    # Add primary key constraint
+    if 'primary_key' in table_def:
+        pk_cols = ', '.join(table_def['primary_key'])
+        columns.append(f"    CONSTRAINT pk_{table_name} PRIMARY KEY ({pk_cols})")
+    
+    # Add foreign key constraints
+    if 'foreign_keys' in table_def:
+        for fk_col, fk_ref in table_def['foreign_keys'].items():
+            columns.append(f"    CONSTRAINT fk_{table_name}_{fk_col} FOREIGN KEY ({fk_col}) REFERENCES {fk_ref}")
+    
+    # Generate full SQL
+    columns_sql = ',\n'.join(columns)
+    return f"""CREATE TABLE IF NOT EXISTS {{schema}}.{table_name} (
+{columns_sql}
+)"""
+
+
+# CREATE TABLE statements for the required tables, rendered once at import
+CREATE_TABLE_TEMPLATES: Mapping[str, str] = MappingProxyType({
+    table_name: _create_table_template(table_name, table_def)
+    for table_name, table_def in REQUIRED_TABLES.items()
+})
+
+
 class SchemaValidator:
     """Validates and manages schema structure for executor metadata"""
     
+    # schema_name -> (monotonic fetch time, structure from _fetch_full_schema), shared by instances
+    _schema_cache: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+    
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.schema_name = config_manager.executor_config.schema_name
+        self.schema_cache_ttl = config_manager.executor_config.schema_cache_ttl_seconds
         
-        # Define the required schema structure
-        self.required_tables = {
-            'sources': {
-                'columns': {
-                    'source_id': 'STRING',
-                    'source_name': 'STRING', 
-                    'source_type': 'STRING',
-                    'connection_details': 'STRING',
-                    'created_at': 'TIMESTAMP',
-                    'updated_at': 'TIMESTAMP'
-                },
-                'primary_key': ['source_id'],
-                'description': 'Data source registry'
-            },
-            'tables': {
-                'columns': {
-                    'table_id': 'STRING',
-                    'source_id': 'STRING',
-                    'table_name': 'STRING',
-                    'schema_name': 'STRING',
-                    'row_count': 'BIGINT',
-                    'last_refreshed': 'TIMESTAMP'
-                },
-                'primary_key': ['table_id'],
-                'foreign_keys': {
-                    'source_id': 'sources(source_id)'
-                },
-                'description': 'Table metadata per source'
-            },
-            'columns': {
-                'columns': {
-                    'column_id': 'STRING',
-                    'table_id': 'STRING',
-                    'column_name': 'STRING',
-                    'data_type': 'STRING',
-                    'is_nullable': 'BOOLEAN',
-                    'is_primary_key': 'BOOLEAN',
-                    'sample_value': 'STRING',
-                    'distinct_count': 'BIGINT'
-                },
-                'primary_key': ['column_id'],
-                'foreign_keys': {
-                    'table_id': 'tables(table_id)'
-                },
-                'description': 'Column metadata per table'
-            },
-            'executor_runs': {
-                'columns': {
-                    'run_id': 'STRING',
-                    'executor_version': 'STRING',
-                    'source_id': 'STRING',
-                    'run_mode': 'STRING',
-                    'status': 'STRING',
-                    'error_message': 'STRING',
-                    'started_at': 'TIMESTAMP',
-                    'finished_at': 'TIMESTAMP'
-                },
-                'primary_key': ['run_id'],
-                'foreign_keys': {
-                    'source_id': 'sources(source_id)'
-                },
-                'description': 'Execution audit trail'
-            },
-            'logs': {
-                'columns': {
-                    'log_id': 'STRING',
-                    'run_id': 'STRING',
-                    'log_level': 'STRING',
-                    'log_message': 'STRING',
-                    'log_timestamp': 'TIMESTAMP'
-                },
-                'primary_key': ['log_id'],
-                'foreign_keys': {
-                    'run_id': 'executor_runs(run_id)'
-                },
-                'description': 'Detailed execution logs'
-            }
+        # The required schema structure (shared, read-only)
+        self.required_tables = REQUIRED_TABLES
+        
+        # CREATE TABLE statements depend only on the fixed definitions above
+        self._create_sql = {
+            table_name: template.format(schema=self.schema_name)
+            for table_name, template in CREATE_TABLE_TEMPLATES.items()
         }
+        # The structure is fixed, so its summary is too
+        self._summary = {
+            'schema_name': self.schema_name,
+            'table_count': len(self.required_tables),
+            'tables': list(self.required_tables.keys()),
+            'total_columns': sum(len(table['columns']) for table in self.required_tables.values()),
+            'description': f"Executor metadata schema with {len(self.required_tables)} tables"
+        }
+        # Schema + all tables (in dependency order) as one multi-statement DDL submission
+        self._create_batch_sql = ";\n".join(
+            [f"CREATE SCHEMA IF NOT EXISTS {self.schema_name}", *self._create_sql.values()]
+        )
     
-    async def validate_schema(self, job_config: JobConfig) -> Dict[str, Any]:
-        """Validate that the required schema exists and has correct structure"""
+    async def validate_schema(self,
+                              job_config: JobConfig,
+                              force_refresh: bool = False,
+                              verbose: bool = False) -> Dict[str, Any]:
+        """Validate that the required schema exists and has correct structure
+        
+        The fetched structure is reused for schema_cache_ttl_seconds; force_refresh re-queries it.
+        validation_details only covers missing or invalid tables unless verbose is set.
+        """
         logger.info(f"🔍 Validating schema: {self.schema_name}")
         
         result = {
@@ -129,19 +217,23 @@ class SchemaValidator:
                 logger.error(f"❌ Schema does not exist: {self.schema_name}")
                 return result
             
-            # Validate each required table
+            # Fetch every table's columns and constraints in one query, then validate in memory
+            actual_schema = await self._get_full_schema(force_refresh)
             for table_name, table_def in self.required_tables.items():
-                table_result = await self._validate_table(table_name, table_def)
-                result['validation_details'][table_name] = table_result
+                table_result = self._validate_table(table_name, table_def, actual_schema.get(table_name))
                 
                 if table_result['exists']:
                     result['tables_found'].append(table_name)
                     if not table_result['structure_valid']:
                         result['tables_invalid'].append(table_name)
                         result['recommendations'].append(f'Fix table structure: {table_name}')
+                    elif not verbose:
+                        continue
                 else:
                     result['tables_missing'].append(table_name)
                     result['recommendations'].append(f'Create table: {table_name}')
+                
+                result['validation_details'][table_name] = table_result
             
             # Determine overall validation status
             if not result['tables_missing'] and not result['tables_invalid']:
@@ -159,6 +251,24 @@ class SchemaValidator:
             logger.error(f"❌ Schema validation failed: {e}")
             return result
     
+    async def validate_many(self,
+                            job_configs: List[JobConfig],
+                            force_refresh: bool = False,
+                            verbose: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Validate the schema for a batch of job configs, keyed by job_id
+        
+        Every config targets this validator's schema, so it is checked and fetched once;
+        each job gets its own copy of the result.
+        """
+        if not job_configs:
+            return {}
+        
+        result = await self.validate_schema(job_configs[0], force_refresh, verbose)
+        results = {job_configs[0].job_id: result}
+        for job_config in job_configs[1:]:
+            results.setdefault(job_config.job_id, copy.deepcopy(result))
+        return results
+    
     async def create_schema(self, job_config: JobConfig) -> Dict[str, Any]:
         """Create the required schema and tables"""
         logger.info(f"🏗️ Creating schema: {self.schema_name}")
@@ -180,7 +290,18 @@ class SchemaValidator:
                 logger.warning("⚠️ Not in Databricks environment - skipping schema creation")
                 return result
             
-            # Create schema if it doesn't exist
+            # Submit the schema and all table DDL at once (every statement is IF NOT EXISTS)
+            if await self._execute_ddl_batch(self._create_batch_sql):
+                for table_name in self.required_tables:
+                    result['creation_details'][table_name] = {'table_name': table_name, 'success': True, 'error': None}
+                    result['tables_created'].append(table_name)
+                logger.info(f"✅ Tables created: {', '.join(result['tables_created'])}")
+                self.invalidate_schema_cache()
+                result['creation_status'] = 'success'
+                logger.info(f"✅ Schema creation successful: {self.schema_name}")
+                return result
+            
+            # Batch failed: create schema and tables one statement at a time to isolate the failure
             schema_created = await self._create_schema_if_not_exists()
             if not schema_created:
                 result['creation_status'] = 'failed'
@@ -194,11 +315,14 @@ class SchemaValidator:
                 
                 if table_result['success']:
                     result['tables_created'].append(table_name)
-                    logger.info(f"✅ Table created: {table_name}")
+                    logger.info("✅ Table created: %s", table_name)
                 else:
                     result['tables_failed'].append(table_name)
                     result['recommendations'].append(f'Manually create table: {table_name}')
-                    logger.error(f"❌ Failed to create table: {table_name} - {table_result.get('error', 'Unknown error')}")
+                    logger.error("❌ Failed to create table: %s - %s", table_name, table_result.get('error', 'Unknown error'))
+            
+            # The structure changed (or may have); the next validation must re-query it
+            self.invalidate_schema_cache()
             
             # Determine overall creation status
             if not result['tables_failed']:
@@ -217,16 +341,15 @@ class SchemaValidator:
             return result
     
     def _is_databricks_environment(self) -> bool:
-        """Check if running in Databricks environment"""
-        return "DATABRICKS_RUNTIME_VERSION" in self.config_manager.executor_config.__dict__ or \
-               "DATABRICKS_RUNTIME_VERSION" in self.config_manager.executor_config.__dict__.get('databricks_workspace_url', '')
+        """Check if running in Databricks environment (the runtime sets DATABRICKS_RUNTIME_VERSION)"""
+        return "DATABRICKS_RUNTIME_VERSION" in os.environ
     
     async def _check_schema_exists(self) -> bool:
         """Check if the schema exists"""
         try:
             # In a real implementation, this would query the database
             # For now, we'll simulate the check
-            logger.debug(f"🔍 Checking if schema exists: {self.schema_name}")
+            logger.debug("🔍 Checking if schema exists: %s", self.schema_name)
             
             # Simulate schema existence check
             # In Databricks, this would be: SHOW SCHEMAS LIKE '{self.schema_name}'
@@ -236,10 +359,24 @@ class SchemaValidator:
             logger.error(f"❌ Error checking schema existence: {e}")
             return False
     
+    async def _execute_ddl_batch(self, ddl_sql: str) -> bool:
+        """Submit several ;-separated DDL statements in one round trip"""
+        try:
+            logger.debug("🏗️ Executing DDL batch for schema %s: %s", self.schema_name, ddl_sql)
+            
+            # In a real implementation, this would execute the batch in one submission
+            
+            # Simulate batch execution
+            return True  # Placeholder - assume execution successful
+            
+        except Exception as e:
+            logger.error(f"❌ Error executing DDL batch: {e}")
+            return False
+    
     async def _create_schema_if_not_exists(self) -> bool:
         """Create schema if it doesn't exist"""
         try:
-            logger.debug(f"🏗️ Creating schema if not exists: {self.schema_name}")
+            logger.debug("🏗️ Creating schema if not exists: %s", self.schema_name)
             
             # In a real implementation, this would execute:
             # CREATE SCHEMA IF NOT EXISTS {self.schema_name}
@@ -251,8 +388,60 @@ class SchemaValidator:
             logger.error(f"❌ Error creating schema: {e}")
             return False
     
-    async def _validate_table(self, table_name: str, table_def: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate a specific table structure"""
+    async def _get_full_schema(self, force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """_fetch_full_schema, served from the cache while it is younger than schema_cache_ttl"""
+        cached = SchemaValidator._schema_cache.get(self.schema_name)
+        if cached is not None and not force_refresh:
+            fetched_at, actual_schema = cached
+            if self.schema_cache_ttl < 0 or time.monotonic() - fetched_at < self.schema_cache_ttl:
+                return actual_schema
+        
+        actual_schema = await self._fetch_full_schema()
+        if self.schema_cache_ttl != 0 and actual_schema:
+            SchemaValidator._schema_cache[self.schema_name] = (time.monotonic(), actual_schema)
+        return actual_schema
+    
+    def invalidate_schema_cache(self):
+        """Drop the cached structure of this schema"""
+        SchemaValidator._schema_cache.pop(self.schema_name, None)
+    
+    async def _fetch_full_schema(self) -> Dict[str, Dict[str, Any]]:
+        """Get the actual structure of every table in the schema with one query
+        
+        Returns {table_name: {'columns': {name: type}, 'primary_key': [...], 'foreign_keys': {col: ref}}};
+        tables that do not exist are absent.
+        """
+        try:
+            # In a real implementation, this would run one query over information_schema:
+            # SELECT c.table_name, c.column_name, c.data_type, tc.constraint_type, kcu.constraint_name
+            # FROM information_schema.columns c
+            # LEFT JOIN information_schema.key_column_usage kcu
+            #   ON kcu.table_schema = c.table_schema AND kcu.table_name = c.table_name
+            #   AND kcu.column_name = c.column_name
+            # LEFT JOIN information_schema.table_constraints tc
+            #   ON tc.constraint_schema = kcu.constraint_schema AND tc.constraint_name = kcu.constraint_name
+            # WHERE c.table_schema = '{self.schema_name}'
+            logger.debug("🔍 Fetching table structures for schema: %s", self.schema_name)
+            
+            # Simulate schema structure (all tables exist with their declared columns and constraints)
+            return {
+                table_name: {
+                    'columns': dict(table_def['columns']),
+                    'primary_key': list(table_def.get('primary_key', [])),
+                    'foreign_keys': dict(table_def.get('foreign_keys', {}))
+                }
+                for table_name, table_def in self.required_tables.items()
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Error fetching schema structure: {e}")
+            return {}
+    
+    def _validate_table(self,
+                        table_name: str,
+                        table_def: Dict[str, Any],
+                        actual_table: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate a specific table structure against its fetched structure (None if missing)"""
         result = {
             'table_name': table_name,
             'exists': False,
@@ -266,127 +455,65 @@ class SchemaValidator:
         }
         
         try:
-            # Check if table exists
-            table_exists = await self._check_table_exists(table_name)
-            result['exists'] = table_exists
-            
-            if not table_exists:
+            result['exists'] = actual_table is not None
+            if actual_table is None:
                 return result
             
-            # Validate table structure
-            structure_result = await self._validate_table_structure(table_name, table_def)
-            result.update(structure_result)
+            # Validate table structure (fills the remaining fields of result)
+            self._validate_table_structure(table_name, table_def, actual_table, result)
             
             return result
             
         except Exception as e:
             result['error'] = str(e)
-            logger.error(f"❌ Error validating table {table_name}: {e}")
+            logger.error("❌ Error validating table %s: %s", table_name, e)
             return result
     
-    async def _check_table_exists(self, table_name: str) -> bool:
-        """Check if a table exists"""
-        try:
-            # In a real implementation, this would query:
-            # SHOW TABLES IN {self.schema_name} LIKE '{table_name}'
-            
-            # Simulate table existence check
-            return True  # Placeholder - assume table exists
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking table existence {table_name}: {e}")
-            return False
-    
-    async def _validate_table_structure(self, table_name: str, table_def: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate table structure against definition"""
-        result = {
-            'structure_valid': False,
-            'columns_found': [],
-            'columns_missing': [],
-            'columns_invalid': [],
-            'primary_key_valid': False,
-            'foreign_keys_valid': False
-        }
-        
+    def _validate_table_structure(self,
+                                  table_name: str,
+                                  table_def: Dict[str, Any],
+                                  actual_table: Dict[str, Any],
+                                  result: Dict[str, Any]) -> None:
+        """Validate table structure against definition, setting the structure fields of result"""
         try:
-            # Get actual table structure
-            actual_structure = await self._get_table_structure(table_name)
-            
-            # Validate columns
+            # Validate columns (lists keep the definition's column order)
             required_columns = table_def['columns']
-            actual_columns = {col['name']: col['type'] for col in actual_structure.get('columns', [])}
-            
-            for col_name, expected_type in required_columns.items():
-                if col_name in actual_columns:
-                    result['columns_found'].append(col_name)
-                    # In a real implementation, we'd validate data types match
-                    # For now, we'll assume they match
-                else:
-                    result['columns_missing'].append(col_name)
-            
-            # Validate primary key
-            if 'primary_key' in table_def:
-                result['primary_key_valid'] = await self._validate_primary_key(
-                    table_name, table_def['primary_key']
-                )
-            
-            # Validate foreign keys
-            if 'foreign_keys' in table_def:
-                result['foreign_keys_valid'] = await self._validate_foreign_keys(
-                    table_name, table_def['foreign_keys']
-                )
+            actual_columns = actual_table.get('columns', {})
+            
+            result['columns_found'] = [col for col in required_columns if col in actual_columns]
+            result['columns_missing'] = [col for col in required_columns if col not in actual_columns]
+            result['columns_invalid'] = [
+                col for col in result['columns_found']
+                if _normalize_type(actual_columns[col]) != required_columns[col]
+            ]
+            
+            # Validate primary key and foreign keys (a table declaring none has nothing to violate)
+            result['primary_key_valid'] = self._validate_primary_key(
+                actual_table, table_def.get('primary_key', [])
+            )
+            result['foreign_keys_valid'] = self._validate_foreign_keys(
+                actual_table, table_def.get('foreign_keys', {})
+            )
             
             # Determine overall structure validity
             result['structure_valid'] = (
                 not result['columns_missing'] and
+                not result['columns_invalid'] and
                 result['primary_key_valid'] and
                 result['foreign_keys_valid']
             )
             
-            return result
-            
         except Exception as e:
-            logger.error(f"❌ Error validating table structure {table_name}: {e}")
-            return result
+            logger.error("❌ Error validating table structure %s: %s", table_name, e)
     
-    async def _get_table_structure(self, table_name: str) -> Dict[str, Any]:
-        """Get actual table structure from database"""
-        try:
-            # In a real implementation, this would query:
-            # DESCRIBE {self.schema_name}.{table_name}
-            
-            # Simulate table structure
-            return {
-                'columns': [
-                    {'name': 'source_id', 'type': 'STRING'},
-                    {'name': 'source_name', 'type': 'STRING'},
-                    # ... other columns
-                ]
-            }
-            
-        except Exception as e:
-            logger.error(f"❌ Error getting table structure {table_name}: {e}")
-            return {'columns': []}
-    
-    async def _validate_primary_key(self, table_name: str, primary_key: List[str]) -> bool:
+    def _validate_primary_key(self, actual_table: Dict[str, Any], primary_key: List[str]) -> bool:
         """Validate primary key constraint"""
-        try:
-            # In a real implementation, this would check constraints
-            return True  # Placeholder
-            
-        except Exception as e:
-            logger.error(f"❌ Error validating primary key {table_name}: {e}")
-            return False
+        return list(actual_table.get('primary_key', [])) == list(primary_key)
     
-    async def _validate_foreign_keys(self, table_name: str, foreign_keys: Dict[str, str]) -> bool:
+    def _validate_foreign_keys(self, actual_table: Dict[str, Any], foreign_keys: Dict[str, str]) -> bool:
         """Validate foreign key constraints"""
-        try:
-            # In a real implementation, this would check constraints
-            return True  # Placeholder
-            
-        except Exception as e:
-            logger.error(f"❌ Error validating foreign keys {table_name}: {e}")
-            return False
+        actual_foreign_keys = actual_table.get('foreign_keys', {})
+        return all(actual_foreign_keys.get(column) == reference for column, reference in foreign_keys.items())
     
     async def _create_table(self, table_name: str, table_def: Dict[str, Any]) -> Dict[str, Any]:
         """Create a table with the specified structure"""
@@ -397,9 +524,9 @@ class SchemaValidator:
         }
         
         try:
-            # Generate CREATE TABLE statement
-            create_sql = self._generate_create_table_sql(table_name, table_def)
-            logger.debug(f"🏗️ Creating table {table_name} with SQL: {create_sql}")
+            # CREATE TABLE statement (prebuilt for the required tables)
+            create_sql = self._create_sql.get(table_name) or self._generate_create_table_sql(table_name, table_def)
+            logger.debug("🏗️ Creating table %s with SQL: %s", table_name, create_sql)
             
             # In a real implementation, this would execute the SQL
             # For now, we'll simulate success
@@ -409,41 +536,17 @@ class SchemaValidator:
             
         except Exception as e:
             result['error'] = str(e)
-            logger.error(f"❌ Error creating table {table_name}: {e}")
+            logger.error("❌ Error creating table %s: %s", table_name, e)
             return result
     
     def _generate_create_table_sql(self, table_name: str, table_def: Dict[str, Any]) -> str:
         """Generate CREATE TABLE SQL statement"""
-        columns = []
-        
-        # Add columns
-        for col_name, col_type in table_def['columns'].items():
-            columns.append(f"    {col_name} {col_type}")
-        
-        # Add primary key constraint
-        if 'primary_key' in table_def:
-            pk_cols = ', '.join(table_def['primary_key'])
-            columns.append(f"    CONSTRAINT pk_{table_name} PRIMARY KEY ({pk_cols})")
-        
-        # Add foreign key constraints
-        if 'foreign_keys' in table_def:
-            for fk_col, fk_ref in table_def['foreign_keys'].items():
-                columns.append(f"    CONSTRAINT fk_{table_name}_{fk_col} FOREIGN KEY ({fk_col}) REFERENCES {fk_ref}")
-        
-        # Generate full SQL
-        columns_sql = ',\n'.join(columns)
-        sql = f"""CREATE TABLE IF NOT EXISTS {self.schema_name}.{table_name} (
-{columns_sql}
-)"""
-        
-        return sql
+        template = CREATE_TABLE_TEMPLATES.get(table_name)
+        if template is None or table_def is not REQUIRED_TABLES.get(table_name):
+            template = _create_table_template(table_name, table_def)
+        return template.format(schema=self.schema_name)
     
     def get_schema_summary(self) -> Dict[str, Any]:
         """Get summary of the schema structure"""
-        return {
-            'schema_name': self.schema_name,
-            'table_count': len(self.required_tables),
-            'tables': list(self.required_tables.keys()),
-            'total_columns': sum(len(table['columns']) for table in self.required_tables.values()),
-            'description': f"Executor metadata schema with {len(self.required_tables)} tables"
-        }
+        # Copies, so callers may modify the returned dict and list
+        return dict(self._summary, tables=list(self._summary['tables']))
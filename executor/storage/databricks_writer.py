@@ -2,17 +2,91 @@
 Databricks SQL Writer for storing metadata in _executor_metadata schema
 """
 
-from typing import Dict, Any, List, Optional
+import hashlib
+import json
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 from databricks import sql
+from executor import envs
 from executor.logger import get_logger
+from executor.retry import retry_with_backoff
 
 logger = get_logger(__name__)
 
+# Databricks SQL warehouses accept ~10 concurrent statements per client
+SQL_CONCURRENT_LIMIT = 10
+
+# Bound on bind parameters per multi-row INSERT (rows per statement = this // columns)
+MAX_INSERT_PARAMS = 256
+
+SOURCE_COLUMNS = ("workflow_id", "source_id", "source_path", "source_type",
+                  "extraction_timestamp", "files_found", "total_size_bytes")
+TABLE_COLUMNS = ("workflow_id", "source_id", "table_name", "file_path", "file_type",
+                 "row_count", "column_count", "size_bytes")
+COLUMN_COLUMNS = ("workflow_id", "source_id", "table_name", "column_name", "data_type",
+                  "position", "is_nullable", "sample_values")
+INSERT_TABLES = (("sources", SOURCE_COLUMNS), ("tables", TABLE_COLUMNS), ("columns", COLUMN_COLUMNS))
+
+# Arrow types of the columns table, in COLUMN_COLUMNS order, for Parquet staged for COPY INTO
+COLUMN_ARROW_TYPES = ("string", "string", "string", "string", "string", "int32", "bool_", "string")
+
+# Column rows loaded with one COPY INTO (when a staging dir is configured) instead of INSERTs
+COPY_INTO_MIN_ROWS = 1000
+
+# How long an on-disk schema marker is trusted before the (idempotent) DDL runs again
+SCHEMA_MARKER_TTL_SECONDS = 3600
+
+# Error classes / SQLSTATEs the warehouse reports for a missing table or schema
+MISSING_OBJECT_ERROR_CLASSES = ("TABLE_OR_VIEW_NOT_FOUND", "SCHEMA_NOT_FOUND")
+MISSING_OBJECT_SQLSTATES = frozenset({"42P01", "3F000"})
+
+# Column INSERTs are spread over extra connections once a write needs this many statements
+PARALLEL_INSERT_MIN_STATEMENTS = 8
+
+# Connections used by one parallel INSERT run (well below SQL_CONCURRENT_LIMIT)
+WRITE_CONCURRENCY = 4
+
+# Runs schema DDL in the background while the job itself executes
+_ddl_executor: Optional[ThreadPoolExecutor] = None
+
+# Runs column INSERT statements on their own connections
+_write_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_ddl_executor() -> ThreadPoolExecutor:
+    global _ddl_executor
+    if _ddl_executor is None:
+        _ddl_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nuvyn-ddl")
+    return _ddl_executor
+
+
+def _is_missing_object_error(error: BaseException) -> bool:
+    """Whether a statement failed because a metadata table or the schema does not exist"""
+    sqlstate = getattr(error, 'sqlstate', None) or getattr(error, 'sql_state', None)
+    if sqlstate in MISSING_OBJECT_SQLSTATES:
+        return True
+    message = str(error)
+    return any(error_class in message for error_class in MISSING_OBJECT_ERROR_CLASSES)
+
+
+def _get_write_executor() -> ThreadPoolExecutor:
+    global _write_executor
+    if _write_executor is None:
+        _write_executor = ThreadPoolExecutor(max_workers=WRITE_CONCURRENCY - 1, thread_name_prefix="nuvyn-write")
+    return _write_executor
+
 
 class DatabricksWriter:
     """Writes metadata to Databricks SQL tables"""
     
+    # (server_hostname, schema_name) pairs whose DDL already ran in this process
+    _schema_ready: Set[Tuple[str, str]] = set()
+    
     def __init__(self, 
                  server_hostname: str,
                  http_path: str,
@@ -22,17 +96,21 @@ class DatabricksWriter:
         self.access_token = access_token
         self.connection = None
         self.schema_name = "_executor_metadata"
+        self.copy_staging_dir = envs.NUVYN_COPY_INTO_STAGING_DIR
+        self._schema_future: Optional[Future] = None
+        # (table, rows per statement) -> multi-row INSERT text; identical text for every batch
+        self._insert_sql: Dict[Tuple[str, int], str] = {}
+        # Single-row and full-batch statements cover most writes; build them up front
+        for table, columns in INSERT_TABLES:
+            self._insert_sql_for(table, columns, 1)
+            self._insert_sql_for(table, columns, max(1, MAX_INSERT_PARAMS // len(columns)))
     
     def connect(self) -> bool:
         """Connect to Databricks SQL Warehouse"""
         try:
             logger.info("🔗 Connecting to Databricks SQL Warehouse...")
             
-            self.connection = sql.connect(
-                server_hostname=self.server_hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
-            )
+            self.connection = self._open_connection()
             
             logger.info("✅ Databricks SQL connection established")
             return True
@@ -41,110 +119,112 @@ class DatabricksWriter:
             logger.error(f"❌ Failed to connect to Databricks SQL: {e}")
             return False
     
+    @retry_with_backoff()
+    def _open_connection(self):
+        """Open a SQL Warehouse connection, backing off on throttling"""
+        return sql.connect(
+            server_hostname=self.server_hostname,
+            http_path=self.http_path,
+            access_token=self.access_token
+        )
+    
+    def _cursor(self):
+        """Return a cursor, opening the connection on first use"""
+        if self.connection is None:
+            logger.info("🔗 Connecting to Databricks SQL Warehouse...")
+            self.connection = self._open_connection()
+            logger.info("✅ Databricks SQL connection established")
+        return self.connection.cursor()
+    
     def disconnect(self):
         """Close Databricks SQL connection"""
+        self._wait_for_schema()
         if self.connection:
             self.connection.close()
             self.connection = None
             logger.info("🔌 Databricks SQL connection closed")
     
-    def create_schema_and_tables(self) -> bool:
-        """Create the _executor_metadata schema and tables if they don't exist"""
+    @property
+    def _schema_key(self) -> Tuple[str, str]:
+        return (self.server_hostname, self.schema_name)
+    
+    @property
+    def _schema_marker_path(self) -> str:
+        """Marker file recording that the schema exists on this warehouse"""
+        digest = hashlib.blake2b(
+            f"{self.server_hostname}|{self.http_path}|{self.schema_name}".encode(),
+            digest_size=8
+        ).hexdigest()
+        return os.path.join(tempfile.gettempdir(), f".nuvyn_schema_ready_{digest}")
+    
+    @property
+    def schema_ready(self) -> bool:
+        """Whether the schema DDL already ran, in this process or a recent run on this host
+        
+        The on-disk marker is trusted for SCHEMA_MARKER_TTL_SECONDS, so a dropped schema
+        is recreated by a later run even if no write notices it.
+        """
+        if self._schema_key in DatabricksWriter._schema_ready:
+            return True
+        try:
+            marker_age = time.time() - os.path.getmtime(self._schema_marker_path)
+        except OSError:
+            return False
+        if marker_age < SCHEMA_MARKER_TTL_SECONDS:
+            DatabricksWriter._schema_ready.add(self._schema_key)
+            return True
+        return False
+    
+    def _mark_schema_ready(self):
+        DatabricksWriter._schema_ready.add(self._schema_key)
+        try:
+            with open(self._schema_marker_path, "w"):
+                pass
+        except OSError as e:
+            logger.debug(f"Could not write schema marker {self._schema_marker_path}: {e}")
+    
+    def _forget_schema_ready(self):
+        """Drop the in-process and on-disk record that the schema exists"""
+        DatabricksWriter._schema_ready.discard(self._schema_key)
+        try:
+            os.remove(self._schema_marker_path)
+        except OSError:
+            pass
+    
+    def _recover_missing_schema(self, error: BaseException) -> bool:
+        """Recreate the schema and tables if error says they are missing; True if that happened"""
+        if not _is_missing_object_error(error):
+            return False
+        logger.warning(f"⚠️ Metadata schema or table missing, recreating it: {error}")
+        self._forget_schema_ready()
+        return self.create_schema_and_tables(force=True)
+    
+    def start_schema_setup(self) -> Future:
+        """Run create_schema_and_tables in a background thread; writes wait for it"""
+        future = self._schema_future
+        if future is None or (future.done() and not future.result()):
+            future = self._schema_future = _get_ddl_executor().submit(self.create_schema_and_tables)
+        return future
+    
+    def _wait_for_schema(self) -> bool:
+        """Block until a background schema setup (if any) has finished"""
+        if self._schema_future is None:
+            return True
+        return self._schema_future.result()
+    
+    def create_schema_and_tables(self, force: bool = False) -> bool:
+        """Create the _executor_metadata schema and tables if they don't exist
+        
+        Skipped when an earlier run already did it (see schema_ready), unless force is set.
+        """
+        if self.schema_ready and not force:
+            logger.info(f"✅ Schema {self.schema_name} already created, skipping DDL")
+            return True
+        
         try:
             logger.info(f"🏗️ Creating schema and tables...")
-            
-            cursor = self.connection.cursor()
-            
-            # Set catalog context (use hive_metastore for compatibility)
-            logger.info("Setting catalog context to hive_metastore...")
-            cursor.execute("USE CATALOG hive_metastore")
-            
-            # Create schema in hive_metastore catalog
-            logger.info(f"Creating schema in hive_metastore catalog...")
-            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS hive_metastore.{self.schema_name}")
-            logger.info(f"✅ Schema created: hive_metastore.{self.schema_name}")
-            
-            # Switch to the schema
-            cursor.execute(f"USE SCHEMA {self.schema_name}")
-            
-            # Create sources table (id is auto-increment PK, workflow_id is primary identifier, source_id for filtering)
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.sources (
-                    id BIGINT GENERATED ALWAYS AS IDENTITY,
-                    workflow_id STRING,
-                    source_id STRING,
-                    source_path STRING,
-                    source_type STRING,
-                    extraction_timestamp TIMESTAMP,
-                    files_found INT,
-                    total_size_bytes BIGINT
-                )
-            """)
-            logger.info(f"✅ Table created: {self.schema_name}.sources")
-            
-            # Create tables table
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.tables (
-                    id BIGINT GENERATED ALWAYS AS IDENTITY,
-                    workflow_id STRING,
-                    source_id STRING,
-                    table_name STRING,
-                    file_path STRING,
-                    file_type STRING,
-                    row_count BIGINT,
-                    column_count INT,
-                    size_bytes BIGINT
-                )
-            """)
-            logger.info(f"✅ Table created: {self.schema_name}.tables")
-            
-            # Create columns table
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.columns (
-                    id BIGINT GENERATED ALWAYS AS IDENTITY,
-                    workflow_id STRING,
-                    source_id STRING,
-                    table_name STRING,
-                    column_name STRING,
-                    data_type STRING,
-                    position INT,
-                    is_nullable BOOLEAN,
-                    sample_values STRING
-                )
-            """)
-            logger.info(f"✅ Table created: {self.schema_name}.columns")
-            
-            # Create executor_runs table
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.executor_runs (
-                    id BIGINT GENERATED ALWAYS AS IDENTITY,
-                    run_id STRING,
-                    executor_version STRING,
-                    workflow_id STRING,
-                    source_id STRING,
-                    run_mode STRING,
-                    status STRING,
-                    error_message STRING,
-                    started_at TIMESTAMP,
-                    finished_at TIMESTAMP
-                )
-            """)
-            logger.info(f"✅ Table created: {self.schema_name}.executor_runs")
-            
-            # Create logs table
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.logs (
-                    id BIGINT GENERATED ALWAYS AS IDENTITY,
-                    log_id STRING,
-                    run_id STRING,
-                    log_level STRING,
-                    log_message STRING,
-                    log_timestamp TIMESTAMP
-                )
-            """)
-            logger.info(f"✅ Table created: {self.schema_name}.logs")
-            
-            cursor.close()
+            self._create_schema_and_tables()
+            self._mark_schema_ready()
             logger.info(f"✅ Schema and all tables created successfully")
             return True
             
@@ -152,6 +232,102 @@ class DatabricksWriter:
             logger.error(f"❌ Failed to create schema and tables: {e}")
             return False
     
+    @retry_with_backoff()
+    def _create_schema_and_tables(self):
+        """Run the schema DDL (all statements are idempotent, so the whole batch is retried)"""
+        cursor = self._cursor()
+        
+        # Set catalog context (use hive_metastore for compatibility)
+        logger.info("Setting catalog context to hive_metastore...")
+        cursor.execute("USE CATALOG hive_metastore")
+        
+        # Create schema in hive_metastore catalog
+        logger.info(f"Creating schema in hive_metastore catalog...")
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS hive_metastore.{self.schema_name}")
+        logger.info(f"✅ Schema created: hive_metastore.{self.schema_name}")
+        
+        # Switch to the schema
+        cursor.execute(f"USE SCHEMA {self.schema_name}")
+        
+        # Create sources table (id is auto-increment PK, workflow_id is primary identifier, source_id for filtering)
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.schema_name}.sources (
+                id BIGINT GENERATED ALWAYS AS IDENTITY,
+                workflow_id STRING,
+                source_id STRING,
+                source_path STRING,
+                source_type STRING,
+                extraction_timestamp TIMESTAMP,
+                files_found INT,
+                total_size_bytes BIGINT
+            )
+        """)
+        logger.info(f"✅ Table created: {self.schema_name}.sources")
+        
+        # Create tables table
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.schema_name}.tables (
+                id BIGINT GENERATED ALWAYS AS IDENTITY,
+                workflow_id STRING,
+                source_id STRING,
+                table_name STRING,
+                file_path STRING,
+                file_type STRING,
+                row_count BIGINT,
+                column_count INT,
+                size_bytes BIGINT
+            )
+        """)
+        logger.info(f"✅ Table created: {self.schema_name}.tables")
+        
+        # Create columns table
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.schema_name}.columns (
+                id BIGINT GENERATED ALWAYS AS IDENTITY,
+                workflow_id STRING,
+                source_id STRING,
+                table_name STRING,
+                column_name STRING,
+                data_type STRING,
+                position INT,
+                is_nullable BOOLEAN,
+                sample_values STRING
+            )
+        """)
+        logger.info(f"✅ Table created: {self.schema_name}.columns")
+        
+        # Create executor_runs table
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.schema_name}.executor_runs (
+                id BIGINT GENERATED ALWAYS AS IDENTITY,
+                run_id STRING,
+                executor_version STRING,
+                workflow_id STRING,
+                source_id STRING,
+                run_mode STRING,
+                status STRING,
+                error_message STRING,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        """)
+        logger.info(f"✅ Table created: {self.schema_name}.executor_runs")
+        
+        # Create logs table
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.schema_name}.logs (
+                id BIGINT GENERATED ALWAYS AS IDENTITY,
+                log_id STRING,
+                run_id STRING,
+                log_level STRING,
+                log_message STRING,
+                log_timestamp TIMESTAMP
+            )
+        """)
+        logger.info(f"✅ Table created: {self.schema_name}.logs")
+        
+        cursor.close()
+    
     def write_metadata(self, metadata: Dict[str, Any], workflow_id: str = None, source_id: str = None) -> bool:
         """Write extracted metadata to Databricks SQL tables
         
@@ -160,6 +336,10 @@ class DatabricksWriter:
             workflow_id: Required backend-provided workflow_id (primary identifier). Must be provided by backend.
             source_id: Optional source_id for filtering purposes.
         """
+        if not self._wait_for_schema():
+            logger.error("❌ Cannot write metadata: schema setup failed")
+            return False
+        
         try:
             logger.info("💾 Writing metadata to Databricks SQL...")
             
@@ -169,119 +349,251 @@ class DatabricksWriter:
                 logger.error(f"❌ {error_msg}")
                 raise ValueError(error_msg)
             
-            logger.info(f"Using backend-provided workflow_id: {workflow_id}")
+            logger.debug("Using backend-provided workflow_id: %s", workflow_id)
             if source_id:
-                logger.info(f"Using source_id for filtering: {source_id}")
+                logger.debug("Using source_id for filtering: %s", source_id)
             
-            # Write to sources table
-            self._write_source(workflow_id, source_id, metadata)
+            # Sources, tables and columns rows go out as multi-row INSERTs on one cursor
+            _, table_count, column_count = self._write_entries([(metadata, workflow_id, source_id)])
             
-            # Write to tables table
-            for file_info in metadata.get('files', []):
-                self._write_table(workflow_id, source_id, file_info)
-                
-                # Write to columns table
-                if 'columns' in file_info:
-                    for column in file_info['columns']:
-                        self._write_column(workflow_id, source_id, file_info['name'], column)
-            
-            # Store workflow_id and source_id in metadata for reference
-            metadata['workflow_id'] = workflow_id
-            if source_id:
-                metadata['source_id'] = source_id
-            
-            logger.info(f"✅ Metadata written successfully (workflow_id: {workflow_id}, source_id: {source_id})")
+            logger.info(f"✅ Metadata written successfully: {table_count} tables, {column_count} columns "
+                        f"(workflow_id: {workflow_id}, source_id: {source_id})")
             return True
             
         except Exception as e:
             logger.error(f"❌ Failed to write metadata: {e}")
             return False
     
-    def _write_source(self, workflow_id: str, source_id: str, metadata: Dict[str, Any]):
-        """Write to sources table"""
+    def write_metadata_bulk(self, entries: List[Tuple[Dict[str, Any], str, Optional[str]]]) -> bool:
+        """Write metadata for several sources with multi-row INSERTs instead of one statement per row
+        
+        Args:
+            entries: (metadata, workflow_id, source_id) for each source; workflow_id is required.
+        """
+        if not entries:
+            return True
+        if not self._wait_for_schema():
+            logger.error("❌ Cannot write metadata: schema setup failed")
+            return False
+        
         try:
-            cursor = self.connection.cursor()
+            logger.info(f"💾 Writing metadata for {len(entries)} sources to Databricks SQL...")
             
-            # Convert timestamp
-            extraction_timestamp = datetime.now(timezone.utc)
+            source_count, table_count, column_count = self._write_entries(entries)
             
-            cursor.execute(f"""
-                INSERT INTO hive_metastore.{self.schema_name}.sources
-                (workflow_id, source_id, source_path, source_type, extraction_timestamp, files_found, total_size_bytes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                workflow_id,
-                source_id or None,  # source_id is optional for filtering
-                metadata.get('source_path', ''),
-                metadata.get('source_type', ''),
-                extraction_timestamp,
-                metadata.get('files_found', 0),
-                metadata.get('total_size_bytes', 0)
-            ))
-            
-            cursor.close()
-            logger.info(f"✅ Source metadata written: workflow_id={workflow_id}, source_id={source_id}")
+            logger.info(f"✅ Metadata written for {source_count} sources, {table_count} tables, "
+                        f"{column_count} columns")
+            return True
             
         except Exception as e:
-            logger.error(f"❌ Failed to write source metadata: {e}")
-            raise
+            logger.error(f"❌ Failed to write metadata: {e}")
+            return False
     
-    def _write_table(self, workflow_id: str, source_id: str, file_info: Dict[str, Any]):
-        """Write to tables table"""
+    def _write_entries(self, entries: List[Tuple[Dict[str, Any], str, Optional[str]]]) -> Tuple[int, int, int]:
+        """INSERT the sources, tables and columns rows of every entry on one cursor
+        
+        Returns the number of (sources, tables, columns) rows written.
+        """
+        extraction_timestamp = datetime.now(timezone.utc)
+        source_rows, table_rows, column_rows = [], [], []
+        for metadata, workflow_id, source_id in entries:
+            # workflow_id must be provided by backend - do not auto-generate
+            if not workflow_id:
+                raise ValueError("workflow_id is required and must be provided by the backend server")
+            source_rows.append(self._source_row(workflow_id, source_id, metadata, extraction_timestamp))
+            for file_info in metadata.get('files', []):
+                table_rows.append(self._table_row(workflow_id, source_id, file_info))
+                for column in file_info.get('columns', ()):
+                    column_rows.append(self._column_row(workflow_id, source_id, file_info['name'], column))
+        
+        cursor = self._cursor()
         try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute(f"""
-                INSERT INTO hive_metastore.{self.schema_name}.tables
-                (workflow_id, source_id, table_name, file_path, file_type, row_count, column_count, size_bytes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                workflow_id,
-                source_id or None,  # source_id is optional for filtering
-                file_info.get('name', ''),
-                file_info.get('path', ''),
-                file_info.get('file_type', ''),
-                file_info.get('row_count', 0),
-                file_info.get('column_count', 0),
-                file_info.get('size_bytes', 0)
-            ))
-            
+            try:
+                self._insert_rows(cursor, "sources", SOURCE_COLUMNS, source_rows)
+            except Exception as e:
+                # Nothing is written before the sources rows, so the whole write can be retried
+                # once the schema has been recreated
+                if not self._recover_missing_schema(e):
+                    raise
+                self._insert_rows(cursor, "sources", SOURCE_COLUMNS, source_rows)
+            
+            try:
+                self._insert_rows(cursor, "tables", TABLE_COLUMNS, table_rows)
+                if not self._copy_column_rows(cursor, column_rows):
+                    column_statements = self._insert_statements("columns", COLUMN_COLUMNS, column_rows)
+                    if len(column_statements) >= PARALLEL_INSERT_MIN_STATEMENTS:
+                        self._execute_parallel(cursor, column_statements)
+                    else:
+                        for statement, params in column_statements:
+                            cursor.execute(statement, params)
+            except Exception as e:
+                # Rows were already written, so this write fails, but later ones find the tables
+                self._recover_missing_schema(e)
+                raise
+        finally:
             cursor.close()
-            logger.info(f"✅ Table metadata written: {file_info.get('name', '')}")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to write table metadata: {e}")
-            raise
+        
+        # Store workflow_id and source_id in metadata for reference
+        for metadata, workflow_id, source_id in entries:
+            metadata['workflow_id'] = workflow_id
+            if source_id:
+                metadata['source_id'] = source_id
+        
+        return len(source_rows), len(table_rows), len(column_rows)
+    
+    def _insert_rows(self, cursor, table: str, columns: Tuple[str, ...], rows: List[tuple]):
+        """INSERT rows into a metadata table, several rows per statement"""
+        for statement, params in self._insert_statements(table, columns, rows):
+            cursor.execute(statement, params)
     
-    def _write_column(self, workflow_id: str, source_id: str, table_name: str, column: Dict[str, Any]):
-        """Write to columns table"""
+    def _copy_column_rows(self, cursor, rows: List[tuple]) -> bool:
+        """Load column rows with COPY INTO from a staged Parquet file
+        
+        Only used for at least COPY_INTO_MIN_ROWS rows with copy_staging_dir set. Returns False
+        when the rows could not be staged, so the caller INSERTs them instead; errors from the
+        COPY INTO statement itself are raised.
+        """
+        if not self.copy_staging_dir or len(rows) < COPY_INTO_MIN_ROWS:
+            return False
+        
+        # /dbfs/<path> is the FUSE mount of dbfs:/<path>, which the warehouse can read
+        staging_dir = os.path.join(os.path.abspath(self.copy_staging_dir), "columns")
+        dbfs_relative = os.path.relpath(staging_dir, "/dbfs")
+        if dbfs_relative.startswith(os.pardir):
+            logger.warning(f"⚠️ COPY INTO staging dir must be under /dbfs, got {self.copy_staging_dir}")
+            return False
+        
+        file_name = f"{uuid.uuid4().hex}.parquet"
+        local_path = os.path.join(staging_dir, file_name)
         try:
-            cursor = self.connection.cursor()
-            
-            # Convert sample_values array to string (since Databricks might not support ARRAY in all modes)
-            sample_values = str(column.get('sample_values', []))
-            
-            cursor.execute(f"""
-                INSERT INTO hive_metastore.{self.schema_name}.columns
-                (workflow_id, source_id, table_name, column_name, data_type, position, is_nullable, sample_values)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                workflow_id,
-                source_id or None,  # source_id is optional for filtering
-                table_name,
-                column.get('column_name', ''),
-                column.get('data_type', ''),
-                column.get('position', 0),
-                column.get('is_nullable', True),
-                sample_values
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                
+                os.makedirs(staging_dir, exist_ok=True)
+                schema = pa.schema([(name, getattr(pa, type_name)())
+                                    for name, type_name in zip(COLUMN_COLUMNS, COLUMN_ARROW_TYPES)])
+                arrays = [list(values) for values in zip(*rows)]
+                pq.write_table(pa.Table.from_arrays(arrays, schema=schema), local_path)
+            except Exception as e:
+                # Staging failed before anything reached the warehouse, so INSERTs can take over
+                logger.warning(f"⚠️ Could not stage rows for COPY INTO, falling back to INSERT statements: {e}")
+                return False
+            
+            # Errors from here on propagate: the load may have committed before the failure
+            # surfaced, and INSERTing the rows again would duplicate them
+            dbfs_path = f"dbfs:/{dbfs_relative}/{file_name}"
+            cursor.execute(
+                f"COPY INTO hive_metastore.{self.schema_name}.columns "
+                f"FROM (SELECT {', '.join(COLUMN_COLUMNS)} FROM '{dbfs_path}') "
+                f"FILEFORMAT = PARQUET"
+            )
+            logger.info(f"✅ Loaded {len(rows)} column rows with COPY INTO")
+            return True
+        finally:
+            try:
+                os.remove(local_path)
+            except OSError:
+                pass
+    
+    def _insert_statements(self, table: str, columns: Tuple[str, ...], rows: List[tuple]) -> List[Tuple[str, list]]:
+        """Multi-row INSERT statements and their flattened parameters for rows"""
+        batch_size = max(1, MAX_INSERT_PARAMS // len(columns))
+        statements = []
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            statements.append((
+                self._insert_sql_for(table, columns, len(batch)),
+                [value for row in batch for value in row]
             ))
-            
-            cursor.close()
-            logger.debug(f"✅ Column metadata written: {column.get('column_name', '')}")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to write column metadata: {e}")
-            raise
+        return statements
+    
+    def _insert_sql_for(self, table: str, columns: Tuple[str, ...], row_count: int) -> str:
+        """INSERT text binding row_count rows of columns, built once per (table, row_count)"""
+        sql_text = self._insert_sql.get((table, row_count))
+        if sql_text is None:
+            row_placeholder = f"({', '.join('?' * len(columns))})"
+            sql_text = self._insert_sql[(table, row_count)] = (
+                f"INSERT INTO hive_metastore.{self.schema_name}.{table} ({', '.join(columns)}) "
+                f"VALUES {', '.join([row_placeholder] * row_count)}"
+            )
+        return sql_text
+    
+    def _execute_parallel(self, cursor, statements: List[Tuple[str, list]]):
+        """Run independent INSERT statements over WRITE_CONCURRENCY connections
+        
+        The first share runs on cursor; each other share gets its own connection, since a
+        connection must not be used from several threads at once.
+        """
+        shares = [statements[i::WRITE_CONCURRENCY] for i in range(WRITE_CONCURRENCY)]
+        logger.info(f"💾 Running {len(statements)} INSERT statements over {WRITE_CONCURRENCY} connections")
+        futures = [_get_write_executor().submit(self._execute_on_new_connection, share)
+                   for share in shares[1:] if share]
+        try:
+            for statement, params in shares[0]:
+                cursor.execute(statement, params)
+        finally:
+            # Surface the first failure only after every share has finished
+            errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+    
+    def _execute_on_new_connection(self, statements: List[Tuple[str, list]]):
+        """Run statements on a dedicated connection, closed afterwards"""
+        connection = self._open_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                for statement, params in statements:
+                    cursor.execute(statement, params)
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+    
+    @staticmethod
+    def _source_row(workflow_id: str, source_id: str, metadata: Dict[str, Any], extraction_timestamp) -> tuple:
+        """Parameters for one sources row, in SOURCE_COLUMNS order"""
+        return (
+            workflow_id,
+            source_id or None,  # source_id is optional for filtering
+            metadata.get('source_path', ''),
+            metadata.get('source_type', ''),
+            extraction_timestamp,
+            metadata.get('files_found', 0),
+            metadata.get('total_size_bytes', 0)
+        )
+    
+    @staticmethod
+    def _table_row(workflow_id: str, source_id: str, file_info: Dict[str, Any]) -> tuple:
+        """Parameters for one tables row, in TABLE_COLUMNS order"""
+        return (
+            workflow_id,
+            source_id or None,  # source_id is optional for filtering
+            file_info.get('name', ''),
+            file_info.get('path', ''),
+            file_info.get('file_type', ''),
+            file_info.get('row_count', 0),
+            file_info.get('column_count', 0),
+            file_info.get('size_bytes', 0)
+        )
+    
+    @staticmethod
+    def _column_row(workflow_id: str, source_id: str, table_name: str, column: Dict[str, Any]) -> tuple:
+        """Parameters for one columns row, in COLUMN_COLUMNS order"""
+        return (
+            workflow_id,
+            source_id or None,  # source_id is optional for filtering
+            table_name,
+            column.get('column_name', ''),
+            column.get('data_type', ''),
+            column.get('position', 0),
+            column.get('is_nullable', True),
+            # sample_values is stored as a JSON array string: existing tables declare it STRING,
+            # and from_json(sample_values, 'array<string>') reads it back in SQL
+            json.dumps(column.get('sample_values', []), default=str, separators=(',', ':'))
+        )
     
     def query_metadata(self, workflow_id: str = None, source_id: str = None) -> Dict[str, Any]:
         """Query metadata from Databricks SQL
@@ -291,7 +603,7 @@ class DatabricksWriter:
             source_id: Optional filter for source_id
         """
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor()
             
             if workflow_id:
                 # Query by workflow_id (primary identifier)
@@ -333,7 +645,7 @@ class DatabricksWriter:
     def get_source_statistics(self) -> Dict[str, Any]:
         """Get statistics about stored metadata"""
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor()
             
             # Count sources
             cursor.execute(f"SELECT COUNT(*) FROM hive_metastore.{self.schema_name}.sources")
@@ -362,3 +674,41 @@ class DatabricksWriter:
                 "total_tables": 0,
                 "total_columns": 0
             }
+
+
+class DBWriterPool:
+    """Bounded LIFO pool of DatabricksWriter instances reused across jobs
+    
+    Writers connect lazily on their first statement, and the most recently
+    released (still warm) writer is handed out first.
+    """
+    
+    def __init__(self, maxsize: int = SQL_CONCURRENT_LIMIT):
+        self.maxsize = maxsize
+        self._idle: Dict[Tuple[str, str, str], List[DatabricksWriter]] = {}
+    
+    async def acquire(self, server_hostname: str, http_path: str, access_token: str) -> DatabricksWriter:
+        """Return an idle writer for these credentials, or a new one"""
+        idle = self._idle.get((server_hostname, http_path, access_token))
+        if idle:
+            return idle.pop()
+        return DatabricksWriter(server_hostname, http_path, access_token)
+    
+    async def release(self, writer: Optional[DatabricksWriter]):
+        """Return a writer to the pool, closing it if the pool is full"""
+        if writer is None:
+            return
+        idle = self._idle.setdefault((writer.server_hostname, writer.http_path, writer.access_token), [])
+        if len(idle) >= self.maxsize:
+            writer.disconnect()
+        else:
+            idle.append(writer)
+    
+    async def aclose(self):
+        """Close every idle writer"""
+        for idle in self._idle.values():
+            while idle:
+                idle.pop().disconnect()
+
+
+DB_WRITER_POOL = DBWriterPool()
@@ -3,73 +3,186 @@ API Client for transmitting data to backend
 """
 
 import asyncio
+import gzip
+import json
+import math
+import time
 import aiohttp
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Union
 from executor.config import JobConfig, ConfigManager
 from executor.logger import get_logger
+from executor.retry import retry_async
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
 
 logger = get_logger(__name__)
 
+# Keep-alive connections held open to the backend
+API_CONNECTION_LIMIT = 32
+API_KEEPALIVE_SECONDS = 60
+
+# Backoff between attempts (the number of retries is ExecutorConfig.api_retry_attempts)
+API_RETRY_BASE_DELAY = 0.5
+API_RETRY_MAX_DELAY = 10.0
+RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Smallest body gzip-compressed when compression is enabled; level 1 keeps the CPU cost low
+COMPRESSION_MIN_BYTES = 1024
+COMPRESSION_LEVEL = 1
+
+
+class APIStatusError(Exception):
+    """Non-200 response from the backend"""
+    
+    def __init__(self, status: int, text: str, retry_after: Optional[float] = None):
+        super().__init__(f"API returned status {status}: {text}")
+        self.status = status
+        self.text = text
+        self.retry_after = retry_after  # read by retry.get_retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header, capped at API_RETRY_MAX_DELAY
+    
+    The HTTP-date form and non-finite or negative values are ignored.
+    """
+    try:
+        delay = float(value) if value else None
+    except ValueError:
+        return None
+    if delay is None or not math.isfinite(delay) or delay < 0:
+        return None
+    return min(delay, API_RETRY_MAX_DELAY)
+
+
+def _is_transient_api_error(error: BaseException) -> bool:
+    """Whether a failed POST is worth retrying"""
+    if isinstance(error, APIStatusError):
+        return error.status in RETRYABLE_HTTP_STATUSES
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a request body to JSON text"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _encode_body(payload: Dict[str, Any], compress: bool) -> Union[str, bytes]:
+    """JSON request body; gzip-compressed bytes when compress is set and the body is large enough"""
+    body = _json_dumps(payload)
+    if compress and len(body) >= COMPRESSION_MIN_BYTES:
+        return gzip.compress(body.encode('utf-8'), compresslevel=COMPRESSION_LEVEL)
+    return body
+
 
 class APIClient:
-    """Client for API communication"""
+    """Client for API communication
+    
+    Requests share one HTTP session (and its pooled connections); call aclose()
+    or use the client as an async context manager to release it.
+    """
     
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.api_endpoint = config_manager.executor_config.api_base_url
         self.api_key = config_manager.get_api_credentials().get('api_key', '')
+        self.timeout_seconds = config_manager.executor_config.api_timeout
+        self.max_attempts = max(1, config_manager.executor_config.api_retry_attempts + 1)
+        self.compress = config_manager.executor_config.api_compression
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> 'APIClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=API_CONNECTION_LIMIT,
+                                               keepalive_timeout=API_KEEPALIVE_SECONDS),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the HTTP session and its pooled connections"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
     
     async def transmit_data(self, job_config: JobConfig) -> Dict[str, Any]:
         """Transmit metadata to backend API"""
         logger.info(f"📤 Transmitting data to API for job: {job_config.job_id}")
         
+        if not self.api_endpoint:
+            logger.warning("⚠️ No API endpoint configured - skipping transmission")
+            return self._skipped_result()
+        
+        return await self._post("/api/metadata", lambda: self._payload(job_config))
+    
+    @staticmethod
+    def _payload(job_config: JobConfig) -> Dict[str, Any]:
+        """JSON payload describing one job"""
+        return {
+            "job_id": job_config.job_id,
+            "tenant_id": job_config.tenant_id,
+            "data_source_path": job_config.data_source_path,
+            "job_type": job_config.job_type.value,
+            "timestamp": time.time()
+        }
+    
+    @staticmethod
+    def _skipped_result() -> Dict[str, Any]:
+        return {
+            "transmission_status": "skipped",
+            "message": "No API endpoint configured"
+        }
+    
+    async def _post(self, path: str, build_payload: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """POST a JSON payload to the backend and describe the outcome as a result dict
+        
+        The body is serialized (and gzip-compressed when enabled) once per request. Timeouts,
+        dropped connections and 429/5xx responses are retried with exponential backoff
+        (honouring Retry-After) before the failure is reported.
+        """
         try:
-            if not self.api_endpoint:
-                logger.warning("⚠️ No API endpoint configured - skipping transmission")
-                return {
-                    "transmission_status": "skipped",
-                    "message": "No API endpoint configured"
-                }
-            
-            # Prepare payload
-            payload = {
-                "job_id": job_config.job_id,
-                "tenant_id": job_config.tenant_id,
-                "data_source_path": job_config.data_source_path,
-                "job_type": job_config.job_type.value,
-                "timestamp": asyncio.get_event_loop().time()
-            }
+            body = _encode_body(build_payload(), self.compress)
             
             # Send to API
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {self.api_key}" if self.api_key else ""
             }
+            if isinstance(body, bytes):
+                headers["Content-Encoding"] = "gzip"
+            
+            result_data = await retry_async(self._send, f"{self.api_endpoint}{path}", body, headers,
+                                            max_attempts=self.max_attempts,
+                                            base_delay=API_RETRY_BASE_DELAY,
+                                            max_delay=API_RETRY_MAX_DELAY,
+                                            retryable=_is_transient_api_error)
+            logger.info(f"✅ Data transmitted successfully to API")
+            return {
+                "transmission_status": "success",
+                "api_response": result_data,
+                "status_code": 200
+            }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_endpoint}/api/metadata",
-                    json=payload,
-                    headers=headers,
-                    timeout=30
-                ) as response:
-                    if response.status == 200:
-                        result_data = await response.json()
-                        logger.info(f"✅ Data transmitted successfully to API")
-                        return {
-                            "transmission_status": "success",
-                            "api_response": result_data,
-                            "status_code": response.status
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ API transmission failed: {response.status} - {error_text}")
-                        return {
-                            "transmission_status": "failed",
-                            "error": f"API returned status {response.status}: {error_text}",
-                            "status_code": response.status
-                        }
-                        
+        except APIStatusError as e:
+            logger.error(f"❌ API transmission failed: {e.status} - {e.text}")
+            return {
+                "transmission_status": "failed",
+                "error": str(e),
+                "status_code": e.status
+            }
         except asyncio.TimeoutError:
             logger.error("❌ API transmission timeout")
             return {
@@ -82,3 +195,12 @@ class APIClient:
                 "transmission_status": "error",
                 "error": str(e)
             }
+    
+    async def _send(self, url: str, body: Union[str, bytes], headers: Dict[str, str]) -> Any:
+        """POST once and return the decoded JSON response; non-200 responses raise APIStatusError"""
+        async with self._get_session().post(url, data=body, headers=headers) as response:
+            if response.status == 200:
+                return await response.json()
+            raise APIStatusError(response.status,
+                                 await response.text(),
+                                 _parse_retry_after(response.headers.get("Retry-After")))
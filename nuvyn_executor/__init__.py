@@ -3,36 +3,46 @@ Nuvyn Executor - Namespace package for backward compatibility
 This allows both 'import executor' and 'import nuvyn_executor' to work
 """
 
+import importlib
+
 __version__ = "1.0.0"
 
-# Re-export everything from executor for compatibility
-try:
-    from executor.config import ConfigManager, JobConfig, JobType, JobStatus
-    from executor.job_manager import JobManager
-    from executor.logger import get_logger, initialize_logger
-    from executor.main import create_and_execute_job, execute_job_by_id
-    
-    # Import executor module itself
-    import executor
-    
-    __all__ = [
-        "ConfigManager",
-        "JobConfig",
-        "JobType", 
-        "JobStatus",
-        "JobManager",
-        "get_logger",
-        "initialize_logger",
-        "create_and_execute_job",
-        "execute_job_by_id",
-        "executor",
-    ]
-except ImportError as e:
-    # If executor module is not available, provide helpful error
-    import sys
-    raise ImportError(
-        f"Failed to import executor module: {e}\n"
-        f"Please ensure 'nuvyn-executor-script' package is installed.\n"
-        f"Install with: pip install git+https://github.com/nuvyn-bldr/executor-script.git@main"
-    ) from e
+# Re-exported names and the executor module defining each; imported on first access
+_EXPORTS = {
+    "ConfigManager": "executor.config",
+    "JobConfig": "executor.config",
+    "JobType": "executor.config",
+    "JobStatus": "executor.config",
+    "JobManager": "executor.job_manager",
+    "get_logger": "executor.logger",
+    "initialize_logger": "executor.logger",
+    "create_and_execute_job": "executor.main",
+    "execute_job_by_id": "executor.main",
+    "executor": "executor",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        # If executor module is not available, provide helpful error
+        raise ImportError(
+            f"Failed to import executor module: {e}\n"
+            f"Please ensure 'nuvyn-executor-script' package is installed.\n"
+            f"Install with: pip install git+https://github.com/nuvyn-bldr/executor-script.git@main"
+        ) from e
+
+    value = module if name == "executor" else getattr(module, name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -19,29 +19,13 @@ def read_readme():
             return fh.read()
     return "Nuvyn Executor Script - Job-based metadata extraction for Databricks"
 
-# Read requirements
+# Read requirements (requirements.txt is the single source of install dependencies)
 def read_requirements():
     requirements_path = HERE / "requirements.txt"
-    if requirements_path.exists():
-        with open(requirements_path, "r", encoding="utf-8") as fh:
-            return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
-    # Fallback requirements if requirements.txt doesn't exist
-    return [
-        "pandas>=1.5.0",
-        "numpy>=1.21.0",
-        "aiohttp>=3.8.0",
-        "requests>=2.28.0",
-        "pydantic>=1.10.0",
-        "python-dotenv>=0.19.0",
-        "structlog>=22.1.0",
-        "rich>=12.0.0",
-        "databricks-sql-connector>=2.0.0",
-        "databricks-cli>=0.17.0",
-        "sqlalchemy>=1.4.0",
-        "azure-storage-blob>=12.14.0",
-        "boto3>=1.26.0",
-        "azure-identity>=1.12.0",
-    ]
+    if not requirements_path.exists():
+        raise FileNotFoundError(f"requirements.txt not found next to setup.py: {requirements_path}")
+    with open(requirements_path, "r", encoding="utf-8") as fh:
+        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
 setup(
     name="nuvyn-executor-script",
@@ -90,6 +74,10 @@ setup(
             "psutil>=5.9.0",
             "memory-profiler>=0.60.0",
         ],
+        "performance": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "orjson>=3.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [